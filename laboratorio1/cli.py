@@ -1,3 +1,5 @@
+import sys
+
 def calcular_desplazamiento_uniforme(v, delta_t):
     """Calcula el desplazamiento en movimiento uniforme (en metros)."""
     return v * delta_t  # desplazamiento en metros
@@ -21,6 +23,8 @@ def main():
     print("║     (Δx = ViΔt + (αΔt²)/2)       ║")
     print("║  3. Velocidad final              ║")
     print("║     (Vf = Vi + αΔt)              ║")
+    print("║  4. Procesar archivo por lotes   ║")
+    print("║     (CSV/Parquet/NumPy)          ║")
     print("╚══════════════════════════════════╝")
 
     opcion = int(input("Ingrese el número de la operación: "))
@@ -45,10 +49,28 @@ def main():
         Vf = calcular_velocidad_final(Vi, alpha, delta_t)
         print(f"Velocidad final: Vf = {Vf:.2f} m/s")
 
+    elif opcion == 4:
+        from lote import procesar_archivo
+
+        entrada = input("Archivo de entrada (columnas v, Vi, alpha, delta_t): ")
+        salida = input("Archivo de salida (.parquet, .csv o .npz): ")
+        try:
+            procesar_archivo(entrada, salida)
+        except (OSError, ValueError, ImportError) as e:
+            print(f"No se pudo procesar el archivo: {e}")
+
     else:
         print("Opción no válida.")
 
 if __name__ == "__main__":
+    # Modo no interactivo: python cli.py --lote entrada salida [tamano_bloque]
+    if len(sys.argv) >= 4 and sys.argv[1] == "--lote":
+        from lote import procesar_archivo
+
+        tamano_bloque = int(sys.argv[4]) if len(sys.argv) > 4 else 1_000_000
+        procesar_archivo(sys.argv[2], sys.argv[3], tamano_bloque)
+        sys.exit(0)
+
     while True:
         main()
         continuar = input("¿Desea realizar otra operación? (s/n): ")
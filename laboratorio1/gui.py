@@ -1,5 +1,7 @@
+from concurrent.futures import ThreadPoolExecutor
+
 import tkinter as tk
-from tkinter import messagebox
+from tkinter import messagebox, ttk
 
 def calcular_desplazamiento_uniforme(v, delta_t):
     return v * delta_t  # desplazamiento en metros
@@ -10,35 +12,80 @@ def calcular_desplazamiento_acelerado(Vi, alpha, delta_t):
 def calcular_velocidad_final(Vi, alpha, delta_t):
     return Vi + alpha * delta_t  # velocidad final en m/s
 
+# Cálculo en segundo plano: recibe valores ya leídos de los widgets
+def calcular(opcion, valores):
+    if opcion == 1:
+        resultado = calcular_desplazamiento_uniforme(valores["v"], valores["delta_t"])
+        return f"Desplazamiento: Δx = {resultado:.2f} metros"
+    elif opcion == 2:
+        resultado = calcular_desplazamiento_acelerado(valores["Vi"], valores["alpha"], valores["delta_t"])
+        return f"Desplazamiento: Δx = {resultado:.2f} metros"
+    elif opcion == 3:
+        resultado = calcular_velocidad_final(valores["Vi"], valores["alpha"], valores["delta_t"])
+        return f"Velocidad final: Vf = {resultado:.2f} m/s"
+
+# Estado de la tarea en curso
+tarea = {"future": None, "cancelada": False}
+
+def terminar_tarea():
+    tarea["future"] = None
+    barra_progreso.stop()
+    boton_calcular.config(state="normal")
+    boton_cancelar.config(state="disabled")
+
+# Revisar la tarea desde el hilo de Tk con root.after
+def revisar_tarea():
+    future = tarea["future"]
+    if future is None:
+        return
+    if not future.done():
+        root.after(50, revisar_tarea)
+        return
+    terminar_tarea()
+    if tarea["cancelada"]:
+        return
+    try:
+        messagebox.showinfo("Resultado", future.result())
+    except Exception as e:
+        messagebox.showerror("Error", str(e))
+
 def realizar_calculo():
     try:
         opcion = var_opcion.get()
         if opcion == 1:
-            v = float(entry_v.get())
-            delta_t = float(entry_delta_t.get())
-            resultado = calcular_desplazamiento_uniforme(v, delta_t)
-            messagebox.showinfo("Resultado", f"Desplazamiento: Δx = {resultado:.2f} metros")
-        elif opcion == 2:
-            Vi = float(entry_vi.get())
-            alpha = float(entry_alpha.get())
-            delta_t = float(entry_delta_t.get())
-            resultado = calcular_desplazamiento_acelerado(Vi, alpha, delta_t)
-            messagebox.showinfo("Resultado", f"Desplazamiento: Δx = {resultado:.2f} metros")
-        elif opcion == 3:
-            Vi = float(entry_vi.get())
-            alpha = float(entry_alpha.get())
-            delta_t = float(entry_delta_t.get())
-            resultado = calcular_velocidad_final(Vi, alpha, delta_t)
-            messagebox.showinfo("Resultado", f"Velocidad final: Vf = {resultado:.2f} m/s")
+            valores = {"v": float(entry_v.get()), "delta_t": float(entry_delta_t.get())}
+        elif opcion in (2, 3):
+            valores = {
+                "Vi": float(entry_vi.get()),
+                "alpha": float(entry_alpha.get()),
+                "delta_t": float(entry_delta_t.get()),
+            }
         else:
             messagebox.showwarning("Advertencia", "Seleccione una opción válida.")
+            return
     except ValueError:
         messagebox.showerror("Error", "Por favor, ingrese valores numéricos válidos.")
+        return
+
+    tarea["cancelada"] = False
+    tarea["future"] = executor.submit(calcular, opcion, valores)
+    boton_calcular.config(state="disabled")
+    boton_cancelar.config(state="normal")
+    barra_progreso.start(10)
+    root.after(50, revisar_tarea)
+
+def cancelar_calculo():
+    future = tarea["future"]
+    if future is not None:
+        # Si aún no empezó se descarta; si ya corre, se ignora su resultado
+        future.cancel()
+        tarea["cancelada"] = True
+        terminar_tarea()
 
 # Configuración de la ventana
 root = tk.Tk()
 root.title("Calculadora de Cinemática")
-root.geometry("400x400")
+root.geometry("400x480")
 root.configure(bg="#f0f0f0")
 
 # Título
@@ -79,7 +126,18 @@ boton_calcular = tk.Button(root, text="Calcular", command=realizar_calculo, bg="
                            fg="white",
                            # border radius
                             bd=2)
-boton_calcular.pack(pady=20)
+boton_calcular.pack(pady=10)
+
+boton_cancelar = tk.Button(root, text="Cancelar", command=cancelar_calculo, state="disabled")
+boton_cancelar.pack()
+
+# Progreso mientras el cálculo corre en segundo plano
+barra_progreso = ttk.Progressbar(root, mode="indeterminate", length=200)
+barra_progreso.pack(pady=10)
+
+# Un solo hilo de trabajo: los cálculos no bloquean la ventana
+executor = ThreadPoolExecutor(max_workers=1)
 
 # Ejecutar la aplicación
 root.mainloop()
+executor.shutdown(wait=False, cancel_futures=True)
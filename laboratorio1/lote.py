@@ -0,0 +1,116 @@
+import os
+import time
+
+import numpy as np
+
+from cli import calcular_desplazamiento_acelerado, calcular_desplazamiento_uniforme, calcular_velocidad_final
+
+# Columnas de entrada reconocidas
+COLUMNAS = ("v", "Vi", "alpha", "delta_t")
+
+
+def leer_bloques(ruta, tamano_bloque=1_000_000):
+    """
+    Lee las columnas v, Vi, alpha y delta_t de un archivo por bloques.
+
+    Formatos: .csv (pandas), .parquet (pyarrow), .npy (arreglo estructurado,
+    leido como memoria mapeada) y .npz (un arreglo por columna).
+
+    Yields:
+        dict: Columna -> numpy.ndarray con como mucho tamano_bloque filas.
+    """
+    extension = os.path.splitext(ruta)[1].lower()
+    if extension == ".csv":
+        import pandas as pd
+
+        with open(ruta) as archivo:
+            encabezado = archivo.readline().strip().split(",")
+        columnas = [c for c in COLUMNAS if c in encabezado]
+        for bloque in pd.read_csv(ruta, usecols=columnas, chunksize=tamano_bloque):
+            yield {c: bloque[c].to_numpy(dtype=float) for c in columnas}
+    elif extension == ".parquet":
+        import pyarrow.parquet as pq
+
+        archivo = pq.ParquetFile(ruta)
+        columnas = [c for c in COLUMNAS if c in archivo.schema_arrow.names]
+        for lote in archivo.iter_batches(batch_size=tamano_bloque, columns=columnas):
+            yield {c: lote.column(c).to_numpy().astype(float) for c in columnas}
+    elif extension in (".npy", ".npz"):
+        if extension == ".npy":
+            datos = np.load(ruta, mmap_mode="r")
+            columnas = [c for c in COLUMNAS if c in (datos.dtype.names or ())]
+        else:
+            datos = np.load(ruta)
+            columnas = [c for c in COLUMNAS if c in datos.files]
+        arreglos = {c: datos[c] for c in columnas}
+        total = len(next(iter(arreglos.values()))) if arreglos else 0
+        for inicio in range(0, total, tamano_bloque):
+            yield {c: np.asarray(a[inicio:inicio + tamano_bloque], dtype=float) for c, a in arreglos.items()}
+    else:
+        raise ValueError(f"Formato no soportado: {extension}")
+
+
+def calcular_bloque(columnas):
+    """
+    Aplica las tres fórmulas de cinemática a un bloque con broadcasting.
+
+    Solo se calculan las fórmulas cuyas columnas están presentes.
+    """
+    resultado = dict(columnas)
+    if "v" in columnas and "delta_t" in columnas:
+        resultado["desplazamiento_uniforme"] = calcular_desplazamiento_uniforme(columnas["v"], columnas["delta_t"])
+    if all(c in columnas for c in ("Vi", "alpha", "delta_t")):
+        resultado["desplazamiento_acelerado"] = calcular_desplazamiento_acelerado(
+            columnas["Vi"], columnas["alpha"], columnas["delta_t"]
+        )
+        resultado["velocidad_final"] = calcular_velocidad_final(columnas["Vi"], columnas["alpha"], columnas["delta_t"])
+    return resultado
+
+
+def procesar_archivo(entrada, salida, tamano_bloque=1_000_000):
+    """
+    Procesa un archivo completo por bloques y escribe los resultados.
+
+    La salida puede ser .parquet o .csv (escritos bloque a bloque) o .npz.
+
+    Returns:
+        dict: Filas procesadas, tiempo total (s) y filas por segundo.
+    """
+    extension = os.path.splitext(salida)[1].lower()
+    if extension not in (".parquet", ".csv", ".npz"):
+        raise ValueError(f"Formato de salida no soportado: {extension}")
+
+    inicio = time.perf_counter()
+    filas = 0
+    escritor = None
+    acumulado = {}
+    try:
+        for columnas in leer_bloques(entrada, tamano_bloque):
+            resultado = calcular_bloque(columnas)
+            n = len(next(iter(resultado.values()))) if resultado else 0
+            if extension == ".parquet":
+                import pyarrow as pa
+                import pyarrow.parquet as pq
+
+                tabla = pa.table(resultado)
+                if escritor is None:
+                    escritor = pq.ParquetWriter(salida, tabla.schema)
+                escritor.write_table(tabla)
+            elif extension == ".csv":
+                import pandas as pd
+
+                pd.DataFrame(resultado).to_csv(salida, mode="w" if filas == 0 else "a", header=filas == 0, index=False)
+            else:
+                for nombre, valores in resultado.items():
+                    acumulado.setdefault(nombre, []).append(valores)
+            filas += n
+    finally:
+        if escritor is not None:
+            escritor.close()
+    if extension == ".npz":
+        np.savez(salida, **{nombre: np.concatenate(partes) for nombre, partes in acumulado.items()})
+
+    tiempo = time.perf_counter() - inicio
+    velocidad = filas / tiempo if tiempo > 0 else float("inf")
+    print(f"Filas procesadas: {filas} en {tiempo:.2f} s ({velocidad:,.0f} filas/s) -> {salida}")
+    return {"filas": filas, "tiempo": tiempo, "filas_por_segundo": velocidad}
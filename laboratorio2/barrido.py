@@ -0,0 +1,148 @@
+import collections
+import itertools
+import math
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from ejercicio1 import G, M, t_orbital
+
+
+def velocidades(r, masa_estrella=M, periodo=t_orbital):
+    """
+    Evalua los dos modelos de velocidad de ejercicio1.py sobre arreglos.
+
+    Args:
+        r (array_like): Distancia a la estrella en metros.
+        masa_estrella (float o array_like): Masa de la estrella en kg.
+        periodo (float o array_like): Tiempo de una orbita en segundos.
+    Returns:
+        tuple: Velocidad orbital por gravitacion y velocidad MRU (m/s).
+    """
+    r = np.asarray(r, dtype=float)
+    v_orbital = np.sqrt(G * np.asarray(masa_estrella, dtype=float) / r)
+    v_mru = 2 * math.pi * r / np.asarray(periodo, dtype=float)
+    return v_orbital, v_mru
+
+
+def leer_catalogo(ruta, tamano_bloque=100_000):
+    """
+    Lee un catalogo CSV o Parquet por bloques, sin cargarlo completo.
+
+    Yields:
+        pandas.DataFrame: Bloques de como mucho tamano_bloque filas.
+    """
+    extension = os.path.splitext(ruta)[1].lower()
+    if extension == ".parquet":
+        import pyarrow.parquet as pq
+
+        for lote in pq.ParquetFile(ruta).iter_batches(batch_size=tamano_bloque):
+            yield lote.to_pandas()
+    elif extension == ".csv":
+        import pandas as pd
+
+        yield from pd.read_csv(ruta, chunksize=tamano_bloque)
+    else:
+        raise ValueError(f"Formato de catalogo no soportado: {extension}")
+
+
+def procesar_bloque(bloque):
+    """
+    Agrega las columnas v_orbital, v_mru y diferencia a un bloque del catalogo.
+
+    El bloque debe tener la columna r (m); las columnas M (kg) y periodo (s)
+    son opcionales y por defecto toman la masa del Sol y un año.
+    """
+    masa_estrella = bloque["M"].to_numpy() if "M" in bloque else M
+    periodo = bloque["periodo"].to_numpy() if "periodo" in bloque else t_orbital
+    v_orbital, v_mru = velocidades(bloque["r"].to_numpy(), masa_estrella, periodo)
+    resultado = bloque.copy()
+    resultado["v_orbital"] = v_orbital
+    resultado["v_mru"] = v_mru
+    resultado["diferencia"] = v_orbital - v_mru
+    return resultado
+
+
+def _map_acotado(pool, funcion, iterable, en_vuelo):
+    """
+    Como pool.map, pero con a lo sumo `en_vuelo` bloques enviados a la vez,
+    para que la memoria no crezca con el tamano del catalogo.
+    """
+    pendientes = collections.deque()
+    for elemento in iterable:
+        pendientes.append(pool.submit(funcion, elemento))
+        if len(pendientes) >= en_vuelo:
+            yield pendientes.popleft().result()
+    while pendientes:
+        yield pendientes.popleft().result()
+
+
+def barrer_catalogo(entrada, salida, tamano_bloque=100_000, procesos=None, min_bloques_paralelo=4):
+    """
+    Compara los modelos de velocidad sobre un catalogo completo.
+
+    Los bloques se procesan en un pool de procesos cuando el catalogo tiene
+    al menos min_bloques_paralelo bloques (y procesos != 1); el resultado se
+    escribe bloque a bloque en un archivo Parquet.
+
+    Args:
+        entrada (str): Catalogo .csv o .parquet con columnas r[, M, periodo].
+        salida (str): Archivo .parquet de resultados.
+        tamano_bloque (int, optional): Filas por bloque.
+        procesos (int, optional): Procesos del pool; None usa todos los nucleos.
+        min_bloques_paralelo (int, optional): Bloques minimos para usar el pool.
+    Returns:
+        dict: Filas procesadas, tiempo (s) y filas por segundo.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    inicio = time.perf_counter()
+    bloques = leer_catalogo(entrada, tamano_bloque)
+
+    # Con pocos bloques el costo de crear el pool no compensa
+    primeros = []
+    for bloque in bloques:
+        primeros.append(bloque)
+        if len(primeros) >= min_bloques_paralelo:
+            break
+    pendientes = itertools.chain(primeros, bloques)
+
+    filas = 0
+    escritor = None
+    pool = None
+    try:
+        if procesos != 1 and len(primeros) >= min_bloques_paralelo:
+            procesos = procesos or os.cpu_count() or 1
+            pool = ProcessPoolExecutor(max_workers=procesos)
+            resultados = _map_acotado(pool, procesar_bloque, pendientes, 2 * procesos)
+        else:
+            resultados = map(procesar_bloque, pendientes)
+
+        for resultado in resultados:
+            tabla = pa.Table.from_pandas(resultado, preserve_index=False)
+            if escritor is None:
+                escritor = pq.ParquetWriter(salida, tabla.schema)
+            escritor.write_table(tabla)
+            filas += len(resultado)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+        if escritor is not None:
+            escritor.close()
+
+    tiempo = time.perf_counter() - inicio
+    print(f"{filas} filas procesadas en {tiempo:.2f} s ({filas / tiempo:.0f} filas/s) -> {salida}")
+    return {"filas": filas, "tiempo": tiempo, "filas_por_segundo": filas / tiempo}
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 3:
+        print("Uso: python barrido.py catalogo.(csv|parquet) resultados.parquet [tamano_bloque] [procesos]")
+        sys.exit(1)
+    tamano_bloque = int(sys.argv[3]) if len(sys.argv) > 3 else 100_000
+    procesos = int(sys.argv[4]) if len(sys.argv) > 4 else None
+    barrer_catalogo(sys.argv[1], sys.argv[2], tamano_bloque, procesos)
@@ -19,20 +19,21 @@ planets = [
 # Tiempo que tarda en completar una órbita (en segundos)
 t_orbital = 365.25 * 24 * 3600  # Un año en segundos
 
-# Calcular velocidad orbital y velocidad MRU para cada planeta
-for planet in planets:
-    name, r = planet
+if __name__ == "__main__":
+    # Calcular velocidad orbital y velocidad MRU para cada planeta
+    for planet in planets:
+        name, r = planet
 
-    # Cálculo de la velocidad orbital usando la Ley de Gravitación Universal
-    v_orbital = math.sqrt(G * M / r)
+        # Cálculo de la velocidad orbital usando la Ley de Gravitación Universal
+        v_orbital = math.sqrt(G * M / r)
 
-    # MRU: distancia recorrida (circunferencia de la órbita)
-    d_orbital = 2 * math.pi * r
+        # MRU: distancia recorrida (circunferencia de la órbita)
+        d_orbital = 2 * math.pi * r
 
-    # Velocidad usando MRU
-    v_mru = d_orbital / t_orbital
+        # Velocidad usando MRU
+        v_mru = d_orbital / t_orbital
 
-    # Resultados
-    print(f"Planeta: {name}")
-    print(f"  Velocidad orbital (Ley de Gravitación): {v_orbital:.2f} m/s")
-    print(f"  Velocidad orbital (MRU): {v_mru:.2f} m/s")
+        # Resultados
+        print(f"Planeta: {name}")
+        print(f"  Velocidad orbital (Ley de Gravitación): {v_orbital:.2f} m/s")
+        print(f"  Velocidad orbital (MRU): {v_mru:.2f} m/s")
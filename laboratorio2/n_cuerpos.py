@@ -0,0 +1,304 @@
+import time
+import numpy as np
+
+from ejercicio1 import G, M, planets
+
+# Masas de los planetas en kg (mismo orden que la tabla planets)
+masas_planetas = {
+    "Mercurio": 3.301e23,
+    "Venus": 4.867e24,
+    "Tierra": 5.972e24,
+    "Marte": 6.417e23,
+    "Júpiter": 1.898e27,
+    "Saturno": 5.683e26,
+    "Urano": 8.681e25,
+    "Neptuno": 1.024e26,
+}
+
+
+def sistema_solar():
+    """
+    Condiciones iniciales del Sol y los planetas de la tabla planets.
+
+    Cada planeta parte sobre el eje x a su distancia al Sol, con la
+    velocidad orbital circular sqrt(G*M/r) en la direccion y.
+
+    Returns:
+        tuple: Nombres, posiciones (N, 3), velocidades (N, 3) y masas (N,).
+    """
+    nombres = ["Sol"] + [nombre for nombre, _ in planets]
+    posiciones = np.zeros((len(nombres), 3))
+    velocidades = np.zeros((len(nombres), 3))
+    masas = np.array([M] + [masas_planetas[nombre] for nombre, _ in planets])
+
+    distancias = np.array([r for _, r in planets])
+    posiciones[1:, 0] = distancias
+    velocidades[1:, 1] = np.sqrt(G * M / distancias)
+
+    # Quitar el movimiento del centro de masas
+    velocidades -= (masas[:, None] * velocidades).sum(axis=0) / masas.sum()
+    return nombres, posiciones, velocidades, masas
+
+
+def aceleraciones_directas(posiciones, masas, suavizado=0.0, bloque=256):
+    """
+    Aceleraciones gravitatorias por suma directa O(N^2) vectorizada.
+
+    Para cada bloque de filas se forman las diferencias d_ij = x_j - x_i
+    (arreglo bloque x N x 3, así la memoria queda acotada) y se usa
+    a_i = G * sum_j m_j d_ij / |d_ij|^3. Restar las posiciones antes de
+    elevar al cuadrado evita la cancelación de |x_i|^2 + |x_j|^2 - 2 x_i.x_j.
+    Los pares coincidentes (d_ij = 0) no aportan, como en el límite de
+    suavizado -> 0, en lugar de dar 0/0.
+    """
+    n = len(posiciones)
+    aceleraciones = np.empty_like(posiciones, dtype=float)
+    for inicio in range(0, n, bloque):
+        fin = min(inicio + bloque, n)
+        d = posiciones[None, :, :] - posiciones[inicio:fin, None, :]
+        r2 = np.einsum("ijk,ijk->ij", d, d)
+        r2 += suavizado**2
+        # La propia particula no interactua consigo misma, y con suavizado
+        # nulo los cuerpos coincidentes tampoco (su direccion no esta definida)
+        r2[np.arange(fin - inicio), np.arange(inicio, fin)] = np.inf
+        r2[r2 == 0] = np.inf
+        W = masas[None, :] / (r2 * np.sqrt(r2))
+        aceleraciones[inicio:fin] = G * np.einsum("ij,ijk->ik", W, d)
+    return aceleraciones
+
+
+def construir_octree(posiciones, masas, max_nivel=20):
+    """
+    Construye el octree de Barnes-Hut nivel por nivel con claves de Morton.
+
+    Returns:
+        dict: Arreglos por nodo con masa, centro de masas, lado de la celda,
+        la particula de las hojas con una sola (-1 en el resto) y el rango
+        [inicio, fin) de sus hijos (inicio == fin en las hojas); ademas, la
+        hoja que contiene a cada particula.
+    """
+    n = len(posiciones)
+    minimo = posiciones.min(axis=0)
+    lado = float((posiciones.max(axis=0) - minimo).max()) * (1 + 1e-9) or 1.0
+    enteros = ((posiciones - minimo) / lado * 2**max_nivel).astype(np.int64)
+
+    masa_nodos = [np.array([masas.sum()])]
+    centro_nodos = [(masas[:, None] * posiciones).sum(axis=0, keepdims=True) / masas.sum()]
+    lado_nodos = [np.array([lado])]
+    particula_nodos = [np.array([0 if n == 1 else -1])]
+    claves_nivel = [np.zeros(1, dtype=np.int64)]
+    inicio_hijos = []
+    fin_hijos = []
+
+    activos = np.arange(n) if n > 1 else np.arange(0)
+    claves = np.zeros(n, dtype=np.int64)
+    hoja = np.zeros(n, dtype=np.int64)
+    base = 0
+    for nivel in range(1, max_nivel + 1):
+        n_padres = len(claves_nivel[-1])
+        if len(activos) == 0:
+            inicio_hijos.append(np.zeros(n_padres, dtype=np.int64))
+            fin_hijos.append(np.zeros(n_padres, dtype=np.int64))
+            break
+
+        # La clave de Morton del hijo agrega 3 bits (el octante) a la del padre
+        bit = enteros[activos] >> (max_nivel - nivel) & 1
+        claves[activos] = claves[activos] * 8 + (bit[:, 0] << 2 | bit[:, 1] << 1 | bit[:, 2])
+        unicas, primeros, inversa, cuenta = np.unique(
+            claves[activos], return_index=True, return_inverse=True, return_counts=True
+        )
+
+        # Los hijos de un mismo padre quedan contiguos al estar ordenados
+        padres = np.searchsorted(claves_nivel[-1], unicas >> 3)
+        base_hijos = base + n_padres
+        # Los padres sin particulas activas (hojas) quedan con inicio == fin
+        inicio = np.full(n_padres, base_hijos, dtype=np.int64)
+        fin = np.full(n_padres, base_hijos, dtype=np.int64)
+        primero = np.r_[True, padres[1:] != padres[:-1]]
+        ultimo = np.r_[padres[1:] != padres[:-1], True]
+        inicio[padres[primero]] = base_hijos + np.flatnonzero(primero)
+        fin[padres[ultimo]] = base_hijos + np.flatnonzero(ultimo) + 1
+        inicio_hijos.append(inicio)
+        fin_hijos.append(fin)
+
+        masa = np.bincount(inversa, weights=masas[activos], minlength=len(unicas))
+        centro = np.stack(
+            [np.bincount(inversa, weights=masas[activos] * posiciones[activos, d], minlength=len(unicas)) for d in range(3)],
+            axis=1,
+        ) / masa[:, None]
+        masa_nodos.append(masa)
+        centro_nodos.append(centro)
+        lado_nodos.append(np.full(len(unicas), lado / 2**nivel))
+        particula_nodos.append(np.where(cuenta == 1, activos[primeros], -1))
+        claves_nivel.append(unicas)
+        hoja[activos] = base_hijos + inversa
+        base = base_hijos
+
+        # Solo siguen bajando las particulas de celdas con mas de una
+        activos = activos[cuenta[inversa] > 1]
+    else:
+        n_ultimo = len(claves_nivel[-1])
+        inicio_hijos.append(np.zeros(n_ultimo, dtype=np.int64))
+        fin_hijos.append(np.zeros(n_ultimo, dtype=np.int64))
+
+    return {
+        "masa": np.concatenate(masa_nodos),
+        "centro": np.concatenate(centro_nodos),
+        "lado": np.concatenate(lado_nodos),
+        "particula": np.concatenate(particula_nodos),
+        "inicio_hijos": np.concatenate(inicio_hijos),
+        "fin_hijos": np.concatenate(fin_hijos),
+        "hoja": hoja,
+    }
+
+
+def aceleraciones_arbol(posiciones, masas, theta=0.5, suavizado=0.0, bloque=4096):
+    """
+    Aceleraciones gravitatorias aproximadas con Barnes-Hut, O(N log N).
+
+    El recorrido del arbol es vectorizado: se mantiene una frontera de
+    pares (particula, nodo); los nodos lejanos (lado/d < theta) o las hojas
+    se aceptan como masas puntuales y el resto se reemplaza por sus hijos.
+    """
+    arbol = construir_octree(posiciones, masas)
+    masa = arbol["masa"]
+    centro = arbol["centro"]
+    lado2 = arbol["lado"] ** 2
+    hoja = arbol["hoja"]
+    inicio_hijos = arbol["inicio_hijos"]
+    n_hijos = arbol["fin_hijos"] - inicio_hijos
+
+    n = len(posiciones)
+    aceleraciones = np.zeros_like(posiciones)
+    for inicio in range(0, n, bloque):
+        fin = min(inicio + bloque, n)
+        particulas = np.arange(inicio, fin)
+        nodos = np.zeros(len(particulas), dtype=np.int64)
+        acumulado = np.zeros((fin - inicio, 3))
+        while len(particulas):
+            diferencias = centro[nodos] - posiciones[particulas]
+            r2 = np.einsum("ij,ij->i", diferencias, diferencias) + suavizado**2
+            acepta = (n_hijos[nodos] == 0) | (lado2[nodos] < theta**2 * r2)
+
+            # Interacciones aceptadas, descartando la hoja de la propia
+            # particula: si al nivel maximo comparte la hoja con otras, son
+            # cuerpos coincidentes (o a menos de lado / 2^max_nivel) y no
+            # aportan, como en la suma directa
+            interactua = acepta & (nodos != hoja[particulas])
+            p = particulas[interactua]
+            d = diferencias[interactua]
+            factor = G * masa[nodos[interactua]] * r2[interactua] ** -1.5
+            for eje in range(3):
+                acumulado[:, eje] += np.bincount(p - inicio, weights=factor * d[:, eje], minlength=fin - inicio)
+
+            # Abrir los nodos cercanos: un par por cada hijo
+            abrir = ~acepta
+            cuantos = n_hijos[nodos[abrir]]
+            particulas = np.repeat(particulas[abrir], cuantos)
+            desplazamiento = np.arange(cuantos.sum()) - np.repeat(np.cumsum(cuantos) - cuantos, cuantos)
+            nodos = np.repeat(inicio_hijos[nodos[abrir]], cuantos) + desplazamiento
+        aceleraciones[inicio:fin] = acumulado
+    return aceleraciones
+
+
+def energia_total(posiciones, velocidades, masas, suavizado=0.0):
+    """
+    Energia cinetica mas potencial gravitatoria del sistema (suma directa).
+    """
+    cinetica = 0.5 * np.sum(masas * np.einsum("ij,ij->i", velocidades, velocidades))
+    potencial = 0.0
+    for i in range(len(masas) - 1):
+        r = np.sqrt(np.sum((posiciones[i + 1:] - posiciones[i]) ** 2, axis=1) + suavizado**2)
+        # Los pares coincidentes se omiten, igual que en las aceleraciones
+        r[r == 0] = np.inf
+        potencial -= G * masas[i] * np.sum(masas[i + 1:] / r)
+    return cinetica + potencial
+
+
+def simular(posiciones, velocidades, masas, dt, pasos, modo="directo", theta=0.5, suavizado=0.0, archivo=None, cada=1):
+    """
+    Integra el sistema de N cuerpos con leapfrog (kick-drift-kick).
+
+    Args:
+        posiciones (numpy.ndarray): Posiciones iniciales (N, 3) en m.
+        velocidades (numpy.ndarray): Velocidades iniciales (N, 3) en m/s.
+        masas (numpy.ndarray): Masas (N,) en kg.
+        dt (float): Paso de tiempo en s.
+        pasos (int): Numero de pasos.
+        modo (str, optional): "directo" (suma O(N^2)) o "arbol" (Barnes-Hut).
+        theta (float, optional): Criterio de apertura de Barnes-Hut.
+        suavizado (float, optional): Longitud de suavizado gravitatorio.
+        archivo (str, optional): Archivo .npy donde se escriben, como
+            memoria mapeada, las instantaneas (S, N, 6) de posicion y
+            velocidad cada `cada` pasos.
+        cada (int, optional): Frecuencia de las instantaneas.
+    Returns:
+        tuple: Posiciones y velocidades finales.
+    """
+    if modo == "directo":
+        aceleracion = lambda x: aceleraciones_directas(x, masas, suavizado)
+    elif modo == "arbol":
+        aceleracion = lambda x: aceleraciones_arbol(x, masas, theta, suavizado)
+    else:
+        raise ValueError(f"Modo desconocido: {modo}")
+
+    x = np.array(posiciones, dtype=float)
+    v = np.array(velocidades, dtype=float)
+    salida = None
+    if archivo is not None:
+        salida = np.lib.format.open_memmap(archivo, mode="w+", dtype=np.float64, shape=(pasos // cada + 1, len(x), 6))
+        salida[0, :, :3], salida[0, :, 3:] = x, v
+
+    a = aceleracion(x)
+    for j in range(1, pasos + 1):
+        v += 0.5 * dt * a
+        x += dt * v
+        a = aceleracion(x)
+        v += 0.5 * dt * a
+        if salida is not None and j % cada == 0:
+            salida[j // cada, :, :3], salida[j // cada, :, 3:] = x, v
+
+    if salida is not None:
+        salida.flush()
+    return x, v
+
+
+def benchmark_n_cuerpos(tamanos=(1000, 4000, 16000), theta=0.5, semilla=0):
+    """
+    Compara el tiempo de una evaluacion de aceleraciones directa y con arbol.
+
+    Returns:
+        dict: Por cada N, tiempos (s) de ambos modos y error relativo medio
+        del arbol respecto a la suma directa.
+    """
+    rng = np.random.default_rng(semilla)
+    resultados = {}
+    for n in tamanos:
+        posiciones = rng.normal(size=(n, 3)) * 1e11
+        masas = rng.uniform(1e23, 1e25, n)
+
+        inicio = time.perf_counter()
+        directa = aceleraciones_directas(posiciones, masas)
+        t_directo = time.perf_counter() - inicio
+
+        inicio = time.perf_counter()
+        arbol = aceleraciones_arbol(posiciones, masas, theta)
+        t_arbol = time.perf_counter() - inicio
+
+        error = np.mean(np.linalg.norm(arbol - directa, axis=1) / np.linalg.norm(directa, axis=1))
+        resultados[n] = {"directo": t_directo, "arbol": t_arbol, "error": error}
+        print(f"N = {n:>7}: directo {t_directo:.3f} s | arbol {t_arbol:.3f} s | error relativo {error:.2e}")
+    return resultados
+
+
+if __name__ == "__main__":
+    # Un año del sistema solar con paso de un día
+    nombres, x0, v0, masas = sistema_solar()
+    dia = 24 * 3600
+    E0 = energia_total(x0, v0, masas)
+    x, v = simular(x0, v0, masas, dia, 365, archivo="orbitas.npy", cada=5)
+    print(f"Error relativo de energia tras un año: {abs(energia_total(x, v, masas) - E0) / abs(E0):.2e}")
+    for nombre, posicion in zip(nombres[1:], x[1:]):
+        print(f"{nombre}: distancia al Sol {np.linalg.norm(posicion - x[0]):.4e} m")
+
+    benchmark_n_cuerpos()
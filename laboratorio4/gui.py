@@ -1,8 +1,15 @@
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
-import matplotlib.pyplot as plt
-from scipy.integrate import quad
 import tkinter as tk
 from tkinter import ttk
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
+import integration_service
+from quadrature import nodes_and_weights
 
 # Funciones de fuerza
 def F_cos(x):
@@ -18,59 +25,129 @@ def F_quad(x):
     return 0.5 * x**2 - 2 * x + 3
 
 # Métodos de trabajo
-def work_discrete(F, a, b, n):
+def work_discrete(F, a, b, n, method="left", cancel=None, progress=None, chunk=1_000_000):
+    # Regla fija de quadrature.METHODS (suma de Riemann por la izquierda por
+    # defecto): F se evalua una sola vez sobre los nodos de la regla, por
+    # bloques para poder cancelar e informar el avance, y esos mismos nodos y
+    # valores son los que se dibujan como barras
+    x_values, weights = nodes_and_weights(a, b, n, method)
+    F_values = np.empty_like(x_values)
+    for start in range(0, len(x_values), chunk):
+        if cancel is not None and cancel.is_set():
+            return None
+        if progress is not None:
+            progress.put(("Método discreto", 100 * start / len(x_values) / 2))
+        end = start + chunk
+        F_values[start:end] = np.broadcast_to(F(x_values[start:end]), x_values[start:end].shape)
+    return float(np.dot(weights, F_values)), x_values, F_values
+
+# Alineacion y ancho de las barras segun la regla usada
+def bar_layout(method, a, b, n):
     dx = (b - a) / n
-    work = 0.0
-    x_values = np.linspace(a, b, n)
-    for x in x_values:
-        work += F(x) * dx
-    return work, x_values
-
-def work_continuous(F, a, b):
-    work, _ = quad(F, a, b)
-    return work
-
-# Función para calcular trabajo y graficar
-def calculate_and_plot(F, a, b, n, label):
-    work_d, x_values = work_discrete(F, a, b, n)
-    work_c = work_continuous(F, a, b)
-
-    print(f"Trabajo (Método Discreto) para {label}: {work_d:.6f} J")
-    print(f"Trabajo (Método Continuo) para {label}: {work_c:.6f} J")
-
-    plt.figure(figsize=(14, 6))
+    if method == "left":
+        return "edge", dx
+    if method == "right":
+        return "edge", -dx
+    return "center", dx
+
+def work_continuous(F, a, b, cancel=None):
+    # Gauss-Kronrod adaptativo con cache: repetir o ampliar [a, b] reutiliza
+    # los subintervalos ya calculados; cancel se revisa entre niveles
+    return integration_service.work(F, a, b, "adaptive", cancel=cancel)
+
+# Cálculo en segundo plano: no toca widgets de Tk, solo reporta progreso
+def compute_work(F, a, b, n, progress, cancel, method="left"):
+    # El paso discreto revisa cancel entre bloques de evaluacion de F
+    discrete = work_discrete(F, a, b, n, method, cancel, progress)
+    if discrete is None:
+        return None
+    work_d, x_values, F_values = discrete
+    if cancel.is_set():
+        return None
+    progress.put(("Método continuo", 50))
+    work_c = work_continuous(F, a, b, cancel)
+    if work_c is None or cancel.is_set():
+        return None
+    progress.put(("Curva de la fuerza", 90))
+    x = np.linspace(a, b, 100)
+    progress.put(("Listo", 100))
+    return {
+        "work_d": work_d, "work_c": work_c,
+        "x_values": x_values, "F_values": F_values,
+        "x": x, "F_x": F(x), "a": a, "b": b, "n": n, "method": method,
+    }
+
+# Dibujar en la figura embebida (se reutiliza en cada clic)
+def draw_results(result, label):
+    a, b, n = result["a"], result["b"], result["n"]
+    print(f"Trabajo (Método Discreto) para {label}: {result['work_d']:.6f} J")
+    print(f"Trabajo (Método Continuo) para {label}: {result['work_c']:.6f} J")
 
     # Gráfico del método discreto
-    plt.subplot(1, 2, 1)
-    plt.bar(x_values, F(x_values), width=(b - a) / n, alpha=0.5, align='edge', color='blue')
-    plt.title(f'Método Discreto: Aproximación del Trabajo ({label})')
-    plt.xlabel('Posición (x)')
-    plt.ylabel('Fuerza (F)')
-    plt.axhline(0, color='black', lw=0.5, ls='--')
-    plt.axvline(0, color='black', lw=0.5, ls='--')
-    plt.grid()
+    ax_discrete.clear()
+    align, width = bar_layout(result["method"], a, b, n)
+    ax_discrete.bar(result["x_values"], result["F_values"], width=width, alpha=0.5, align=align, color='blue')
+    ax_discrete.set_title(f'Método Discreto: {result["work_d"]:.6f} J ({label})')
+    ax_discrete.set_xlabel('Posición (x)')
+    ax_discrete.set_ylabel('Fuerza (F)')
+    ax_discrete.axhline(0, color='black', lw=0.5, ls='--')
+    ax_discrete.axvline(0, color='black', lw=0.5, ls='--')
+    ax_discrete.grid()
 
     # Gráfico del método continuo
-    x = np.linspace(a, b, 100)
-    plt.subplot(1, 2, 2)
-    plt.plot(x, F(x), label=f'Fuerza: F(x) = {label}', color='orange')
-    plt.fill_between(x, F(x), alpha=0.3, color='orange')
-    plt.title(f'Método Continuo: Integral del Trabajo ({label})')
-    plt.xlabel('Posición (x)')
-    plt.ylabel('Fuerza (F)')
-    plt.axhline(0, color='black', lw=0.5, ls='--')
-    plt.axvline(0, color='black', lw=0.5, ls='--')
-    plt.legend()
-    plt.grid()
-
-    plt.tight_layout()
-    plt.show()
-
-# Función para obtener los valores y graficar
+    ax_continuous.clear()
+    ax_continuous.plot(result["x"], result["F_x"], label=f'Fuerza: F(x) = {label}', color='orange')
+    ax_continuous.fill_between(result["x"], result["F_x"], alpha=0.3, color='orange')
+    ax_continuous.set_title(f'Método Continuo: {result["work_c"]:.6f} J ({label})')
+    ax_continuous.set_xlabel('Posición (x)')
+    ax_continuous.set_ylabel('Fuerza (F)')
+    ax_continuous.axhline(0, color='black', lw=0.5, ls='--')
+    ax_continuous.axvline(0, color='black', lw=0.5, ls='--')
+    ax_continuous.legend()
+    ax_continuous.grid()
+
+    figure.tight_layout()
+    canvas.draw_idle()
+
+# Estado de la tarea en curso
+job = {"future": None, "cancel": None, "progress": None, "label": None}
+
+# Revisar la tarea desde el hilo de Tk con root.after
+def poll_job():
+    future = job["future"]
+    if future is None:
+        return
+    while not job["progress"].empty():
+        step, percent = job["progress"].get_nowait()
+        progress_var.set(percent)
+        status_var.set(step)
+
+    if not future.done():
+        root.after(50, poll_job)
+        return
+
+    job["future"] = None
+    calculate_button.config(state="normal")
+    cancel_button.config(state="disabled")
+    try:
+        result = future.result()
+    except Exception as e:
+        status_var.set(f"Error: {e}")
+        return
+    if result is None:
+        status_var.set("Cancelado")
+        return
+    draw_results(result, job["label"])
+
+# Función para obtener los valores y lanzar el cálculo
 def plot_function():
-    a = float(entry_a.get())
-    b = float(entry_b.get())
-    n = int(entry_n.get())
+    try:
+        a = float(entry_a.get())
+        b = float(entry_b.get())
+        n = int(entry_n.get())
+    except ValueError:
+        status_var.set("Ingrese valores numéricos válidos.")
+        return
     selected_function = function_var.get()
 
     if selected_function == "cos(x)":
@@ -85,13 +162,29 @@ def plot_function():
     elif selected_function == "0.5x^2 - 2x + 3":
         F = F_quad
         label = "0.5x^2 - 2x + 3"
-
-    calculate_and_plot(F, a, b, n, label)
+    else:
+        status_var.set("Seleccione una función válida.")
+        return
+
+    job["cancel"] = threading.Event()
+    job["progress"] = queue.Queue()
+    job["label"] = label
+    job["future"] = executor.submit(compute_work, F, a, b, n, job["progress"], job["cancel"])
+    calculate_button.config(state="disabled")
+    cancel_button.config(state="normal")
+    progress_var.set(0)
+    status_var.set("Calculando...")
+    root.after(50, poll_job)
+
+def cancel_job():
+    if job["cancel"] is not None:
+        job["cancel"].set()
+        status_var.set("Cancelando...")
 
 # Crear la ventana principal
 root = tk.Tk()
 root.title("Cálculo de Trabajo")
-root.geometry("400x400")
+root.geometry("1100x800")
 root.configure(bg='#91eb81')
 
 # Estilo para widgets
@@ -126,9 +219,29 @@ entry_n = ttk.Entry(limits_frame)
 entry_n.grid(row=2, column=1)
 entry_n.insert(0, "50")  # Valor por defecto
 
-# Botón para calcular y graficar
-calculate_button = ttk.Button(root, text="Calcular y Graficar", command=plot_function)
-calculate_button.pack(pady=20)
+# Botones para calcular y cancelar
+buttons_frame = ttk.Frame(root)
+buttons_frame.pack(pady=10)
+calculate_button = ttk.Button(buttons_frame, text="Calcular y Graficar", command=plot_function)
+calculate_button.grid(row=0, column=0, padx=5)
+cancel_button = ttk.Button(buttons_frame, text="Cancelar", command=cancel_job, state="disabled")
+cancel_button.grid(row=0, column=1, padx=5)
+
+# Progreso del cálculo en segundo plano
+progress_var = tk.DoubleVar(value=0)
+ttk.Progressbar(root, variable=progress_var, maximum=100, length=300).pack()
+status_var = tk.StringVar(value="")
+ttk.Label(root, textvariable=status_var).pack(pady=5)
+
+# Figura embebida, creada una sola vez y reutilizada en cada cálculo
+figure = Figure(figsize=(11, 4.5))
+ax_discrete, ax_continuous = figure.subplots(1, 2)
+canvas = FigureCanvasTkAgg(figure, master=root)
+canvas.get_tk_widget().pack(fill="both", expand=True)
+
+# Un solo hilo de trabajo: los cálculos no bloquean la ventana
+executor = ThreadPoolExecutor(max_workers=1)
 
 # Iniciar el bucle principal
-root.mainloop()
\ No newline at end of file
+root.mainloop()
+executor.shutdown(wait=False, cancel_futures=True)
\ No newline at end of file
@@ -0,0 +1,253 @@
+import math
+import warnings
+
+import numpy as np
+from scipy.integrate import quad
+
+from quadrature import METHODS, integrate
+
+# Nodos y pesos de Gauss-Kronrod 7-15 en [-1, 1] (los nodos impares son los de Gauss)
+_XGK = np.array([
+    0.991455371120812639206854697526329,
+    0.949107912342758524526189684047851,
+    0.864864423359769072789712788640926,
+    0.741531185599394439863864773280788,
+    0.586087235467691130294144845693013,
+    0.405845151377397166906606412076961,
+    0.207784955007898467600689403773245,
+    0.000000000000000000000000000000000,
+])
+_WGK = np.array([
+    0.022935322010529224963732008058970,
+    0.063092092629978553290700663189204,
+    0.104790010322250183839876322541518,
+    0.140653259715525918745189590510238,
+    0.169004726639267902826583426598550,
+    0.190350578064785409913256402421014,
+    0.204432940075298892414161999234649,
+    0.209482141084727828012999174891714,
+])
+_WG = np.array([
+    0.129484966168869693270611432679082,
+    0.279705391489276667901467771423780,
+    0.381830050505118944950369775488975,
+    0.417959183673469387755102040816327,
+])
+_NODES_K15 = np.concatenate([-_XGK[:-1], _XGK[::-1]])
+_WEIGHTS_K15 = np.concatenate([_WGK[:-1], _WGK[::-1]])
+# Posiciones de los 7 nodos de Gauss dentro de los 15 de Kronrod
+_G7_INDICES = np.array([1, 3, 5, 7, 9, 11, 13])
+_WEIGHTS_G7 = np.concatenate([_WG[:-1], _WG[::-1]])
+
+
+_EPS = np.finfo(float).eps
+
+# Resultados de los tramos anclados: (F, lo, hi, rtol) -> (valor, error, tol).
+# No se expulsan durante la sesion, asi que ampliar [a, b] solo calcula los
+# tramos nuevos
+_segment_cache = {}
+_segment_stats = {"hits": 0, "misses": 0}
+
+# Resultados de work: (F, a, b, method, tol, n, rtol) -> valor
+_work_cache = {}
+_WORK_CACHE_SIZE = 256
+
+
+def gauss_kronrod(F, a, b):
+    """
+    Regla de Gauss-Kronrod 7-15 sobre uno o varios intervalos [a, b].
+
+    F se evalua una sola vez sobre los 15 nodos de todos los intervalos.
+
+    Returns:
+        tuple: Arreglos con la integral de Kronrod, la estimacion del error
+        |K15 - G7| y la integral de |F| (escala del error de redondeo).
+    """
+    a = np.asarray(a, dtype=float)
+    b = np.asarray(b, dtype=float)
+    center = 0.5 * (a + b)
+    radius = 0.5 * (b - a)
+    x = center[..., None] + radius[..., None] * _NODES_K15
+    values = np.broadcast_to(F(x), x.shape)
+    kronrod = radius * (values @ _WEIGHTS_K15)
+    gauss = radius * (values[..., _G7_INDICES] @ _WEIGHTS_G7)
+    absolute = np.abs(radius) * (np.abs(values) @ _WEIGHTS_K15)
+    return kronrod, np.abs(kronrod - gauss), absolute
+
+
+def _adaptive_segments(F, lo, hi, tol, rtol, max_depth, budget, cancel):
+    # Biseccion por niveles de todos los tramos a la vez: en cada nivel F se
+    # evalua una sola vez sobre todas las piezas pendientes. Una pieza se
+    # acepta si su error cumple max(tol proporcional, rtol * |valor|) o si ya
+    # esta al nivel del redondeo
+    value = np.zeros(len(lo))
+    error = np.zeros(len(lo))
+    forced = np.zeros(len(lo), dtype=bool)
+    density = tol / (hi - lo)
+    owner = np.arange(len(lo))
+    left, right = lo, hi
+    evaluations = 0
+    for depth in range(max_depth + 1):
+        if cancel is not None and cancel.is_set():
+            return None
+        k, e, absolute = gauss_kronrod(F, left, right)
+        evaluations += _NODES_K15.size * len(left)
+        target = np.maximum(density[owner] * (right - left), rtol * np.abs(k))
+        done = (e <= target) | (e <= 50 * _EPS * absolute)
+        # Sin profundidad ni evaluaciones para otra biseccion: se aceptan
+        # las piezas pendientes tal como estan
+        if depth == max_depth or evaluations + 2 * _NODES_K15.size * np.count_nonzero(~done) > budget:
+            forced[owner[~done]] = True
+            done[:] = True
+        np.add.at(value, owner[done], k[done])
+        np.add.at(error, owner[done], e[done])
+        owner, left, right = owner[~done], left[~done], right[~done]
+        if owner.size == 0:
+            break
+        mid = 0.5 * (left + right)
+        owner = np.concatenate([owner, owner])
+        left, right = np.concatenate([left, mid]), np.concatenate([mid, right])
+    return value, error, forced, evaluations
+
+
+def adaptive_gauss_kronrod(F, a, b, tol=1e-10, rtol=1e-10, base_width=1.0, max_depth=30,
+                           max_evaluations=10_000_000, cancel=None, chunk=10_000):
+    """
+    Integracion adaptativa de Gauss-Kronrod sobre una malla fija de anclaje.
+
+    [a, b] se corta en los multiplos de base_width y cada tramo se subdivide
+    por biseccion hasta que el error de cada pieza cumple
+    max(tol proporcional a su longitud, rtol * |valor|) o queda al nivel del
+    redondeo. Los resultados de cada tramo se guardan sin expulsion, y como
+    los cortes no dependen de a ni de b, al ampliar el intervalo solo se
+    calculan los tramos nuevos.
+
+    Args:
+        F (callable): Funcion vectorizada a integrar.
+        a (float): Limite inferior.
+        b (float): Limite superior.
+        tol (float, optional): Tolerancia absoluta para todo [a, b].
+        rtol (float, optional): Tolerancia relativa por pieza.
+        base_width (float, optional): Separacion de la malla de anclaje.
+        max_depth (int, optional): Maximo de bisecciones por tramo.
+        max_evaluations (int, optional): Evaluaciones de F a partir de las
+            cuales ya no se subdivide; las piezas pendientes se aceptan, se
+            emite un RuntimeWarning y se devuelve la mejor estimacion.
+        cancel (threading.Event, optional): Se revisa entre niveles y bloques.
+        chunk (int, optional): Tramos procesados por bloque.
+    Returns:
+        tuple: Integral y estimacion del error, o None si se cancelo.
+    """
+    if a == b:
+        return 0.0, 0.0
+    if a > b:
+        result = adaptive_gauss_kronrod(F, b, a, tol, rtol, base_width, max_depth,
+                                        max_evaluations, cancel, chunk)
+        return None if result is None else (-result[0], result[1])
+
+    inner = base_width * np.arange(math.floor(a / base_width) + 1, math.ceil(b / base_width))
+    cuts = np.concatenate([[a], inner, [b]]).astype(float)
+    lo, hi = cuts[:-1], cuts[1:]
+
+    # La parte de tol de cada tramo se redondea hacia abajo a una potencia de
+    # 2, de modo que ampliar un poco [a, b] sigue encontrando los tramos en
+    # el cache (un resultado con tolerancia mas estricta tambien sirve)
+    share = tol * (hi - lo) / (b - a)
+    with np.errstate(divide="ignore"):
+        segment_tol = np.where(share > 0, 2.0 ** np.floor(np.log2(share)), 0.0)
+
+    values = np.empty(len(lo))
+    errors = np.empty(len(lo))
+    pending = []
+    for i, key in enumerate(zip(lo.tolist(), hi.tolist())):
+        cached = _segment_cache.get((F, *key, rtol))
+        if cached is not None and cached[2] <= segment_tol[i]:
+            values[i], errors[i] = cached[0], cached[1]
+        else:
+            pending.append(i)
+    _segment_stats["hits"] += len(lo) - len(pending)
+    _segment_stats["misses"] += len(pending)
+
+    pending = np.array(pending, dtype=np.int64)
+    evaluations = 0
+    exhausted = False
+    for start in range(0, len(pending), chunk):
+        block = pending[start:start + chunk]
+        result = _adaptive_segments(F, lo[block], hi[block], segment_tol[block], rtol,
+                                    max_depth, max_evaluations - evaluations, cancel)
+        if result is None:
+            return None
+        value, error, forced, used = result
+        evaluations += used
+        exhausted |= bool(forced.any())
+        values[block], errors[block] = value, error
+        # Solo se guardan los tramos que cumplieron la tolerancia
+        for i in block[~forced]:
+            _segment_cache[(F, float(lo[i]), float(hi[i]), rtol)] = (values[i], errors[i], segment_tol[i])
+
+    if exhausted:
+        warnings.warn(
+            f"Gauss-Kronrod adaptativo: no se alcanzo la tolerancia en [{a}, {b}] "
+            f"({evaluations} evaluaciones de F); error estimado {errors.sum():.3g}",
+            RuntimeWarning,
+            stacklevel=2,
+        )
+    return float(np.sum(values)), float(np.sum(errors))
+
+
+def work(F, a, b, method="adaptive", tol=1e-10, n=50, rtol=1e-10, cancel=None):
+    """
+    Trabajo W = integral de F entre a y b, con cache de resultados.
+
+    La clave del cache es (F, a, b, method, tol, n, rtol), por lo que repetir
+    el mismo calculo (por ejemplo, pulsar otra vez el boton de la GUI) es
+    inmediato.
+
+    Args:
+        F (callable): Funcion de fuerza vectorizada.
+        a (float): Limite inferior.
+        b (float): Limite superior.
+        method (str, optional): "adaptive" (Gauss-Kronrod adaptativo),
+            "quad" (scipy.integrate.quad) o una regla de quadrature.METHODS.
+        tol (float, optional): Tolerancia absoluta para los metodos adaptativos.
+        n (int, optional): Subintervalos para las reglas fijas.
+        rtol (float, optional): Tolerancia relativa para los metodos adaptativos.
+        cancel (threading.Event, optional): Permite cancelar "adaptive".
+    Returns:
+        float: Trabajo, o None si se cancelo.
+    """
+    key = (F, a, b, method, tol, n, rtol)
+    if key in _work_cache:
+        return _work_cache[key]
+    if method == "adaptive":
+        result = adaptive_gauss_kronrod(F, a, b, tol, rtol, cancel=cancel)
+        if result is None:
+            return None
+        value = result[0]
+    elif method == "quad":
+        value = quad(F, a, b, epsabs=tol, epsrel=rtol)[0]
+    elif method in METHODS:
+        value = integrate(F, a, b, n, method)
+    else:
+        raise ValueError(f"Metodo desconocido: {method}")
+
+    if len(_work_cache) >= _WORK_CACHE_SIZE:
+        _work_cache.pop(next(iter(_work_cache)))
+    _work_cache[key] = value
+    return value
+
+
+def cache_info():
+    """
+    Estadisticas de los caches de resultados y de subintervalos.
+    """
+    return {
+        "work": {"size": len(_work_cache), "maxsize": _WORK_CACHE_SIZE},
+        "segments": {"size": len(_segment_cache), **_segment_stats},
+    }
+
+
+def clear_cache():
+    _work_cache.clear()
+    _segment_cache.clear()
+    _segment_stats.update(hits=0, misses=0)
@@ -1,23 +1,32 @@
 import numpy as np
 import matplotlib.pyplot as plt
-from scipy.integrate import quad
 
-# Método de aproximación discreta
-def work_discrete(F, a, b, n):
-    dx = (b - a) / n  # Ancho de los intervalos
-    work = 0.0
-    x_values = np.linspace(a, b, n)
-
-    for x in x_values:
-        # Sumar el trabajo de cada segmento
-        work += F(x) * dx
+import integration_service
+from quadrature import nodes_and_weights
 
-    return work, x_values
+# Método de aproximación discreta
+def work_discrete(F, a, b, n, method="left"):
+    # Regla fija de quadrature.METHODS (suma de Riemann por la izquierda por
+    # defecto): F se evalua una sola vez sobre los nodos de la regla, y esos
+    # mismos nodos y valores son los que se dibujan como barras
+    x_values, weights = nodes_and_weights(a, b, n, method)
+    F_values = np.broadcast_to(F(x_values), x_values.shape)
+    return float(np.dot(weights, F_values)), x_values, F_values
+
+# Alineacion y ancho de las barras segun la regla usada
+def bar_layout(method, a, b, n):
+    dx = (b - a) / n
+    if method == "left":
+        return "edge", dx
+    if method == "right":
+        return "edge", -dx
+    return "center", dx
 
 # Método continuo (integración)
 def work_continuous(F, a, b):
-    work, _ = quad(F, a, b)
-    return work
+    # Gauss-Kronrod adaptativo con cache: repetir o ampliar [a, b] reutiliza
+    # los subintervalos ya calculados
+    return integration_service.work(F, a, b, "adaptive")
 
 # Funciones de fuerza
 def F_cos(x):
@@ -33,8 +42,8 @@ def F_quad(x):
     return 0.5 * x**2 - 2 * x + 3
 
 # Función para calcular trabajo y graficar
-def calculate_and_plot(F, a, b, n, label):
-    work_d, x_values = work_discrete(F, a, b, n)
+def calculate_and_plot(F, a, b, n, label, method="left"):
+    work_d, x_values, F_values = work_discrete(F, a, b, n, method)
     work_c = work_continuous(F, a, b)
 
     print(f"Trabajo (Método Discreto) para {label}: {work_d:.6f} J")
@@ -44,7 +53,8 @@ def calculate_and_plot(F, a, b, n, label):
 
     # Gráfico del método discreto
     plt.subplot(1, 2, 1)
-    plt.bar(x_values, F(x_values), width=(b - a) / n, alpha=0.5, align='edge', color='blue')
+    align, width = bar_layout(method, a, b, n)
+    plt.bar(x_values, F_values, width=width, alpha=0.5, align=align, color='blue')
     plt.title(f'Método Discreto: Aproximación del Trabajo ({label})')
     plt.xlabel('Posición (x)')
     plt.ylabel('Fuerza (F)')
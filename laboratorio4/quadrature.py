@@ -0,0 +1,91 @@
+import numpy as np
+
+# Reglas disponibles en nodes_and_weights
+METHODS = ("left", "right", "midpoint", "trapezoid", "simpson", "gauss")
+
+
+def nodes_and_weights(a, b, n, method="midpoint"):
+    """
+    Nodos y pesos de una regla de cuadratura sobre [a, b] con n subintervalos.
+
+    Todas las reglas se expresan como sum(w * F(x)), de modo que F se evalua
+    una sola vez sobre el arreglo completo de nodos.
+
+    Args:
+        a (float): Limite inferior.
+        b (float): Limite superior.
+        n (int): Numero de subintervalos (o de nodos para "gauss").
+        method (str, optional): "left", "right", "midpoint", "trapezoid",
+            "simpson" (n par) o "gauss" (Gauss-Legendre de n puntos).
+    Returns:
+        tuple: Arreglos de nodos x y pesos w.
+    """
+    if n < 1:
+        raise ValueError("n debe ser al menos 1.")
+    dx = (b - a) / n
+
+    if method == "left":
+        return a + dx * np.arange(n), np.full(n, dx)
+    if method == "right":
+        return a + dx * np.arange(1, n + 1), np.full(n, dx)
+    if method == "midpoint":
+        return a + dx * (np.arange(n) + 0.5), np.full(n, dx)
+    if method == "trapezoid":
+        w = np.full(n + 1, dx)
+        w[[0, -1]] = dx / 2
+        return np.linspace(a, b, n + 1), w
+    if method == "simpson":
+        if n % 2:
+            raise ValueError("Simpson requiere un numero par de subintervalos.")
+        w = np.full(n + 1, 2 * dx / 3)
+        w[1::2] = 4 * dx / 3
+        w[[0, -1]] = dx / 3
+        return np.linspace(a, b, n + 1), w
+    if method == "gauss":
+        t, w = np.polynomial.legendre.leggauss(n)
+        return 0.5 * (b - a) * t + 0.5 * (a + b), 0.5 * (b - a) * w
+    raise ValueError(f"Metodo desconocido: {method}")
+
+
+def integrate(F, a, b, n, method="midpoint"):
+    """
+    Integral de F en [a, b] con una regla fija, evaluando F una sola vez.
+    """
+    x, w = nodes_and_weights(a, b, n, method)
+    return float(np.dot(w, np.broadcast_to(F(x), x.shape)))
+
+
+def romberg(F, a, b, tol=1e-10, max_level=20):
+    """
+    Integracion de Romberg: trapecios con n duplicado + extrapolacion de Richardson.
+
+    Al duplicar n solo se evalua F en los puntos medios nuevos; los valores
+    anteriores ya estan contenidos en el trapecio del nivel previo.
+
+    Args:
+        F (callable): Funcion vectorizada a integrar.
+        a (float): Limite inferior.
+        b (float): Limite superior.
+        tol (float, optional): Tolerancia absoluta entre dos extrapolaciones.
+        max_level (int, optional): Maximo numero de duplicaciones.
+    Returns:
+        tuple: Integral, estimacion del error y numero de evaluaciones de F.
+    """
+    h = b - a
+    row = [0.5 * h * (float(F(np.float64(a))) + float(F(np.float64(b))))]
+    evaluations = 2
+    for level in range(1, max_level + 1):
+        # Solo los 2^(level-1) puntos medios nuevos
+        new_points = a + h * (np.arange(2 ** (level - 1)) + 0.5)
+        trapezoid = 0.5 * row[0] + 0.5 * h * float(np.sum(np.broadcast_to(F(new_points), new_points.shape)))
+        evaluations += len(new_points)
+        h /= 2
+
+        new_row = [trapezoid]
+        for j in range(1, level + 1):
+            new_row.append(new_row[j - 1] + (new_row[j - 1] - row[j - 1]) / (4**j - 1))
+        error = abs(new_row[-1] - row[-1])
+        row = new_row
+        if error < tol:
+            break
+    return row[-1], error, evaluations
@@ -1,6 +1,8 @@
 import numpy as np
 import matplotlib.pyplot as plt
 
+from integrador import apice, energias, integrar_simplectico, paso_maximo, rk45, sistema_proyectil
+
 # Parámetros iniciales
 m = 0.01  # masa (kg)
 v0 = 8.0  # velocidad inicial (m/s)
@@ -82,3 +84,43 @@ plt.show()
 
 # Mostrar la altura máxima
 print(f"La altura máxima alcanzada es: {max_height:.2f} metros.")
+
+# Comparación con el integrador adaptativo RK45 (Dormand-Prince)
+# El evento de ápice reemplaza la condición de parada manual
+solucion = rk45(sistema_proyectil(g), (t0, t_end), [y0, v0, m], rtol=1e-9, atol=1e-12, eventos=[apice()])
+_, _, em_rk45 = energias(solucion.y, g)
+error_euler = max(abs(e - em_values[0]) for e in em_values)
+error_rk45 = np.max(np.abs(em_rk45 - em_rk45[0]))
+print(f"Euler: {len(times) - 1} pasos, error máximo de energía {error_euler:.2e} J")
+print(f"RK45:  {solucion.pasos} pasos, error máximo de energía {error_rk45:.2e} J, "
+      f"altura máxima {solucion.y[-1, 0]:.4f} m")
+
+# Integradores simplécticos con monitoreo del error de energía
+def aceleracion(t, y):
+    return -g * np.ones_like(y)
+
+def energia_mecanica(y, v):
+    return 0.5 * m * v[0]**2 + m * g * y[0]
+
+t_apice = v0 / g
+for metodo in ("euler", "verlet", "yoshida4"):
+    trayectoria = integrar_simplectico(aceleracion, (t0, t_apice), [y0], [v0], dt, metodo, energia_mecanica)
+    print(f"{metodo:>9}: error relativo máximo de energía {trayectoria.error_energia.max():.2e}")
+
+# Mayor paso que mantiene el error de energía bajo 1e-6. Con gravedad
+# constante Verlet y Yoshida son exactos, así que la comparación se hace con
+# una fuerza que depende de la posición: la masa unida a un resorte
+k_resorte = 4.0  # constante del resorte (N/m)
+
+def aceleracion_resorte(t, y):
+    return -k_resorte / m * y
+
+def energia_resorte(y, v):
+    return 0.5 * m * v[0]**2 + 0.5 * k_resorte * y[0]**2
+
+# Diez periodos de oscilación (Euler necesitaría pasos de ~1e-7 s)
+periodo = 2 * np.pi * np.sqrt(m / k_resorte)
+for metodo in ("verlet", "yoshida4"):
+    dt_max, trayectoria = paso_maximo(aceleracion_resorte, energia_resorte, (t0, 10 * periodo), [y0], [v0], 1e-6, metodo=metodo)
+    print(f"Paso máximo con {metodo} para un error de energía < 1e-6: {dt_max:.2e} s "
+          f"({trayectoria.evaluaciones} evaluaciones de la aceleración)")
@@ -25,28 +25,53 @@ def input_sin_restriccion(mensaje):
 # Función para calcular energías cinética, potencial y mecánica total
 def calcular_energias(m, v_initial, g, t_max, num_points=10):
     time_points = np.linspace(0, t_max, num_points)  # puntos de tiempo para evaluar
-    kinetic_energy = []
-    potential_energy = []
-    total_energy = []
-
-    # Cálculo de energías en cada instante
-    for t in time_points:
-        # Altura y velocidad en cada instante
-        h = v_initial * t - 0.5 * g * t**2
-        v = v_initial - g * t
-
-        # Energías
-        EK = 0.5 * m * v**2  # Energía cinética
-        EP = m * g * h       # Energía potencial
-        Em = EK + EP         # Energía mecánica total
-
-        # Guardar los valores en listas
-        kinetic_energy.append(EK)
-        potential_energy.append(EP)
-        total_energy.append(Em)
-    
+
+    # Altura y velocidad en todos los instantes a la vez
+    h = v_initial * time_points - 0.5 * g * time_points**2
+    v = v_initial - g * time_points
+
+    # Energías
+    kinetic_energy = 0.5 * m * v**2     # Energía cinética
+    potential_energy = m * g * h        # Energía potencial
+    total_energy = kinetic_energy + potential_energy  # Energía mecánica total
+
     return time_points, kinetic_energy, potential_energy, total_energy
 
+# Tipo de registro devuelto por calcular_energias_lote
+ENERGIAS_DTYPE = np.dtype([("t", "f8"), ("h", "f8"), ("v", "f8"), ("EK", "f8"), ("EP", "f8"), ("Em", "f8")])
+
+# Función para evaluar muchas condiciones de lanzamiento a la vez
+def calcular_energias_lote(m, v_initial, g, t_max=None, num_points=10):
+    """
+    Evalúa las energías de un lote de lanzamientos con broadcasting.
+
+    Args:
+        m, v_initial, g (float o array_like): Parámetros de cada lanzamiento;
+            se combinan con las reglas de broadcasting de NumPy.
+        t_max (float o array_like, optional): Tiempo final de cada lanzamiento;
+            por defecto el tiempo hasta la altura máxima, v_initial / g.
+        num_points (int, optional): Puntos de tiempo por lanzamiento.
+    Returns:
+        numpy.ndarray: Arreglo estructurado (ENERGIAS_DTYPE) de forma
+        (*forma_del_lote, num_points) con t, h, v, EK, EP y Em.
+    """
+    m, v_initial, g = np.broadcast_arrays(*(np.asarray(p, dtype=float) for p in (m, v_initial, g)))
+    if t_max is None:
+        t_max = v_initial / g
+    t_max = np.broadcast_to(np.asarray(t_max, dtype=float), m.shape)
+
+    # Cada parámetro gana un eje final para recorrer el tiempo
+    m, v_initial, g, t_max = (p[..., None] for p in (m, v_initial, g, t_max))
+    resultado = np.empty(m.shape[:-1] + (num_points,), dtype=ENERGIAS_DTYPE)
+    t = resultado["t"]
+    t[...] = t_max * np.linspace(0, 1, num_points)
+    resultado["h"] = v_initial * t - 0.5 * g * t**2
+    resultado["v"] = v_initial - g * t
+    resultado["EK"] = 0.5 * m * resultado["v"]**2
+    resultado["EP"] = m * g * resultado["h"]
+    resultado["Em"] = resultado["EK"] + resultado["EP"]
+    return resultado
+
 # Función para graficar energía vs. tiempo con puntos y valores de energía
 def energia_vs_tiempo(time_points, kinetic_energy, potential_energy, total_energy):
     plt.figure(figsize=(12, 8))
@@ -76,44 +101,45 @@ def energia_vs_tiempo(time_points, kinetic_energy, potential_energy, total_energ
 
 
 
-# # Datos del problema
-# m = 0.01  # masa en kg
-# v_initial = 8.0  # velocidad inicial en m/s
-# g = 9.81  # gravedad en m/s^2
-# t_max = v_initial / g  # tiempo hasta que la velocidad se hace cero (v = 0)
+if __name__ == "__main__":
+    # # Datos del problema
+    # m = 0.01  # masa en kg
+    # v_initial = 8.0  # velocidad inicial en m/s
+    # g = 9.81  # gravedad en m/s^2
+    # t_max = v_initial / g  # tiempo hasta que la velocidad se hace cero (v = 0)
 
-# Ingreso de datos validados
-print("========== CONSERVACIÓN DE LA ENERGÍA ==========")
-m = input_positivo("Masa del objeto (kg): ")
-v_initial = input_sin_restriccion("Velocidad inicial (m/s): ")
-g = input_positivo("Aceleración debida a la gravedad (m/s^2): ")
+    # Ingreso de datos validados
+    print("========== CONSERVACIÓN DE LA ENERGÍA ==========")
+    m = input_positivo("Masa del objeto (kg): ")
+    v_initial = input_sin_restriccion("Velocidad inicial (m/s): ")
+    g = input_positivo("Aceleración debida a la gravedad (m/s^2): ")
 
-# Cálculo del tiempo hasta que la velocidad se hace cero
-t_max = v_initial / g
+    # Cálculo del tiempo hasta que la velocidad se hace cero
+    t_max = v_initial / g
 
-# Imprimir datos iniciales
-print(f"Datos Iniciales:")
-print(f"Masa del objeto: {m} kg")
-print(f"Velocidad inicial: {v_initial} m/s")
-print(f"Aceleración debida a la gravedad: {g} m/s^2")
-print(f"Tiempo hasta que la velocidad se hace cero: {t_max:.2f} s\n")
+    # Imprimir datos iniciales
+    print(f"Datos Iniciales:")
+    print(f"Masa del objeto: {m} kg")
+    print(f"Velocidad inicial: {v_initial} m/s")
+    print(f"Aceleración debida a la gravedad: {g} m/s^2")
+    print(f"Tiempo hasta que la velocidad se hace cero: {t_max:.2f} s\n")
 
-# Calcular energías
-time_points, kinetic_energy, potential_energy, total_energy = calcular_energias(m, v_initial, g, t_max)
+    # Calcular energías
+    time_points, kinetic_energy, potential_energy, total_energy = calcular_energias(m, v_initial, g, t_max)
 
-# Imprimir velocidad, altura y energías en cada instante
-for i in range(len(time_points)):
-    print(f"[{i}] => Tiempo: {time_points[i]:.2f} s | Altura: {v_initial * time_points[i] - 0.5 * g * time_points[i]**2:.2f} m | Velocidad: {v_initial - g * time_points[i]:.2f} m/s | EK: {kinetic_energy[i]:.2f} J | EP: {potential_energy[i]:.2f} J | Em: {total_energy[i]:.2f} J")
+    # Imprimir velocidad, altura y energías en cada instante
+    for i in range(len(time_points)):
+        print(f"[{i}] => Tiempo: {time_points[i]:.2f} s | Altura: {v_initial * time_points[i] - 0.5 * g * time_points[i]**2:.2f} m | Velocidad: {v_initial - g * time_points[i]:.2f} m/s | EK: {kinetic_energy[i]:.2f} J | EP: {potential_energy[i]:.2f} J | Em: {total_energy[i]:.2f} J")
 
-# Imprimit resultados finales de energías
-print(f"\nResultados Finales:")
-print(f"Energía Cinética Final (EK): {kinetic_energy[-1]:.2f} J")
-print(f"Energía Potencial Final (EP): {potential_energy[-1]:.2f} J")
-print(f"Energía Mecánica Final (Em): {total_energy[-1]:.2f} J")
-print(f"Altura Final: {v_initial * time_points[-1] - 0.5 * g * time_points[-1]**2:.2f} m")
+    # Imprimit resultados finales de energías
+    print(f"\nResultados Finales:")
+    print(f"Energía Cinética Final (EK): {kinetic_energy[-1]:.2f} J")
+    print(f"Energía Potencial Final (EP): {potential_energy[-1]:.2f} J")
+    print(f"Energía Mecánica Final (Em): {total_energy[-1]:.2f} J")
+    print(f"Altura Final: {v_initial * time_points[-1] - 0.5 * g * time_points[-1]**2:.2f} m")
 
-# Graficar energías
-energia_vs_tiempo(time_points, kinetic_energy, potential_energy, total_energy)
+    # Graficar energías
+    energia_vs_tiempo(time_points, kinetic_energy, potential_energy, total_energy)
 
 # Problema 1:
 """
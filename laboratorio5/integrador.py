@@ -0,0 +1,403 @@
+from collections import namedtuple
+
+import numpy as np
+
+# Evento g(t, y) = 0; terminal detiene la integracion, direccion filtra el cruce
+Evento = namedtuple("Evento", ["funcion", "terminal", "direccion"])
+
+# Resultado de una integracion: tiempos, estados (fila por tiempo) y estadisticas
+Solucion = namedtuple("Solucion", ["t", "y", "eventos", "pasos", "evaluaciones"])
+
+
+def evento(funcion, terminal=True, direccion=0):
+    """
+    Crea un evento para rk4() o rk45().
+
+    Args:
+        funcion (callable): g(t, y); el evento ocurre cuando g cruza 0.
+        terminal (bool, optional): Si es True la integracion se detiene.
+        direccion (int, optional): -1 solo cruces decrecientes, 1 solo
+            crecientes, 0 ambos.
+    """
+    return Evento(funcion, terminal, direccion)
+
+
+# Coeficientes de Dormand-Prince 5(4)
+_C = np.array([0, 1 / 5, 3 / 10, 4 / 5, 8 / 9, 1, 1])
+_A = [
+    [],
+    [1 / 5],
+    [3 / 40, 9 / 40],
+    [44 / 45, -56 / 15, 32 / 9],
+    [19372 / 6561, -25360 / 2187, 64448 / 6561, -212 / 729],
+    [9017 / 3168, -355 / 33, 46732 / 5247, 49 / 176, -5103 / 18656],
+    [35 / 384, 0, 500 / 1113, 125 / 192, -2187 / 6784, 11 / 84],
+]
+_B5 = np.array([35 / 384, 0, 500 / 1113, 125 / 192, -2187 / 6784, 11 / 84, 0])
+_B4 = np.array([5179 / 57600, 0, 7571 / 16695, 393 / 640, -92097 / 339200, 187 / 2100, 1 / 40])
+
+
+def _agregar(tiempos, estados, n, t, y):
+    """
+    Guarda (t, y) en la posicion n de los arreglos preasignados y duplica
+    su capacidad cuando se llenan. Devuelve los arreglos (quizas nuevos).
+    """
+    if n == len(tiempos):
+        tiempos = np.resize(tiempos, 2 * n)
+        estados = np.resize(estados, (2 * n, estados.shape[1]))
+    tiempos[n] = t
+    estados[n] = y
+    return tiempos, estados
+
+
+def _hermite(t0, y0, f0, t1, y1, f1, t):
+    """
+    Interpolacion cubica de Hermite entre dos pasos aceptados.
+    """
+    h = t1 - t0
+    s = (t - t0) / h
+    h00 = 2 * s**3 - 3 * s**2 + 1
+    h10 = s**3 - 2 * s**2 + s
+    h01 = -2 * s**3 + 3 * s**2
+    h11 = s**3 - s**2
+    return h00 * y0 + h10 * h * f0 + h01 * y1 + h11 * h * f1
+
+
+def _buscar_evento(ev, t0, y0, f0, t1, y1, f1, tol=1e-12, max_iter=100):
+    """
+    Devuelve el instante del cruce de ev dentro de [t0, t1], o None.
+    """
+    g0 = ev.funcion(t0, y0)
+    g1 = ev.funcion(t1, y1)
+    if g0 == 0 or np.sign(g0) == np.sign(g1):
+        return None
+    if ev.direccion > 0 and g1 < g0:
+        return None
+    if ev.direccion < 0 and g1 > g0:
+        return None
+
+    # Biseccion sobre el interpolante para no evaluar fun de nuevo
+    a, b = t0, t1
+    for _ in range(max_iter):
+        c = (a + b) / 2
+        gc = ev.funcion(c, _hermite(t0, y0, f0, t1, y1, f1, c))
+        if np.sign(gc) == np.sign(g0):
+            a = c
+        else:
+            b = c
+        if b - a < tol * max(1.0, abs(t1)):
+            break
+    return b
+
+
+def _revisar_eventos(eventos, encontrados, t0, y0, f0, t1, y1, f1):
+    """
+    Registra los eventos del paso y devuelve el primer instante terminal.
+    """
+    t_terminal = None
+    for i, ev in enumerate(eventos):
+        te = _buscar_evento(ev, t0, y0, f0, t1, y1, f1)
+        if te is None:
+            continue
+        encontrados[i].append(te)
+        if ev.terminal and (t_terminal is None or te < t_terminal):
+            t_terminal = te
+    return t_terminal
+
+
+def rk4(fun, t_span, y0, dt, eventos=()):
+    """
+    Runge-Kutta clasico de orden 4 con paso fijo.
+
+    Args:
+        fun (callable): Lado derecho dy/dt = fun(t, y).
+        t_span (tuple): Intervalo (t0, t_final).
+        y0 (array_like): Estado inicial.
+        dt (float): Paso de tiempo.
+        eventos (iterable, optional): Eventos creados con evento().
+    Returns:
+        Solucion: Tiempos, estados, instantes de cada evento, pasos y
+        evaluaciones de fun.
+    """
+    t0, t_final = t_span
+    y = np.array(y0, dtype=float)
+    pasos_max = int(np.ceil((t_final - t0) / dt))
+    tiempos = np.empty(pasos_max + 1)
+    estados = np.empty((pasos_max + 1, len(y)))
+    tiempos[0], estados[0] = t0, y
+    n = 1
+    encontrados = [[] for _ in eventos]
+
+    t = t0
+    f = fun(t, y)
+    evaluaciones = 1
+    pasos = 0
+    for _ in range(pasos_max):
+        h = min(dt, t_final - t)
+        k1 = f
+        k2 = fun(t + h / 2, y + h / 2 * k1)
+        k3 = fun(t + h / 2, y + h / 2 * k2)
+        k4 = fun(t + h, y + h * k3)
+        y_nuevo = y + h / 6 * (k1 + 2 * k2 + 2 * k3 + k4)
+        f_nuevo = fun(t + h, y_nuevo)
+        evaluaciones += 4
+        pasos += 1
+
+        t_terminal = _revisar_eventos(eventos, encontrados, t, y, f, t + h, y_nuevo, f_nuevo)
+        if t_terminal is not None:
+            y_evento = _hermite(t, y, f, t + h, y_nuevo, f_nuevo, t_terminal)
+            tiempos, estados = _agregar(tiempos, estados, n, t_terminal, y_evento)
+            n += 1
+            break
+
+        t, y, f = t + h, y_nuevo, f_nuevo
+        tiempos, estados = _agregar(tiempos, estados, n, t, y)
+        n += 1
+
+    return Solucion(tiempos[:n].copy(), estados[:n].copy(), [np.array(e) for e in encontrados], pasos, evaluaciones)
+
+
+def rk45(fun, t_span, y0, rtol=1e-6, atol=1e-9, dt_inicial=None, dt_max=np.inf, eventos=()):
+    """
+    Runge-Kutta adaptativo de Dormand-Prince 5(4).
+
+    El paso se ajusta con la diferencia entre las soluciones de orden 5 y 4
+    para cumplir la tolerancia pedida, y la ultima etapa se reutiliza como
+    la primera del paso siguiente (FSAL).
+
+    Args:
+        fun (callable): Lado derecho dy/dt = fun(t, y).
+        t_span (tuple): Intervalo (t0, t_final).
+        y0 (array_like): Estado inicial.
+        rtol (float, optional): Tolerancia relativa.
+        atol (float, optional): Tolerancia absoluta.
+        dt_inicial (float, optional): Primer paso; por defecto se estima.
+        dt_max (float, optional): Paso maximo permitido.
+        eventos (iterable, optional): Eventos creados con evento().
+    Returns:
+        Solucion: Tiempos, estados, instantes de cada evento, pasos aceptados
+        y evaluaciones de fun.
+    """
+    t0, t_final = t_span
+    y = np.array(y0, dtype=float)
+    tiempos = np.empty(64)
+    estados = np.empty((64, len(y)))
+    tiempos[0], estados[0] = t0, y
+    n = 1
+    encontrados = [[] for _ in eventos]
+
+    t = t0
+    f = fun(t, y)
+    evaluaciones = 1
+    if dt_inicial is None:
+        escala = atol + rtol * np.abs(y)
+        d0 = np.sqrt(np.mean((y / escala) ** 2))
+        d1 = np.sqrt(np.mean((f / escala) ** 2))
+        dt_inicial = 1e-6 if d0 < 1e-5 or d1 < 1e-5 else 0.01 * d0 / d1
+    h = min(dt_inicial, dt_max, t_final - t0)
+
+    k = np.empty((7, len(y)))
+    pasos = 0
+    while t < t_final:
+        h = min(h, t_final - t)
+        k[0] = f
+        for i in range(1, 7):
+            k[i] = fun(t + _C[i] * h, y + h * np.dot(_A[i], k[:i]))
+        evaluaciones += 6
+        y_nuevo = y + h * np.dot(_B5, k)
+        error = h * np.dot(_B5 - _B4, k)
+
+        escala = atol + rtol * np.maximum(np.abs(y), np.abs(y_nuevo))
+        norma = np.sqrt(np.mean((error / escala) ** 2))
+        if norma > 1:
+            h *= max(0.2, 0.9 * norma ** (-1 / 5))
+            continue
+
+        pasos += 1
+        f_nuevo = k[6]
+        t_terminal = _revisar_eventos(eventos, encontrados, t, y, f, t + h, y_nuevo, f_nuevo)
+        if t_terminal is not None:
+            y_evento = _hermite(t, y, f, t + h, y_nuevo, f_nuevo, t_terminal)
+            tiempos, estados = _agregar(tiempos, estados, n, t_terminal, y_evento)
+            n += 1
+            break
+
+        t, y, f = t + h, y_nuevo, f_nuevo.copy()
+        tiempos, estados = _agregar(tiempos, estados, n, t, y)
+        n += 1
+        factor = 5.0 if norma == 0 else min(5.0, 0.9 * norma ** (-1 / 5))
+        h = min(h * factor, dt_max)
+
+    return Solucion(tiempos[:n].copy(), estados[:n].copy(), [np.array(e) for e in encontrados], pasos, evaluaciones)
+
+
+# Integradores simplecticos para x'' = aceleracion(t, x)
+
+# Trayectoria de un integrador simplectico y su error de energia acumulado
+Trayectoria = namedtuple("Trayectoria", ["t", "x", "v", "error_energia", "pasos", "evaluaciones"])
+
+# Coeficientes de Yoshida de orden 4 (composicion triple de leapfrog)
+_W1 = 1 / (2 - 2 ** (1 / 3))
+_W0 = -(2 ** (1 / 3)) / (2 - 2 ** (1 / 3))
+_YOSHIDA_C = (_W1 / 2, (_W0 + _W1) / 2, (_W0 + _W1) / 2, _W1 / 2)
+_YOSHIDA_D = (_W1, _W0, _W1)
+
+
+def integrar_simplectico(aceleracion, t_span, x0, v0, dt, metodo="verlet", energia=None):
+    """
+    Integra x'' = aceleracion(t, x) con un esquema de paso fijo.
+
+    Args:
+        aceleracion (callable): a(t, x), solo dependiente de la posicion.
+        t_span (tuple): Intervalo (t0, t_final).
+        x0 (array_like): Posicion inicial.
+        v0 (array_like): Velocidad inicial.
+        dt (float): Paso de tiempo.
+        metodo (str, optional): "euler" (Euler semi-implicito, como en
+            continuo.py), "verlet" (velocity-Verlet / leapfrog, orden 2) o
+            "yoshida4" (Yoshida, orden 4).
+        energia (callable, optional): E(x, v); si se da, se acumula el error
+            relativo |E - E0| / |E0| en cada paso.
+    Returns:
+        Trayectoria: Tiempos, posiciones, velocidades, error relativo de
+        energia por paso (o None), pasos y evaluaciones de la aceleracion.
+    """
+    t0, t_final = t_span
+    x = np.atleast_1d(np.array(x0, dtype=float))
+    v = np.atleast_1d(np.array(v0, dtype=float))
+    pasos = int(np.ceil((t_final - t0) / dt - 1e-12))
+
+    tiempos = t0 + dt * np.arange(pasos + 1)
+    tiempos[-1] = min(tiempos[-1], t_final)
+    xs = np.empty((pasos + 1, len(x)))
+    vs = np.empty((pasos + 1, len(v)))
+    xs[0], vs[0] = x, v
+    evaluaciones = 0
+
+    if metodo == "verlet":
+        a = aceleracion(t0, x)
+        evaluaciones += 1
+    for j in range(pasos):
+        t = tiempos[j]
+        h = tiempos[j + 1] - t
+        if metodo == "euler":
+            v = v + h * aceleracion(t, x)
+            x = x + h * v
+            evaluaciones += 1
+        elif metodo == "verlet":
+            # La aceleracion del final del paso se reutiliza en el siguiente
+            v_medio = v + h / 2 * a
+            x = x + h * v_medio
+            a = aceleracion(t + h, x)
+            v = v_medio + h / 2 * a
+            evaluaciones += 1
+        elif metodo == "yoshida4":
+            tau = t
+            for c, d in zip(_YOSHIDA_C, _YOSHIDA_D):
+                x = x + c * h * v
+                tau += c * h
+                v = v + d * h * aceleracion(tau, x)
+            x = x + _YOSHIDA_C[-1] * h * v
+            evaluaciones += 3
+        else:
+            raise ValueError(f"Metodo desconocido: {metodo}")
+        xs[j + 1], vs[j + 1] = x, v
+
+    error = None
+    if energia is not None:
+        E = np.array([energia(xs[j], vs[j]) for j in range(pasos + 1)], dtype=float)
+        E0 = E[0] if E[0] != 0 else 1.0
+        error = np.abs(E - E[0]) / abs(E0)
+    return Trayectoria(tiempos, xs, vs, error, pasos, evaluaciones)
+
+
+def paso_maximo(aceleracion, energia, t_span, x0, v0, tolerancia, metodo="verlet", dt_inicial=1e-2, max_iter=30):
+    """
+    Busca el mayor paso cuyo error relativo de energia no supera la tolerancia.
+
+    Duplica o reduce a la mitad dt_inicial hasta encerrar el limite, por lo
+    que el resultado queda dentro de un factor 2 del paso optimo.
+
+    Returns:
+        tuple: Paso elegido y la Trayectoria obtenida con el.
+    """
+    dt = dt_inicial
+    trayectoria = integrar_simplectico(aceleracion, t_span, x0, v0, dt, metodo, energia)
+    if trayectoria.error_energia.max() <= tolerancia:
+        # Crecer mientras se cumpla la tolerancia
+        for _ in range(max_iter):
+            candidata = integrar_simplectico(aceleracion, t_span, x0, v0, 2 * dt, metodo, energia)
+            if candidata.error_energia.max() > tolerancia or 2 * dt > t_span[1] - t_span[0]:
+                break
+            dt, trayectoria = 2 * dt, candidata
+        return dt, trayectoria
+
+    # Reducir hasta cumplir la tolerancia
+    for _ in range(max_iter):
+        dt /= 2
+        trayectoria = integrar_simplectico(aceleracion, t_span, x0, v0, dt, metodo, energia)
+        if trayectoria.error_energia.max() <= tolerancia:
+            return dt, trayectoria
+    raise ValueError("No se encontro un paso que cumpla la tolerancia de energia.")
+
+
+# Terminos de fuerza opcionales para el lanzamiento vertical
+
+def arrastre_lineal(b):
+    """
+    Fuerza de arrastre viscoso F = -b v.
+    """
+    return lambda t, y, v, m: -b * v
+
+
+def arrastre_cuadratico(c):
+    """
+    Fuerza de arrastre aerodinamico F = -c v |v|.
+    """
+    return lambda t, y, v, m: -c * v * abs(v)
+
+
+def sistema_proyectil(g, fuerzas=(), tasa_masa=None, velocidad_escape=0.0):
+    """
+    Lado derecho del lanzamiento vertical con estado [y, v, m].
+
+    Args:
+        g (float): Aceleracion de la gravedad.
+        fuerzas (iterable, optional): Fuerzas extra F(t, y, v, m), por
+            ejemplo arrastre_lineal() o arrastre_cuadratico().
+        tasa_masa (callable, optional): dm/dt = tasa_masa(t, m); None para
+            masa constante.
+        velocidad_escape (float, optional): Velocidad relativa de la masa
+            expulsada; aporta el empuje -velocidad_escape * dm/dt.
+    """
+    def fun(t, estado):
+        y, v, m = estado
+        fuerza = sum(F(t, y, v, m) for F in fuerzas)
+        dm = 0.0 if tasa_masa is None else tasa_masa(t, m)
+        fuerza -= velocidad_escape * dm
+        return np.array([v, -g + fuerza / m, dm])
+    return fun
+
+
+def apice():
+    """
+    Evento terminal de altura maxima (v pasa de positiva a negativa).
+    """
+    return evento(lambda t, estado: estado[1], terminal=True, direccion=-1)
+
+
+def impacto():
+    """
+    Evento terminal de llegada al suelo (y pasa de positiva a negativa).
+    """
+    return evento(lambda t, estado: estado[0], terminal=True, direccion=-1)
+
+
+def energias(estado, g):
+    """
+    Energias cinetica, potencial y mecanica a lo largo de una trayectoria.
+    """
+    y, v, m = estado[:, 0], estado[:, 1], estado[:, 2]
+    EK = 0.5 * m * v**2
+    EP = m * g * y
+    return EK, EP, EK + EP
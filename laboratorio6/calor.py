@@ -1,16 +1,152 @@
+import time
 import numpy as np
 import matplotlib.pyplot as plt
 from mpl_toolkits.mplot3d import Axes3D
 from matplotlib import cm
+from scipy.linalg.lapack import dgttrf, dgttrs
 
-def calor(f, alfa, beta, a, b, c, h, k):
+from frontera import Robin, aplicar_frontera, coeficientes_robin, tabla_frontera
+
+def thomas_factorizar(inferior, diagonal, superior):
+    """
+    Factoriza una matriz tridiagonal para el algoritmo de Thomas.
+
+    calor_nd la usa con _thomas_lotes para resolver todas las lineas de la
+    malla a la vez; en 1D se usa factorizar_tridiagonal.
+
+    Args:
+        inferior (numpy.ndarray): Subdiagonal (longitud n - 1).
+        diagonal (numpy.ndarray): Diagonal principal (longitud n).
+        superior (numpy.ndarray): Superdiagonal (longitud n - 1).
+    Returns:
+        tuple: Superdiagonal modificada, pivotes y subdiagonal original.
+    """
+    n = len(diagonal)
+    superior_mod = np.zeros(max(n - 1, 0))
+    pivotes = np.zeros(n)
+    pivotes[0] = diagonal[0]
+    for i in range(1, n):
+        superior_mod[i - 1] = superior[i - 1] / pivotes[i - 1]
+        pivotes[i] = diagonal[i] - inferior[i - 1] * superior_mod[i - 1]
+    return superior_mod, pivotes, np.asarray(inferior, dtype=float)
+
+
+def factorizar_tridiagonal(inferior, diagonal, superior):
+    """
+    Factorizacion LU de una matriz tridiagonal con LAPACK (gttrf).
+
+    Se calcula una sola vez fuera del bucle temporal; cada paso resuelve
+    despues con una sola llamada compilada a resolver_tridiagonal.
+
+    Returns:
+        tuple: Factores de gttrf (dl, d, du, du2, ipiv).
+    """
+    *factor, info = dgttrf(inferior, diagonal, superior)
+    if info != 0:
+        raise np.linalg.LinAlgError("La matriz tridiagonal es singular.")
+    return tuple(factor)
+
+
+def resolver_tridiagonal(factor, d):
+    """
+    Resuelve el sistema tridiagonal factorizado con el termino independiente d.
+    """
+    x, info = dgttrs(*factor, d)
+    return x
+
+
+def _paso_calor(metodo, n, r, h, izquierda, derecha):
+    """
+    Construye la funcion que avanza un nivel de tiempo completo.
+
+    La funcion devuelta recibe el nivel actual, el siguiente y los valores
+    de frontera g(t_{j+1}) de cada extremo; rellena los puntos interiores y
+    luego los bordes (Dirichlet o Robin/Neumann).
+    """
+    def fijar_bordes(siguiente, g_izq, g_der):
+        aplicar_frontera(siguiente, izquierda, g_izq, h, 0)
+        aplicar_frontera(siguiente, derecha, g_der, h, -1)
+
+    if metodo == "bucle":
+        def paso(actual, siguiente, g_izq, g_der):
+            for i in range(1, n - 1):
+                siguiente[i] = actual[i] + r * (actual[i + 1] - 2 * actual[i] + actual[i - 1])
+            fijar_bordes(siguiente, g_izq, g_der)
+        return paso
+
+    if metodo == "explicito":
+        def paso(actual, siguiente, g_izq, g_der):
+            siguiente[1:-1] = actual[1:-1] + r * (actual[2:] - 2 * actual[1:-1] + actual[:-2])
+            fijar_bordes(siguiente, g_izq, g_der)
+        return paso
+
+    if metodo in ("implicito", "crank-nicolson"):
+        # Esquema theta: theta = 1 (Euler hacia atras), theta = 1/2 (Crank-Nicolson)
+        theta = 1.0 if metodo == "implicito" else 0.5
+        interior = n - 2
+        if interior <= 0:
+            return lambda actual, siguiente, g_izq, g_der: fijar_bordes(siguiente, g_izq, g_der)
+        robin_izq = isinstance(izquierda, Robin)
+        robin_der = isinstance(derecha, Robin)
+        if (robin_izq or robin_der) and interior < 2:
+            raise ValueError("Las condiciones de Robin/Neumann implicitas requieren al menos 2 puntos interiores.")
+
+        diagonal = np.full(interior, 1 + 2 * theta * r)
+        inferior = np.full(interior - 1, -theta * r)
+        superior = np.full(interior - 1, -theta * r)
+        # Un borde Robin se expresa con los dos primeros puntos interiores
+        # (u_0 = c0*g + c1*u_1 + c2*u_2), asi la matriz sigue tridiagonal
+        if robin_izq:
+            c0_izq, c1, c2 = coeficientes_robin(izquierda, h)
+            diagonal[0] -= theta * r * c1
+            superior[0] -= theta * r * c2
+        if robin_der:
+            c0_der, c1, c2 = coeficientes_robin(derecha, h)
+            diagonal[-1] -= theta * r * c1
+            inferior[-1] -= theta * r * c2
+        factor = factorizar_tridiagonal(inferior, diagonal, superior)
+
+        def paso(actual, siguiente, g_izq, g_der):
+            d = actual[1:-1] + (1 - theta) * r * (actual[2:] - 2 * actual[1:-1] + actual[:-2])
+            # Los valores de frontera en t_{j+1} pasan al termino independiente
+            d[0] += theta * r * (c0_izq * g_izq if robin_izq else g_izq)
+            d[-1] += theta * r * (c0_der * g_der if robin_der else g_der)
+            siguiente[1:-1] = resolver_tridiagonal(factor, d)
+            fijar_bordes(siguiente, g_izq, g_der)
+        return paso
+
+    raise ValueError(f"Metodo desconocido: {metodo}")
+
+
+def calor(f, alfa, beta, a, b, c, h, k, metodo="explicito"):
+    """
+    Resuelve la ecuacion del calor u_t = c u_xx en [0, a] x [0, b].
+
+    Args:
+        f (callable): Temperatura inicial u(x, 0).
+        alfa: Frontera izquierda. Dirichlet u(0, t) como funcion (escalar o
+            vectorizada), arreglo con un valor por tiempo o constante; o una
+            condicion frontera.neumann(...) / frontera.robin(...).
+        beta: Frontera derecha, con las mismas opciones que alfa.
+        a (float): Longitud del dominio espacial.
+        b (float): Tiempo total.
+        c (float): Coeficiente de difusion.
+        h (float): Paso espacial.
+        k (float): Paso temporal.
+        metodo (str, optional): "explicito" (FTCS vectorizado, por defecto),
+            "bucle" (FTCS con el doble bucle original), "implicito"
+            (Euler hacia atras) o "crank-nicolson". Los dos ultimos son
+            incondicionalmente estables y no exigen c*k/h^2 <= 0.5.
+    Returns:
+        numpy.ndarray: Matriz (n, m) con la solucion en cada punto y tiempo.
+    """
     # Definir el numero de pasos espaciales (n) y temporales (m)
     n = int(a / h) + 1
     m = int(b / k) + 1
-    
+
     # Parametro de estabilidad
     r = c * k / (h**2)
-    if r > 0.5:
+    if metodo in ("explicito", "bucle") and r > 0.5:
         raise ValueError("El esquema es inestable. Asegurate de que c*k/h^2 <= 0.5.")
 
     # Inicializar la matriz u para almacenar los valores de la solucion
@@ -18,20 +154,84 @@ def calor(f, alfa, beta, a, b, c, h, k):
 
     # Condiciones iniciales en el tiempo t=0
     u[:, 0] = f(np.arange(0, n) * h)
-    
-    # Condiciones en la frontera (para todas las filas en los extremos de x)
-    for j in range(m):
-        u[0, j] = alfa(j * k)   # Frontera izquierda
-        u[-1, j] = beta(j * k)  # Frontera derecha
 
-    # Calcular la solucion usando diferencias finitas
+    # Condiciones en la frontera evaluadas sobre toda la malla temporal
+    t = np.arange(0, m) * k
+    g_izq = tabla_frontera(alfa, t)
+    g_der = tabla_frontera(beta, t)
+    aplicar_frontera(u[:, 0], alfa, g_izq[0], h, 0)
+    aplicar_frontera(u[:, 0], beta, g_der[0], h, -1)
+
+    # Calcular la solucion usando diferencias finitas, un nivel por paso
+    paso = _paso_calor(metodo, n, r, h, alfa, beta)
     for j in range(0, m - 1):
-        for i in range(1, n - 1):
-            u[i, j + 1] = u[i, j] + r * (u[i + 1, j] - 2 * u[i, j] + u[i - 1, j])
-    
+        paso(u[:, j], u[:, j + 1], g_izq[j + 1], g_der[j + 1])
+
     return u
 
 
+def calor_stream(f, alfa, beta, a, b, c, h, k, metodo="explicito", cada=1):
+    """
+    Version en flujo de calor(): solo guarda dos niveles de tiempo.
+
+    En lugar de la matriz (n, m) completa usa un buffer circular de 2 filas
+    y entrega una instantanea cada `cada` pasos (y siempre la ultima), por
+    lo que la memoria crece con n y no con n*m.
+
+    Yields:
+        tuple: Indice temporal j, tiempo t_j y copia de la fila u(x, t_j).
+    """
+    n = int(a / h) + 1
+    m = int(b / k) + 1
+
+    r = c * k / (h**2)
+    if metodo in ("explicito", "bucle") and r > 0.5:
+        raise ValueError("El esquema es inestable. Asegurate de que c*k/h^2 <= 0.5.")
+    paso = _paso_calor(metodo, n, r, h, alfa, beta)
+    t = np.arange(0, m) * k
+    g_izq = tabla_frontera(alfa, t)
+    g_der = tabla_frontera(beta, t)
+
+    # Buffer circular con el nivel actual y el siguiente
+    niveles = np.zeros((2, n))
+    niveles[0] = f(np.arange(0, n) * h)
+    aplicar_frontera(niveles[0], alfa, g_izq[0], h, 0)
+    aplicar_frontera(niveles[0], beta, g_der[0], h, -1)
+    yield 0, 0.0, niveles[0].copy()
+
+    for j in range(0, m - 1):
+        actual = niveles[j % 2]
+        siguiente = niveles[(j + 1) % 2]
+        paso(actual, siguiente, g_izq[j + 1], g_der[j + 1])
+        # El ultimo nivel se entrega siempre, aunque m - 1 no sea multiplo de cada
+        if (j + 1) % cada == 0 or j + 1 == m - 1:
+            yield j + 1, (j + 1) * k, siguiente.copy()
+
+
+def benchmark_calor(f, alfa, beta, a, b, c, h, k, metodos=("bucle", "explicito", "implicito", "crank-nicolson"), repeticiones=3):
+    """
+    Mide el tiempo de calor() con cada metodo sobre los mismos parametros.
+
+    Returns:
+        dict: Mejor tiempo (s) y aceleracion respecto al primer metodo, por metodo.
+    """
+    tiempos = {}
+    for metodo in metodos:
+        mejor = float("inf")
+        for _ in range(repeticiones):
+            inicio = time.perf_counter()
+            calor(f, alfa, beta, a, b, c, h, k, metodo=metodo)
+            mejor = min(mejor, time.perf_counter() - inicio)
+        tiempos[metodo] = mejor
+
+    referencia = tiempos[metodos[0]]
+    resultados = {}
+    for metodo, t in tiempos.items():
+        resultados[metodo] = {"tiempo": t, "aceleracion": referencia / t}
+        print(f"{metodo:>15}: {t:.4f} s (x{referencia / t:.1f})")
+    return resultados
+
+
 # Caso 1: Condicion inicial senoidal
 def f_senoidal(x):
     # Funcion senoidal de temperatura inicial
@@ -54,46 +254,50 @@ def beta(t):
     return 0
 
 
-# Parametros comunes
-a = 1      # Longitud del dominio espacial
-b = 1      # Tiempo total
-c = 1      # Coeficiente de difusion
-h = 0.1    # Tamano del paso en x
-k = 0.005  # Tamano del paso en t
+if __name__ == "__main__":
+    # Parametros comunes
+    a = 1      # Longitud del dominio espacial
+    b = 1      # Tiempo total
+    c = 1      # Coeficiente de difusion
+    h = 0.1    # Tamano del paso en x
+    k = 0.005  # Tamano del paso en t
+
+    # Ejecutar la funcion y obtener la solucion para el caso 1 (senoidal)
+    u_senoidal = calor(f_senoidal, alfa, beta, a, b, c, h, k)
 
-# Ejecutar la funcion y obtener la solucion para el caso 1 (senoidal)
-u_senoidal = calor(f_senoidal, alfa, beta, a, b, c, h, k)
+    # Ejecutar la funcion y obtener la solucion para el caso 2 (gaussiana)
+    u_gaussiana = calor(f_gaussiana, alfa, beta, a, b, c, h, k)
 
-# Ejecutar la funcion y obtener la solucion para el caso 2 (gaussiana)
-u_gaussiana = calor(f_gaussiana, alfa, beta, a, b, c, h, k)
+    # Comparar el tiempo de cada metodo en una malla mas fina
+    benchmark_calor(f_senoidal, alfa, beta, a, b, c, 0.02, 0.0002)
 
-# Graficar el mapa de calor en 3D para el caso senoidal
-fig = plt.figure()
-ax = fig.add_subplot(121, projection='3d')
+    # Graficar el mapa de calor en 3D para el caso senoidal
+    fig = plt.figure()
+    ax = fig.add_subplot(121, projection='3d')
 
-x = np.linspace(0, a, u_senoidal.shape[0])
-t = np.linspace(0, b, u_senoidal.shape[1])
-X, T = np.meshgrid(t, x)
+    x = np.linspace(0, a, u_senoidal.shape[0])
+    t = np.linspace(0, b, u_senoidal.shape[1])
+    X, T = np.meshgrid(t, x)
 
-# Dibujar la superficie para el caso senoidal
-ax.plot_surface(X, T, u_senoidal, cmap=cm.jet)
-ax.set_xlabel('Tiempo')
-ax.set_ylabel('Posicion')
-ax.set_zlabel('Temperatura')
-ax.set_title("Caso 1: Condicion Inicial Senoidal")
+    # Dibujar la superficie para el caso senoidal
+    ax.plot_surface(X, T, u_senoidal, cmap=cm.jet)
+    ax.set_xlabel('Tiempo')
+    ax.set_ylabel('Posicion')
+    ax.set_zlabel('Temperatura')
+    ax.set_title("Caso 1: Condicion Inicial Senoidal")
 
-# Graficar el mapa de calor en 3D para el caso gaussiano
-ax2 = fig.add_subplot(122, projection='3d')
+    # Graficar el mapa de calor en 3D para el caso gaussiano
+    ax2 = fig.add_subplot(122, projection='3d')
 
-# Dibujar la superficie para el caso gaussiano
-ax2.plot_surface(X, T, u_gaussiana, cmap=cm.jet)
-ax2.set_xlabel('Tiempo')
-ax2.set_ylabel('Posicion')
-ax2.set_zlabel('Temperatura')
-ax2.set_title("Caso 2: Condicion Inicial Gaussiana")
+    # Dibujar la superficie para el caso gaussiano
+    ax2.plot_surface(X, T, u_gaussiana, cmap=cm.jet)
+    ax2.set_xlabel('Tiempo')
+    ax2.set_ylabel('Posicion')
+    ax2.set_zlabel('Temperatura')
+    ax2.set_title("Caso 2: Condicion Inicial Gaussiana")
 
-# Ajustar el layout de los graficos
-plt.tight_layout()
+    # Ajustar el layout de los graficos
+    plt.tight_layout()
 
-# Mostrar los graficos
-plt.show()
+    # Mostrar los graficos
+    plt.show()
@@ -0,0 +1,221 @@
+import time
+import numpy as np
+import scipy.sparse as sp
+from scipy.sparse.linalg import factorized
+
+from calor import thomas_factorizar
+
+
+def _interior(d):
+    """
+    Indice de los puntos interiores de una malla de d dimensiones.
+    """
+    return (slice(1, -1),) * d
+
+
+def _laplaciano(u):
+    """
+    Suma de segundas diferencias (sin dividir por h^2) en los puntos interiores.
+    """
+    d = u.ndim
+    centro = u[_interior(d)]
+    lap = -2 * d * centro
+    for eje in range(d):
+        adelante = list(_interior(d))
+        atras = list(_interior(d))
+        adelante[eje] = slice(2, None)
+        atras[eje] = slice(None, -2)
+        lap = lap + u[tuple(adelante)] + u[tuple(atras)]
+    return lap
+
+
+def _thomas_lotes(factor, d, eje):
+    """
+    Resuelve a la vez todos los sistemas tridiagonales a lo largo de un eje.
+
+    El barrido de Thomas es secuencial en el eje, pero cada paso opera sobre
+    todas las lineas de la malla con una sola operacion vectorizada.
+    """
+    superior_mod, pivotes, inferior = factor
+    y = np.moveaxis(d, eje, 0).copy()
+    n = len(pivotes)
+    y[0] /= pivotes[0]
+    for i in range(1, n):
+        y[i] = (y[i] - inferior[i - 1] * y[i - 1]) / pivotes[i]
+    for i in range(n - 2, -1, -1):
+        y[i] -= superior_mod[i] * y[i + 1]
+    return np.moveaxis(y, 0, eje)
+
+
+def _segunda_diferencia(u, eje):
+    """
+    Segunda diferencia a lo largo de un eje, evaluada en los puntos interiores.
+    """
+    d = u.ndim
+    centro = list(_interior(d))
+    adelante = list(_interior(d))
+    atras = list(_interior(d))
+    adelante[eje] = slice(2, None)
+    atras[eje] = slice(None, -2)
+    return u[tuple(adelante)] - 2 * u[tuple(centro)] + u[tuple(atras)]
+
+
+def _matriz_laplaciano(forma_interior):
+    """
+    Laplaciano discreto (sin dividir por h^2) sobre los puntos interiores,
+    construido como suma de productos de Kronecker de matrices 1D.
+    """
+    d = len(forma_interior)
+    identidades = [sp.identity(n, format="csr") for n in forma_interior]
+    A = sp.csr_matrix((int(np.prod(forma_interior)),) * 2)
+    for eje, n in enumerate(forma_interior):
+        T = sp.diags([np.ones(n - 1), -2 * np.ones(n), np.ones(n - 1)], [-1, 0, 1], format="csr")
+        termino = None
+        for otro in range(d):
+            bloque = T if otro == eje else identidades[otro]
+            termino = bloque if termino is None else sp.kron(termino, bloque, format="csr")
+        A = A + termino
+    return A.tocsc()
+
+
+def calor_nd(f, frontera, longitudes, b, c, h, k, metodo="explicito", callback=None, cada=1):
+    """
+    Resuelve la ecuacion del calor u_t = c (u_xx + u_yy [+ u_zz]) en 2D o 3D.
+
+    Extiende calor() a placas y volumenes con condiciones de Dirichlet. Solo
+    se guarda el nivel de tiempo actual; las instantaneas intermedias se
+    pueden recibir con un callback.
+
+    Args:
+        f (callable): Temperatura inicial f(x, y[, z]); recibe mallas
+            dispersas y debe admitir broadcasting.
+        frontera (callable): Valor en la frontera frontera(t, x, y[, z]),
+            evaluado sobre los puntos del borde de la malla.
+        longitudes (tuple): Longitud del dominio en cada eje (2 o 3 valores).
+        b (float): Tiempo total.
+        c (float): Coeficiente de difusion.
+        h (float): Paso espacial (igual en todos los ejes).
+        k (float): Paso temporal.
+        metodo (str, optional): "explicito" (stencil por slicing, requiere
+            d*c*k/h^2 <= 0.5), "adi" (direcciones alternadas de Douglas con
+            Thomas por lotes), "implicito" (Euler hacia atras) o
+            "crank-nicolson" (matriz dispersa factorizada una sola vez).
+        callback (callable, optional): callback(j, t, u) cada `cada` pasos.
+        cada (int, optional): Frecuencia del callback.
+    Returns:
+        numpy.ndarray: Solucion en el tiempo final con forma (n_x, n_y[, n_z]).
+    """
+    d = len(longitudes)
+    if d not in (2, 3):
+        raise ValueError("Solo se admiten dominios de 2 o 3 dimensiones.")
+
+    forma = tuple(int(L / h) + 1 for L in longitudes)
+    m = int(b / k) + 1
+    r = c * k / (h**2)
+    if metodo == "explicito" and d * r > 0.5:
+        raise ValueError(f"El esquema es inestable. Asegurate de que {d}*c*k/h^2 <= 0.5.")
+
+    # Mallas dispersas para evaluar f y la frontera sin materializar d copias
+    mallas = np.meshgrid(*[np.arange(n) * h for n in forma], indexing="ij", sparse=True)
+    borde = np.ones(forma, dtype=bool)
+    borde[_interior(d)] = False
+    coordenadas_borde = [np.broadcast_to(X, forma)[borde] for X in mallas]
+
+    u = np.zeros(forma)
+    u[...] = f(*mallas)
+    u[borde] = frontera(0, *coordenadas_borde)
+    interior = _interior(d)
+
+    if metodo == "explicito":
+        def paso(u, t_siguiente):
+            u[interior] = u[interior] + r * _laplaciano(u)
+            u[borde] = frontera(t_siguiente, *coordenadas_borde)
+
+    elif metodo == "adi":
+        # Douglas: un sistema tridiagonal por eje, factorizado una sola vez
+        factores = []
+        for n in forma:
+            diagonal = np.full(n - 2, 1 + r)
+            lateral = np.full(n - 3, -r / 2)
+            factores.append(thomas_factorizar(lateral, diagonal, lateral))
+
+        def paso(u, t_siguiente):
+            anterior = u.copy()
+            u[borde] = frontera(t_siguiente, *coordenadas_borde)
+            # Los valores de frontera del nuevo nivel van al termino independiente
+            solo_borde = u.copy()
+            solo_borde[interior] = 0
+            v = anterior[interior] + r * _laplaciano(anterior)
+            for eje in range(d):
+                v = v - (r / 2) * _segunda_diferencia(anterior, eje)
+                v = v + (r / 2) * _segunda_diferencia(solo_borde, eje)
+                u[interior] = _thomas_lotes(factores[eje], v, eje)
+                v = u[interior]
+
+    elif metodo in ("implicito", "crank-nicolson"):
+        theta = 1.0 if metodo == "implicito" else 0.5
+        forma_interior = tuple(n - 2 for n in forma)
+        A = _matriz_laplaciano(forma_interior)
+        I = sp.identity(A.shape[0], format="csc")
+        resolver = factorized((I - theta * r * A).tocsc())
+        B = (I + (1 - theta) * r * A).tocsr()
+
+        def aporte_frontera(u):
+            # Contribucion de los valores de frontera al stencil interior
+            solo_borde = u.copy()
+            solo_borde[interior] = 0
+            return _laplaciano(solo_borde).ravel()
+
+        def paso(u, t_siguiente):
+            rhs = B @ u[interior].ravel() + (1 - theta) * r * aporte_frontera(u)
+            u[borde] = frontera(t_siguiente, *coordenadas_borde)
+            rhs += theta * r * aporte_frontera(u)
+            u[interior] = resolver(rhs).reshape(forma_interior)
+
+    else:
+        raise ValueError(f"Metodo desconocido: {metodo}")
+
+    if callback is not None:
+        callback(0, 0.0, u)
+    for j in range(0, m - 1):
+        paso(u, (j + 1) * k)
+        if callback is not None and (j + 1) % cada == 0:
+            callback(j + 1, (j + 1) * k, u)
+
+    return u
+
+
+def benchmark_calor_nd(f, frontera, longitudes, b, c, h, k, metodos=("explicito", "adi", "implicito")):
+    """
+    Mide las celdas actualizadas por segundo de calor_nd() con cada metodo.
+
+    Returns:
+        dict: Tiempo (s) y celdas por segundo, por metodo.
+    """
+    forma = tuple(int(L / h) + 1 for L in longitudes)
+    pasos = int(b / k)
+    celdas = int(np.prod([n - 2 for n in forma])) * pasos
+
+    resultados = {}
+    for metodo in metodos:
+        inicio = time.perf_counter()
+        calor_nd(f, frontera, longitudes, b, c, h, k, metodo=metodo)
+        t = time.perf_counter() - inicio
+        resultados[metodo] = {"tiempo": t, "celdas_por_segundo": celdas / t}
+        print(f"{metodo:>15}: {t:.3f} s, {celdas / t:.3e} celdas/s")
+    return resultados
+
+
+# Placa con condicion inicial senoidal y bordes a temperatura 0
+def f_placa(x, y):
+    return np.sin(np.pi * x) * np.sin(np.pi * y)
+
+def frontera_cero(t, *coordenadas):
+    return 0
+
+
+if __name__ == "__main__":
+    # Placa de 1x1 con 129^2 puntos; el explicito necesita 2*c*k/h^2 <= 0.5
+    h = 1 / 128
+    benchmark_calor_nd(f_placa, frontera_cero, (1, 1), 0.01, 1, h, 0.25 * h**2, metodos=("explicito",))
+    benchmark_calor_nd(f_placa, frontera_cero, (1, 1), 0.01, 1, h, 1e-4, metodos=("adi", "implicito", "crank-nicolson"))
@@ -0,0 +1,42 @@
+import numpy as np
+
+
+def contar_snapshots(b, k, cada=1):
+    """
+    Numero de instantaneas que entrega un solver en flujo sobre [0, b]
+    (la inicial, una cada `cada` pasos y la ultima).
+    """
+    m = int(b / k) + 1
+    return -(-(m - 1) // cada) + 1
+
+
+def volcar_snapshots(snapshots, total, n, archivo=None, callback=None):
+    """
+    Consume un generador de instantaneas (calor_stream, ecuacion_onda_stream).
+
+    Args:
+        snapshots (iterable): Tuplas (j, t, fila) producidas por el solver.
+        total (int): Numero de instantaneas esperadas (ver contar_snapshots).
+        n (int): Numero de puntos espaciales de cada fila.
+        archivo (str, optional): Ruta de un archivo .npy que se escribe como
+            memoria mapeada de forma (total, n), sin cargarlo en RAM.
+        callback (callable, optional): Funcion callback(j, t, fila) llamada
+            con cada instantanea.
+    Returns:
+        tuple: Arreglo de tiempos y el memmap escrito (o None sin archivo).
+    """
+    tiempos = np.zeros(total)
+    salida = None
+    if archivo is not None:
+        salida = np.lib.format.open_memmap(archivo, mode="w+", dtype=np.float64, shape=(total, n))
+
+    for indice, (j, t, fila) in enumerate(snapshots):
+        tiempos[indice] = t
+        if salida is not None:
+            salida[indice] = fila
+        if callback is not None:
+            callback(j, t, fila)
+
+    if salida is not None:
+        salida.flush()
+    return tiempos, salida
@@ -0,0 +1,77 @@
+from collections import namedtuple
+
+import numpy as np
+
+# Condicion de Robin a*u + b*du/dn = g(t), con du/dn la derivada normal exterior
+Robin = namedtuple("Robin", ["a", "b", "g"])
+
+
+def neumann(g):
+    """
+    Condicion de Neumann du/dn = g(t) (flujo impuesto en el extremo).
+    """
+    return Robin(0.0, 1.0, g)
+
+
+def robin(a, b, g):
+    """
+    Condicion de Robin a*u + b*du/dn = g(t).
+    """
+    return Robin(a, b, g)
+
+
+def tabla_frontera(valor, t):
+    """
+    Evalua una condicion de frontera sobre toda la malla temporal de una vez.
+
+    Args:
+        valor: Constante, arreglo ya calculado con un valor por tiempo,
+            funcion g(t) (vectorizada o escalar) o una condicion Robin.
+        t (numpy.ndarray): Malla temporal.
+    Returns:
+        numpy.ndarray: Valor de la frontera (o de g para Robin) en cada t.
+    """
+    if isinstance(valor, Robin):
+        valor = valor.g
+
+    if callable(valor):
+        try:
+            resultado = valor(t)
+        except (TypeError, ValueError):
+            # Funciones que solo aceptan escalares (math.sin, if t < ...)
+            resultado = [valor(ti) for ti in t]
+        return np.broadcast_to(np.asarray(resultado, dtype=float), t.shape).copy()
+
+    tabla = np.asarray(valor, dtype=float)
+    if tabla.ndim == 0:
+        return np.full(t.shape, float(tabla))
+    if tabla.shape != t.shape:
+        raise ValueError(f"La tabla de frontera debe tener {len(t)} valores, tiene {tabla.shape}.")
+    return tabla
+
+
+def coeficientes_robin(condicion, h):
+    """
+    Coeficientes (c0, c1, c2) tales que el valor en el borde es
+    u_0 = c0*g + c1*u_1 + c2*u_2, usando una derivada de segundo orden
+    descentrada hacia el interior.
+    """
+    denominador = condicion.a + 3 * condicion.b / (2 * h)
+    if denominador == 0:
+        raise ValueError("Condicion de Robin degenerada: a + 3b/(2h) no puede ser 0.")
+    return 1 / denominador, 2 * condicion.b / (h * denominador), -condicion.b / (2 * h * denominador)
+
+
+def aplicar_frontera(fila, condicion, g, h, lado):
+    """
+    Asigna el valor de frontera en un extremo (lado 0 o -1) del ultimo eje.
+
+    Para Dirichlet se copia g; para Robin/Neumann el valor se despeja a
+    partir de los puntos interiores ya actualizados.
+    """
+    if not isinstance(condicion, Robin):
+        fila[..., lado] = g
+        return
+    c0, c1, c2 = coeficientes_robin(condicion, h)
+    paso = 1 if lado == 0 else -1
+    fila[..., lado] = c0 * g + c1 * fila[..., lado + paso] + c2 * fila[..., lado + 2 * paso]
@@ -3,6 +3,8 @@ import matplotlib.pyplot as plt
 from mpl_toolkits.mplot3d import Axes3D
 from matplotlib import cm
 
+from frontera import aplicar_frontera, tabla_frontera
+
 def ecuacion_onda(f, g, alfa, beta, a, b, c, h, k):
     # Definir el numero de pasos espaciales (n) y temporales (m)
     n = int(a / h) + 1
@@ -22,18 +24,136 @@ def ecuacion_onda(f, g, alfa, beta, a, b, c, h, k):
     # Condiciones de velocidad inicial en t=0 (la primera derivada de u respecto al tiempo)
     u[:, 1] = u[:, 0] + k * g(np.arange(0, n) * h)
     
-    # Condiciones en la frontera (para todas las filas en los extremos de x)
-    for j in range(m):
-        u[0, j] = alfa(j * k)   # Frontera izquierda
-        u[-1, j] = beta(j * k)  # Frontera derecha
+    # Condiciones en la frontera evaluadas sobre toda la malla temporal
+    t = np.arange(0, m) * k
+    izquierda = tabla_frontera(alfa, t)
+    derecha = tabla_frontera(beta, t)
+    for j in range(min(m, 2)):
+        aplicar_frontera(u[:, j], alfa, izquierda[j], h, 0)
+        aplicar_frontera(u[:, j], beta, derecha[j], h, -1)
 
     # Calcular la solucion usando diferencias finitas para la ecuacion de onda
     for j in range(1, m - 1):
-        for i in range(1, n - 1):
-            u[i, j + 1] = 2 * u[i, j] - u[i, j - 1] + r**2 * (u[i + 1, j] - 2 * u[i, j] + u[i - 1, j])
+        u[1:-1, j + 1] = 2 * u[1:-1, j] - u[1:-1, j - 1] + r**2 * (u[2:, j] - 2 * u[1:-1, j] + u[:-2, j])
+        aplicar_frontera(u[:, j + 1], alfa, izquierda[j + 1], h, 0)
+        aplicar_frontera(u[:, j + 1], beta, derecha[j + 1], h, -1)
 
     return u
 
+
+def ecuacion_onda_stream(f, g, alfa, beta, a, b, c, h, k, cada=1):
+    """
+    Version en flujo de ecuacion_onda(): solo guarda tres niveles de tiempo.
+
+    Usa un buffer circular de 3 filas (anterior, actual y siguiente) y
+    entrega una instantanea cada `cada` pasos (y siempre la ultima), por lo
+    que la memoria crece con n y no con n*m.
+
+    Yields:
+        tuple: Indice temporal j, tiempo t_j y copia de la fila u(x, t_j).
+    """
+    n = int(a / h) + 1
+    m = int(b / k) + 1
+
+    r = c * k / h
+    if r > 1:
+        raise ValueError("El esquema es inestable. Asegurate de que c*k/h <= 1.")
+
+    # Buffer circular con los niveles j-1, j y j+1
+    niveles = np.zeros((3, n))
+    x = np.arange(0, n) * h
+    t = np.arange(0, m) * k
+    izquierda = tabla_frontera(alfa, t)
+    derecha = tabla_frontera(beta, t)
+    niveles[0] = f(x)
+    aplicar_frontera(niveles[0], alfa, izquierda[0], h, 0)
+    aplicar_frontera(niveles[0], beta, derecha[0], h, -1)
+    yield 0, 0.0, niveles[0].copy()
+    if m < 2:
+        return
+
+    niveles[1] = f(x) + k * g(x)
+    aplicar_frontera(niveles[1], alfa, izquierda[1], h, 0)
+    aplicar_frontera(niveles[1], beta, derecha[1], h, -1)
+    if 1 % cada == 0 or m == 2:
+        yield 1, k, niveles[1].copy()
+
+    for j in range(1, m - 1):
+        anterior = niveles[(j - 1) % 3]
+        actual = niveles[j % 3]
+        siguiente = niveles[(j + 1) % 3]
+        siguiente[1:-1] = 2 * actual[1:-1] - anterior[1:-1] + r**2 * (actual[2:] - 2 * actual[1:-1] + actual[:-2])
+        aplicar_frontera(siguiente, alfa, izquierda[j + 1], h, 0)
+        aplicar_frontera(siguiente, beta, derecha[j + 1], h, -1)
+        # El ultimo nivel se entrega siempre, aunque m - 1 no sea multiplo de cada
+        if (j + 1) % cada == 0 or j + 1 == m - 1:
+            yield j + 1, (j + 1) * k, siguiente.copy()
+
+def ecuacion_onda_lote(F, G, alfa, beta, a, b, c, h, k, historia=True):
+    """
+    Resuelve muchos escenarios de la ecuacion de onda a la vez.
+
+    Todos los escenarios comparten la malla y las fronteras, pero cada uno
+    tiene su propio desplazamiento inicial, velocidad inicial y velocidad de
+    propagacion. En cada paso se avanza el arreglo (lote, n) completo.
+
+    Args:
+        F (numpy.ndarray): Desplazamientos iniciales, forma (lote, n).
+        G (numpy.ndarray): Velocidades iniciales, forma (lote, n).
+        alfa: Frontera izquierda: funcion, tabla por tiempo, constante o
+            condicion frontera.neumann(...) / frontera.robin(...).
+        beta: Frontera derecha, con las mismas opciones que alfa.
+        a (float): Longitud del dominio espacial.
+        b (float): Tiempo total.
+        c (float or numpy.ndarray): Velocidad de propagacion (escalar o (lote,)).
+        h (float): Paso espacial.
+        k (float): Paso temporal.
+        historia (bool, optional): Si es False solo se devuelve el ultimo nivel.
+    Returns:
+        numpy.ndarray: Soluciones con forma (lote, n, m), o (lote, n) si
+        historia es False.
+    """
+    n = int(a / h) + 1
+    m = int(b / k) + 1
+
+    F = np.atleast_2d(np.asarray(F, dtype=float))
+    G = np.atleast_2d(np.asarray(G, dtype=float))
+    if F.shape != G.shape or F.shape[1] != n:
+        raise ValueError(f"F y G deben tener forma (lote, {n}).")
+    lote = F.shape[0]
+
+    # Parametro de estabilidad por escenario, como columna para el broadcasting
+    r = np.broadcast_to(np.asarray(c, dtype=float) * k / h, (lote,))[:, None]
+    if np.any(r > 1):
+        raise ValueError("El esquema es inestable. Asegurate de que c*k/h <= 1.")
+    r2 = r**2
+
+    # Niveles de tiempo en el primer eje: cada paso es un arreglo (lote, n)
+    niveles = np.zeros((m if historia else 3, lote, n))
+    t = np.arange(0, m) * k
+    izquierda = tabla_frontera(alfa, t)
+    derecha = tabla_frontera(beta, t)
+
+    niveles[0] = F
+    aplicar_frontera(niveles[0], alfa, izquierda[0], h, 0)
+    aplicar_frontera(niveles[0], beta, derecha[0], h, -1)
+    if m > 1:
+        niveles[1] = F + k * G
+        aplicar_frontera(niveles[1], alfa, izquierda[1], h, 0)
+        aplicar_frontera(niveles[1], beta, derecha[1], h, -1)
+
+    for j in range(1, m - 1):
+        anterior = niveles[j - 1] if historia else niveles[(j - 1) % 3]
+        actual = niveles[j] if historia else niveles[j % 3]
+        siguiente = niveles[j + 1] if historia else niveles[(j + 1) % 3]
+        siguiente[:, 1:-1] = 2 * actual[:, 1:-1] - anterior[:, 1:-1] + r2 * (actual[:, 2:] - 2 * actual[:, 1:-1] + actual[:, :-2])
+        aplicar_frontera(siguiente, alfa, izquierda[j + 1], h, 0)
+        aplicar_frontera(siguiente, beta, derecha[j + 1], h, -1)
+
+    if historia:
+        return niveles.transpose(1, 2, 0)
+    return niveles[(m - 1) % 3].copy()
+
 # Caso 1: Condicion inicial senoidal y velocidad cero
 def f_senoidal(x):
     # Desplazamiento inicial en funcion senoidal
@@ -61,47 +181,48 @@ def beta(t):
     # Frontera derecha
     return 0
 
-# Parametros comunes
-a = 1      # Longitud del dominio espacial
-b = 1      # Tiempo total
-c = 1      # Velocidad de propagacion de la onda
-h = 0.05   # Tamano del paso en x
-k = 0.005  # Tamano del paso en t
-
-# Ejecutar la funcion y obtener la solucion para el caso 1 (senoidal)
-u_senoidal = ecuacion_onda(f_senoidal, g_senoidal, alfa, beta, a, b, c, h, k)
-
-# Ejecutar la funcion y obtener la solucion para el caso 2 (escalonada)
-u_escalonada = ecuacion_onda(f_escalonada, g_escalonada, alfa, beta, a, b, c, h, k)
-
-# Graficar el mapa de la onda en 3D para el caso senoidal
-fig = plt.figure()
-
-# Subgrafico para el caso senoidal
-ax = fig.add_subplot(121, projection='3d')
-x = np.linspace(0, a, u_senoidal.shape[0])
-t = np.linspace(0, b, u_senoidal.shape[1])
-X, T = np.meshgrid(t, x)
-
-# Dibujar la superficie para el caso senoidal
-ax.plot_surface(X, T, u_senoidal, cmap=cm.jet)
-ax.set_xlabel('Tiempo')
-ax.set_ylabel('Posicion')
-ax.set_zlabel('Desplazamiento')
-ax.set_title("Caso 1: Condicion Inicial Senoidal")
-
-# Subgrafico para el caso escalonada
-ax2 = fig.add_subplot(122, projection='3d')
-
-# Dibujar la superficie para el caso escalonada
-ax2.plot_surface(X, T, u_escalonada, cmap=cm.jet)
-ax2.set_xlabel('Tiempo')
-ax2.set_ylabel('Posicion')
-ax2.set_zlabel('Desplazamiento')
-ax2.set_title("Caso 2: Condicion Inicial Escalonada")
-
-# Ajustar el layout de los graficos
-plt.tight_layout()
-
-# Mostrar los graficos
-plt.show()
+if __name__ == "__main__":
+    # Parametros comunes
+    a = 1      # Longitud del dominio espacial
+    b = 1      # Tiempo total
+    c = 1      # Velocidad de propagacion de la onda
+    h = 0.05   # Tamano del paso en x
+    k = 0.005  # Tamano del paso en t
+
+    # Resolver ambos casos en un solo lote (senoidal y escalonada)
+    x = np.arange(0, int(a / h) + 1) * h
+    F = np.stack([f_senoidal(x), f_escalonada(x)])
+    G = np.stack([g_senoidal(x), g_escalonada(x)])
+    u_senoidal, u_escalonada = ecuacion_onda_lote(F, G, alfa, beta, a, b, c, h, k)
+
+    # Graficar el mapa de la onda en 3D para el caso senoidal
+    fig = plt.figure()
+
+    # Subgrafico para el caso senoidal
+    ax = fig.add_subplot(121, projection='3d')
+    x = np.linspace(0, a, u_senoidal.shape[0])
+    t = np.linspace(0, b, u_senoidal.shape[1])
+    X, T = np.meshgrid(t, x)
+
+    # Dibujar la superficie para el caso senoidal
+    ax.plot_surface(X, T, u_senoidal, cmap=cm.jet)
+    ax.set_xlabel('Tiempo')
+    ax.set_ylabel('Posicion')
+    ax.set_zlabel('Desplazamiento')
+    ax.set_title("Caso 1: Condicion Inicial Senoidal")
+
+    # Subgrafico para el caso escalonada
+    ax2 = fig.add_subplot(122, projection='3d')
+
+    # Dibujar la superficie para el caso escalonada
+    ax2.plot_surface(X, T, u_escalonada, cmap=cm.jet)
+    ax2.set_xlabel('Tiempo')
+    ax2.set_ylabel('Posicion')
+    ax2.set_zlabel('Desplazamiento')
+    ax2.set_title("Caso 2: Condicion Inicial Escalonada")
+
+    # Ajustar el layout de los graficos
+    plt.tight_layout()
+
+    # Mostrar los graficos
+    plt.show()
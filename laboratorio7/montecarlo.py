@@ -1,50 +1,504 @@
+import os
 import random
 import numpy as np
 import seaborn as sns
 import matplotlib.pyplot as plt
 
+from collections import namedtuple
+from statistics import NormalDist
+from concurrent.futures import ProcessPoolExecutor
+
+# Resultado de una integración: estimación, error estándar y muestras usadas
+ResultadoMC = namedtuple("ResultadoMC", ["integral", "error", "n"])
+
+# Muestras de un método: contribuciones iid Y (su media estima la integral)
+# y los puntos (x, y) que se dibujan al visualizar
+Muestra = namedtuple("Muestra", ["Y", "x", "y"])
+
+METODOS = ("acierto-fallo", "media", "estratificado", "importancia", "antitetico", "control", "sobol", "halton",
+           "exponencial")
+
+
+def _malla_piloto(func, a, b, puntos=1000):
+    # Una sola llamada vectorizada a func sobre una malla fija
+    x = np.linspace(a, b, puntos)
+    return x, np.broadcast_to(func(x), x.shape).astype(float)
+
+
+def transformar_semi_infinito(func, a):
+    """
+    Integrando equivalente en [0, 1] para una integral en [a, ∞).
+
+    Con x = a + t / (1 - t), dx = dt / (1 - t)^2, así que
+    ∫[a,∞] f(x) dx = ∫[0,1] f(a + t/(1-t)) / (1-t)^2 dt. En t = 1 se toma 0,
+    el límite para integrandos que decaen más rápido que 1/x^2.
+    """
+    def transformada(t):
+        t = np.asarray(t, dtype=float)
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            x = a + t / (1 - t)
+            valores = np.broadcast_to(func(x), t.shape) / (1 - t) ** 2
+        return np.where(t < 1, valores, 0.0)
+
+    return transformada
+
+
+def preparar_muestreador(func, a, b, metodo="media", estratos=100, bins=64, replicas=16, tasa=1.0):
+    """
+    Construye el muestreador de un método de Monte Carlo.
+
+    La preparación (y_max, densidad de importancia, variable de control) es
+    determinista, así que el mismo muestreador se puede usar en varios
+    procesos o por bloques.
+
+    Los métodos cuasi-Monte Carlo ("sobol", "halton") generan `replicas`
+    secuencias aleatorizadas (scrambled) independientes; cada réplica aporta
+    una contribución Y, de modo que el error estándar sale de la dispersión
+    entre réplicas.
+
+    Si b es infinito, "exponencial" muestrea x - a ~ Exp(tasa) directamente;
+    el resto de métodos integra el integrando transformado de
+    transformar_semi_infinito en [0, 1].
+
+    Args:
+        func (callable): Función vectorizada a integrar en [a, b].
+        metodo (str): "acierto-fallo", "media" (media muestral),
+            "estratificado", "importancia", "antitetico", "control", "sobol",
+            "halton" o "exponencial" (muestreo de importancia exponencial).
+        estratos (int, optional): Estratos por lote del método estratificado.
+        bins (int, optional): Tramos de la densidad de importancia.
+        replicas (int, optional): Réplicas aleatorizadas por bloque (QMC).
+        tasa (float, optional): Tasa de la densidad exponencial.
+    Returns:
+        callable: muestreador(rng, n) -> Muestra con unas n evaluaciones.
+    """
+    if np.isinf(b) and metodo != "exponencial":
+        func, a, b = transformar_semi_infinito(func, a), 0.0, 1.0
+    ancho = b - a
+    if metodo == "acierto-fallo":
+        _, f_piloto = _malla_piloto(func, a, b)
+        y_max = f_piloto.max()
+
+        def muestreador(rng, n):
+            x = rng.uniform(a, b, n)
+            y = rng.uniform(0, y_max, n)
+            return Muestra(ancho * y_max * (y <= func(x)), x, y)
+
+    elif metodo == "media":
+        def muestreador(rng, n):
+            x = rng.uniform(a, b, n)
+            fx = func(x)
+            return Muestra(ancho * fx, x, fx)
+
+    elif metodo == "estratificado":
+        def muestreador(rng, n):
+            # Cada lote tiene un punto por estrato, así los lotes son iid
+            k = max(1, min(estratos, n // 2))
+            lotes = max(1, n // k)
+            u = (np.arange(k) + rng.uniform(size=(lotes, k))) / k
+            x = a + ancho * u
+            fx = func(x)
+            return Muestra(ancho * fx.mean(axis=1), x.ravel(), fx.ravel())
+
+    elif metodo == "importancia":
+        # Densidad constante a trozos proporcional a |f|, mezclada con la
+        # uniforme para no dejar regiones sin soporte
+        x_piloto, f_piloto = _malla_piloto(func, a, b, 16 * bins)
+        peso = np.abs(f_piloto).reshape(bins, 16).mean(axis=1)
+        if peso.sum() == 0:
+            peso = np.ones(bins)
+        prob = 0.9 * peso / peso.sum() + 0.1 / bins
+        bordes = np.linspace(a, b, bins + 1)
+        densidad = prob / np.diff(bordes)
+
+        def muestreador(rng, n):
+            tramo = rng.choice(bins, size=n, p=prob)
+            x = bordes[tramo] + rng.uniform(size=n) * (bordes[1] - bordes[0])
+            fx = func(x)
+            return Muestra(fx / densidad[tramo], x, fx)
+
+    elif metodo == "antitetico":
+        def muestreador(rng, n):
+            x = rng.uniform(a, b, max(1, n // 2))
+            fx = func(x)
+            fx_anti = func(a + b - x)
+            return Muestra(ancho * (fx + fx_anti) / 2, np.concatenate([x, a + b - x]), np.concatenate([fx, fx_anti]))
+
+    elif metodo == "control":
+        # Variable de control: polinomio cuadrático ajustado a f, con
+        # integral exacta y coeficiente óptimo estimados en la malla piloto
+        x_piloto, f_piloto = _malla_piloto(func, a, b, 257)
+        g = np.poly1d(np.polyfit(x_piloto, f_piloto, 2))
+        G = g.integ()
+        integral_g = G(b) - G(a)
+        g_piloto = g(x_piloto)
+        varianza_g = np.var(g_piloto)
+        c = np.cov(f_piloto, g_piloto)[0, 1] / varianza_g if varianza_g > 0 else 0.0
+
+        def muestreador(rng, n):
+            x = rng.uniform(a, b, n)
+            fx = func(x)
+            return Muestra(ancho * (fx - c * g(x)) + c * integral_g, x, fx)
+
+    elif metodo in ("sobol", "halton"):
+        from scipy.stats import qmc
+
+        def muestreador(rng, n):
+            por_replica = max(1, n // replicas)
+            u = np.empty((replicas, por_replica if metodo == "halton" else 2 ** int(np.log2(por_replica))))
+            for i in range(replicas):
+                if metodo == "sobol":
+                    # Sobol equilibrado solo con potencias de 2
+                    u[i] = qmc.Sobol(d=1, scramble=True, seed=rng).random_base2(int(np.log2(u.shape[1])))[:, 0]
+                else:
+                    u[i] = qmc.Halton(d=1, scramble=True, seed=rng).random(por_replica)[:, 0]
+            x = a + ancho * u
+            fx = func(x)
+            return Muestra(ancho * fx.mean(axis=1), x.ravel(), fx.ravel())
+
+    elif metodo == "exponencial":
+        # Densidad tasa * exp(-tasa (x - a)), truncada a [a, b] si b es finito
+        masa = -np.expm1(-tasa * ancho)
+
+        def muestreador(rng, n):
+            x = a - np.log1p(-masa * rng.uniform(size=n)) / tasa
+            fx = func(x)
+            densidad = tasa * np.exp(-tasa * (x - a)) / masa
+            return Muestra(fx / densidad, x, fx)
+
+    else:
+        raise ValueError(f"Método desconocido: {metodo}")
+    return muestreador
+
+
+# Acumuladores (n, media, M2) de Welford: M2 es la suma de cuadrados de las
+# desviaciones respecto de la media, y dos acumuladores se combinan sin error
+ACUMULADOR_VACIO = (0, 0.0, 0.0)
+
+
+def acumular(Y):
+    """
+    Acumulador (n, media, M2) de un bloque de contribuciones.
+    """
+    n = len(Y)
+    if n == 0:
+        return ACUMULADOR_VACIO
+    media = float(np.mean(Y))
+    return n, media, float(np.sum((Y - media) ** 2))
+
+
+def combinar(acc1, acc2):
+    """
+    Combina dos acumuladores (fórmula de Chan et al.), como si se hubieran
+    calculado sobre la unión de ambos bloques.
+    """
+    n1, media1, m2_1 = acc1
+    n2, media2, m2_2 = acc2
+    n = n1 + n2
+    if n == 0:
+        return ACUMULADOR_VACIO
+    delta = media2 - media1
+    media = media1 + delta * n2 / n
+    return n, media, m2_1 + m2_2 + delta**2 * n1 * n2 / n
+
+
+def resultado_acumulador(acc):
+    """
+    ResultadoMC (integral y error estándar) de un acumulador; n es el número
+    de contribuciones acumuladas.
+    """
+    n, media, m2 = acc
+    error = float(np.sqrt(m2 / (n - 1) / n)) if n > 1 else float("inf")
+    return ResultadoMC(media, error, n)
+
+
+def recorrer_bloques(muestreador, rng, num_points, bloque, tol_abs=None, tol_rel=None, confianza=0.95,
+                     min_bloques=2):
+    """
+    Muestrea por bloques acumulando media y varianza con memoria constante.
+
+    Si se da tol_abs o tol_rel, se detiene en cuanto el semiancho del
+    intervalo de confianza es menor que max(tol_abs, tol_rel * |integral|);
+    num_points es entonces el máximo de puntos.
+
+    Returns:
+        tuple: Acumulador (n, media, M2), puntos usados y la primera muestra
+        (para visualizar).
+    """
+    z = NormalDist().inv_cdf(0.5 + confianza / 2)
+    objetivo_fijo = tol_abs or 0.0
+    acc = ACUMULADOR_VACIO
+    puntos = 0
+    primera = None
+    bloques = 0
+    restantes = num_points
+    while restantes > 0:
+        m = min(bloque, restantes)
+        muestra = muestreador(rng, m)
+        if primera is None:
+            primera = muestra
+        acc = combinar(acc, acumular(muestra.Y))
+        puntos += len(muestra.x)
+        restantes -= m
+        bloques += 1
+        if (tol_abs is not None or tol_rel is not None) and bloques >= min_bloques:
+            semiancho = z * resultado_acumulador(acc).error
+            if semiancho <= max(objetivo_fijo, (tol_rel or 0.0) * abs(acc[1])):
+                break
+    return acc, puntos, primera
+
+
 # Función para realizar la integración por Monte Carlo
-def monte_carlo_integration(func, a, b, num_points=10000, visualize=False):
-    # Generar puntos aleatorios
-    x_random = np.random.uniform(a, b, num_points)
-    y_max = max(func(x) for x in np.linspace(a, b, 1000))
-    y_random = np.random.uniform(0, y_max, num_points)
+def visualizar(func, a, b, muestra, metodo, integral, error, modo="submuestra", max_puntos=5000, resolucion=(400, 200),
+               archivo=None, rng=None):
+    """
+    Dibuja la función y los puntos muestreados con costo acotado.
 
-    # Identificar puntos bajo y sobre la curva
-    under_curve = y_random <= func(x_random)
-    over_curve = ~under_curve
+    Args:
+        modo (str, optional): "submuestra" dibuja como mucho max_puntos
+            puntos elegidos al azar; "densidad" agrupa todos los puntos en un
+            histograma 2D de resolucion celdas y lo muestra como imagen (en
+            acierto-fallo, verde bajo la curva y rojo sobre ella).
+        archivo (str, optional): Si se da, el gráfico se guarda en ese
+            archivo (png, svg, pdf...) y no se abre ninguna ventana.
+    """
+    rng = np.random.default_rng(rng)
 
-    # Calcular el área bajo la curva
-    area_rectangle = (b - a) * y_max
-    integral = (under_curve.sum() / num_points) * area_rectangle
+    # En [a, ∞) se dibuja el integrando transformado en [0, 1], salvo con
+    # el muestreo exponencial, que trabaja con x directamente
+    if np.isinf(b) and metodo != "exponencial":
+        func, a, b = transformar_semi_infinito(func, a), 0.0, 1.0
+    elif np.isinf(b):
+        b = float(np.max(muestra.x))
 
-    if visualize:
-        # Gráfico con seaborn
-        sns.set_theme(style="whitegrid")
-        plt.figure(figsize=(10, 6))
-
-        # Curva de la función
-        x = np.linspace(a, b, 1000)
-        y = func(x)
-        sns.lineplot(x=x, y=y, label='Función', color='blue', linewidth=2.5)
-
-        # Puntos bajo la curva
-        sns.scatterplot(x=x_random[under_curve], y=y_random[under_curve],
-                        color='green', s=5, label='Puntos bajo la curva', alpha=0.6)
-
-        # Puntos sobre la curva
-        sns.scatterplot(x=x_random[over_curve], y=y_random[over_curve],
-                        color='red', s=5, label='Puntos sobre la curva', alpha=0.6)
-
-        # Configuración del gráfico
-        plt.title('Integración Monte Carlo', fontsize=14)
-        plt.xlabel('x', fontsize=12)
-        plt.ylabel('f(x)', fontsize=12)
-        plt.legend(fontsize=10)
-        plt.grid(True, linestyle='--', alpha=0.7)
+    # Gráfico con seaborn
+    sns.set_theme(style="whitegrid")
+    fig, ax = plt.subplots(figsize=(10, 6))
+
+    # Curva de la función
+    x = np.linspace(a, b, 1000)
+    y = func(x)
+    sns.lineplot(x=x, y=y, label='Función', color='blue', linewidth=2.5, ax=ax)
+
+    def bajo_la_curva(indices):
+        # func solo se evalúa en los puntos que se van a dibujar
+        if metodo == "acierto-fallo":
+            return muestra.y[indices] <= func(muestra.x[indices])
+        return np.ones(len(muestra.x[indices]), dtype=bool)
+
+    if modo == "densidad":
+        under_curve = bajo_la_curva(slice(None))
+        y_min = min(float(np.min(muestra.y)), float(np.min(y)), 0.0)
+        y_max = max(float(np.max(muestra.y)), float(np.max(y)))
+        # Índice de celda de cada punto y conteo con bincount (una pasada)
+        nx, ny = resolucion
+        ix = np.clip(((muestra.x - a) / (b - a) * nx).astype(np.int64), 0, nx - 1)
+        iy = np.clip(((muestra.y - y_min) / ((y_max - y_min) or 1.0) * ny).astype(np.int64), 0, ny - 1)
+        celda = iy * nx + ix + nx * ny * under_curve
+        conteo = np.bincount(celda, minlength=2 * nx * ny).reshape(2, ny, nx)
+        capas = np.log1p(conteo)
+        maximo = capas.max() or 1.0
+        imagen = np.zeros(capas[0].shape + (4,))
+        imagen[..., 0] = capas[0] / maximo
+        imagen[..., 1] = capas[1] / maximo
+        imagen[..., 3] = np.maximum(capas[0], capas[1]) / maximo
+        ax.imshow(imagen, origin='lower', extent=(a, b, y_min, y_max), aspect='auto', interpolation='nearest')
+    else:
+        indices = np.arange(len(muestra.x))
+        if len(indices) > max_puntos:
+            indices = np.sort(rng.choice(len(indices), max_puntos, replace=False))
+        under_curve = bajo_la_curva(indices)
+        debajo = indices[under_curve]
+        encima = indices[~under_curve]
+        if metodo == "acierto-fallo":
+            # Puntos bajo la curva
+            sns.scatterplot(x=muestra.x[debajo], y=muestra.y[debajo],
+                            color='green', s=5, label='Puntos bajo la curva', alpha=0.6, ax=ax)
+
+            # Puntos sobre la curva
+            sns.scatterplot(x=muestra.x[encima], y=muestra.y[encima],
+                            color='red', s=5, label='Puntos sobre la curva', alpha=0.6, ax=ax)
+        else:
+            # Puntos donde se evaluó la función
+            sns.scatterplot(x=muestra.x[debajo], y=muestra.y[debajo], color='green', s=5,
+                            label='Puntos evaluados', alpha=0.6, ax=ax)
+
+    # Configuración del gráfico
+    ax.set_title(f'Integración Monte Carlo ({metodo}): {integral:.6f} ± {error:.2e}', fontsize=14)
+    ax.set_xlabel('x', fontsize=12)
+    ax.set_ylabel('f(x)', fontsize=12)
+    ax.legend(fontsize=10)
+    ax.grid(True, linestyle='--', alpha=0.7)
+    if archivo is not None:
+        fig.savefig(archivo, dpi=100, bbox_inches='tight')
+        plt.close(fig)
+    else:
         plt.show()
 
-    return integral
+
+def monte_carlo_integration(func, a, b, num_points=10000, visualize=False, metodo="acierto-fallo", rng=None,
+                            bloque=None, tol_abs=None, tol_rel=None, confianza=0.95, modo_grafico="submuestra",
+                            archivo=None):
+    """
+    Integral de func en [a, b] por Monte Carlo.
+
+    Con bloque (o con una tolerancia) la integración es en streaming: los
+    puntos se generan por bloques y solo se guardan la media y la varianza,
+    así que la memoria no depende de num_points.
+
+    Args:
+        func (callable): Función vectorizada.
+        a, b (float): Límites de integración; b puede ser np.inf.
+        num_points (int, optional): Evaluaciones de func (máximo si hay tolerancia).
+        visualize (bool, optional): Dibujar los puntos del primer bloque.
+        metodo (str, optional): Uno de METODOS.
+        rng (numpy.random.Generator o int, optional): Generador o semilla.
+        bloque (int, optional): Puntos por bloque; por defecto todos a la vez,
+            o 100000 si se pide una tolerancia.
+        tol_abs (float, optional): Semiancho máximo del intervalo de confianza.
+        tol_rel (float, optional): Semiancho máximo relativo a la integral.
+        confianza (float, optional): Nivel del intervalo de confianza.
+        modo_grafico (str, optional): "submuestra" o "densidad" (ver visualizar).
+        archivo (str, optional): Guardar el gráfico en este archivo sin mostrarlo.
+    Returns:
+        ResultadoMC: Integral, error estándar y número de puntos.
+    """
+    rng = np.random.default_rng(rng)
+    if bloque is None:
+        bloque = num_points if tol_abs is None and tol_rel is None else 100_000
+    muestreador = preparar_muestreador(func, a, b, metodo)
+    acc, puntos, muestra = recorrer_bloques(muestreador, rng, num_points, bloque, tol_abs, tol_rel, confianza)
+    integral, error, _ = resultado_acumulador(acc)
+
+    if visualize:
+        visualizar(func, a, b, muestra, metodo, integral, error, modo=modo_grafico, archivo=archivo, rng=rng)
+
+    return ResultadoMC(integral, error, puntos)
+
+
+def comparar_metodos(func, a, b, num_points=10000, metodos=METODOS, rng=None):
+    """
+    Compara el error estándar de cada método con el mismo número de puntos.
+
+    La eficiencia relativa indica cuántas veces menos muestras necesita cada
+    método para el mismo error que acierto-fallo.
+    """
+    rng = np.random.default_rng(rng)
+    resultados = {}
+    for metodo in metodos:
+        resultados[metodo] = monte_carlo_integration(func, a, b, num_points, metodo=metodo, rng=rng)
+    referencia = resultados[metodos[0]].error
+    for metodo, r in resultados.items():
+        eficiencia = (referencia / r.error) ** 2 if r.error > 0 else float("inf")
+        print(f"{metodo:>14}: {r.integral:.6f} ± {r.error:.2e} (x{eficiencia:.1f} menos muestras)")
+    return resultados
+
+
+def orden_convergencia(func, a, b, metodos=("media", "sobol", "halton"), tamanos=(2**10, 2**12, 2**14, 2**16, 2**18),
+                       rng=None):
+    """
+    Estima el orden p de convergencia (error ~ N^-p) de cada método.
+
+    El error estándar se ajusta contra N en escala log-log; Monte Carlo da
+    p ~ 0.5 y cuasi-Monte Carlo se acerca a p ~ 1 en integrandos suaves.
+
+    Returns:
+        dict: Método -> pendiente p.
+    """
+    rng = np.random.default_rng(rng)
+    ordenes = {}
+    for metodo in metodos:
+        errores = [monte_carlo_integration(func, a, b, n, metodo=metodo, rng=rng).error for n in tamanos]
+        ordenes[metodo] = -np.polyfit(np.log(tamanos), np.log(errores), 1)[0]
+        print(f"{metodo:>14}: error ~ N^-{ordenes[metodo]:.2f} (error con N={tamanos[-1]}: {errores[-1]:.2e})")
+    return ordenes
+
+
+def comparar_dominio_infinito(func, a, exacta, num_points=100_000, b_truncado=10, rng=None):
+    """
+    Compara el truncamiento [a, b_truncado] con los métodos para [a, ∞).
+
+    La desviación por muestra (error estándar * sqrt(N)) mide el costo: el
+    número de muestras para un error e es (desviación / e)^2. El
+    truncamiento además tiene un sesgo que no baja al aumentar N.
+
+    Returns:
+        dict: Nombre -> ResultadoMC.
+    """
+    rng = np.random.default_rng(rng)
+    casos = {
+        f"truncado b={b_truncado}": (b_truncado, "media"),
+        "t/(1-t) media": (np.inf, "media"),
+        "t/(1-t) sobol": (np.inf, "sobol"),
+        "exponencial": (np.inf, "exponencial"),
+    }
+    resultados = {}
+    for nombre, (b, metodo) in casos.items():
+        r = monte_carlo_integration(func, a, b, num_points, metodo=metodo, rng=rng)
+        resultados[nombre] = r
+        print(f"{nombre:>16}: {r.integral:.6f} ± {r.error:.2e}, error real {abs(r.integral - exacta):.2e}, "
+              f"desviación por muestra {r.error * np.sqrt(r.n):.3f}")
+    return resultados
+
+
+def _integrar_tarea(tarea):
+    # Cada proceso reconstruye su muestreador (la preparación es determinista)
+    # y recorre su parte por bloques para acotar la memoria
+    func, a, b, metodo, n, semilla, bloque = tarea
+    muestreador = preparar_muestreador(func, a, b, metodo)
+    acc, puntos, _ = recorrer_bloques(muestreador, np.random.default_rng(semilla), n, bloque)
+    return acc, puntos
+
+
+def monte_carlo_paralelo(func, a, b, num_points=10**9, metodo="media", semilla=None, procesos=None,
+                         puntos_por_tarea=10_000_000, bloque=1_000_000):
+    """
+    Integral de Monte Carlo repartida entre varios procesos.
+
+    num_points se divide en tareas de puntos_por_tarea puntos, cada una con
+    su propio Generator creado con SeedSequence(semilla).spawn. El reparto
+    no depende del número de procesos, así que con la misma semilla el
+    resultado es idéntico en cualquier máquina. Las medias y varianzas
+    parciales se combinan de forma exacta.
+
+    Args:
+        func (callable): Función vectorizada definida a nivel de módulo
+            (debe poder enviarse a otro proceso).
+        a, b (float): Límites de integración.
+        num_points (int, optional): Número total de puntos.
+        metodo (str, optional): Uno de METODOS.
+        semilla (int o numpy.random.SeedSequence, optional): Semilla raíz.
+        procesos (int, optional): Procesos del pool; None usa todos los núcleos.
+        puntos_por_tarea (int, optional): Puntos de cada tarea.
+        bloque (int, optional): Puntos por bloque dentro de cada tarea.
+    Returns:
+        ResultadoMC: Integral, error estándar y número de puntos.
+    """
+    semilla = semilla if isinstance(semilla, np.random.SeedSequence) else np.random.SeedSequence(semilla)
+    tamanos = [puntos_por_tarea] * (num_points // puntos_por_tarea)
+    if num_points % puntos_por_tarea:
+        tamanos.append(num_points % puntos_por_tarea)
+    tareas = [(func, a, b, metodo, n, hija, bloque) for n, hija in zip(tamanos, semilla.spawn(len(tamanos)))]
+
+    procesos = procesos or os.cpu_count() or 1
+    pool = None
+    try:
+        if procesos > 1 and len(tareas) > 1:
+            pool = ProcessPoolExecutor(max_workers=min(procesos, len(tareas)))
+            parciales = pool.map(_integrar_tarea, tareas)
+        else:
+            parciales = map(_integrar_tarea, tareas)
+        # Se combinan en el orden de las tareas, así el redondeo tampoco
+        # depende del número de procesos
+        acc = ACUMULADOR_VACIO
+        puntos = 0
+        for parcial, n in parciales:
+            acc = combinar(acc, parcial)
+            puntos += n
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    return resultado_acumulador(acc)._replace(n=puntos)
 
 # Ejercicio 1: I[g(X)] = ∫[0,1] exp(x^2) dx
 def func1(x):
@@ -86,29 +540,31 @@ def menu():
     print("6. I[g(X)] = ∫[0,∞] exp(-x) dx")
     print("7. I[g(X)] = ∫[0,∞] (1 - x^2)^(3/2) dx")
     op = int(input("Ingrese el número del ejercicio que desea realizar => "))
+    metodo = input(f"Método {METODOS} [acierto-fallo] => ").strip() or "acierto-fallo"
 
     if op == 1:
-        result1 = monte_carlo_integration(func1, 0, 1, num_points, visualize=True)
-        print(f"Ejercicio 1: La aproximación de la integral es: {result1}")
+        result1 = monte_carlo_integration(func1, 0, 1, num_points, visualize=True, metodo=metodo)
+        print(f"Ejercicio 1: La aproximación de la integral es: {result1.integral} ± {result1.error:.2e}")
     elif op == 2:
-        result2 = monte_carlo_integration(func2, -1, 1, num_points, visualize=True)
-        print(f"Ejercicio 2: La aproximación de la integral es: {result2}")
+        result2 = monte_carlo_integration(func2, -1, 1, num_points, visualize=True, metodo=metodo)
+        print(f"Ejercicio 2: La aproximación de la integral es: {result2.integral} ± {result2.error:.2e}")
     elif op == 3:
-        result3 = monte_carlo_integration(func3, 0, 1, num_points, visualize=True)
-        print(f"Ejercicio 3: La aproximación de la integral es: {result3}")
+        result3 = monte_carlo_integration(func3, 0, 1, num_points, visualize=True, metodo=metodo)
+        print(f"Ejercicio 3: La aproximación de la integral es: {result3.integral} ± {result3.error:.2e}")
     elif op == 4:
-        result4 = monte_carlo_integration(func4, 0, 10, num_points, visualize=True)
-        print(f"Ejercicio 4: La aproximación de la integral es: {result4}")
+        result4 = monte_carlo_integration(func4, 0, np.inf, num_points, visualize=True, metodo=metodo)
+        print(f"Ejercicio 4: La aproximación de la integral es: {result4.integral} ± {result4.error:.2e}")
     elif op == 5:
-        result5 = monte_carlo_integration(func5, 0, 1, num_points, visualize=True)
-        print(f"Ejercicio 5: La aproximación de la integral es: {result5}")
+        result5 = monte_carlo_integration(func5, 0, 1, num_points, visualize=True, metodo=metodo)
+        print(f"Ejercicio 5: La aproximación de la integral es: {result5.integral} ± {result5.error:.2e}")
     elif op == 6:
-        result6 = monte_carlo_integration(func6, 0, 10, num_points, visualize=True)
-        print(f"Ejercicio 6: La aproximación de la integral es: {result6}")
+        result6 = monte_carlo_integration(func6, 0, np.inf, num_points, visualize=True, metodo=metodo)
+        print(f"Ejercicio 6: La aproximación de la integral es: {result6.integral} ± {result6.error:.2e}")
     elif op == 7:
-        result7 = monte_carlo_integration(func7, 0, 1, num_points, visualize=True)
-        print(f"Ejercicio 7: La aproximación de la integral es: {result7}")
+        result7 = monte_carlo_integration(func7, 0, 1, num_points, visualize=True, metodo=metodo)
+        print(f"Ejercicio 7: La aproximación de la integral es: {result7.integral} ± {result7.error:.2e}")
 
-while True:
-    menu()
+if __name__ == "__main__":
+    while True:
+        menu()
 
@@ -1,68 +1,393 @@
+from collections import namedtuple
+
 import numpy as np
 
-def biseccion(f, a, b, tol=1e-6, max_iter=100):
+
+# Raíz, iteraciones, llamadas a f (y a df en Newton-Raphson) y, en resolver,
+# el método elegido
+Resultado = namedtuple("Resultado", ["raiz", "iteraciones", "evaluaciones", "metodo"], defaults=(None,))
+
+
+def contar_evaluaciones(f, registro=None):
+    """
+    Envuelve f para contar sus llamadas en f.llamadas.
+
+    Args:
+        f (callable): Función a envolver.
+        registro (callable, optional): Se llama como registro(x, f(x)) en
+            cada evaluación, por ejemplo para perfilar o trazar el método.
+    """
+    def contada(x):
+        contada.llamadas += 1
+        fx = f(x)
+        if registro is not None:
+            registro(x, fx)
+        return fx
+
+    contada.llamadas = 0
+    return contada
+
+
+def biseccion(f, a, b, tol=1e-6, max_iter=100, registro=None):
     """
     Método de Bisección.
+
+    Se guarda f(a), así que cada iteración evalúa f una sola vez, en el
+    punto medio.
     """
-    if f(a) * f(b) >= 0:
+    f = contar_evaluaciones(f, registro)
+    fa = f(a)
+    if fa * f(b) >= 0:
         raise ValueError("El teorema del valor intermedio no se cumple. f(a) y f(b) deben tener signos opuestos.")
     
-    for _ in range(max_iter):
+    for i in range(max_iter):
         c = (a + b) / 2
-        if abs(f(c)) < tol or (b - a) / 2 < tol:
-            return c
-        if f(a) * f(c) < 0:
+        fc = f(c)
+        if abs(fc) < tol or (b - a) / 2 < tol:
+            return Resultado(c, i + 1, f.llamadas)
+        if fa * fc < 0:
             b = c
         else:
-            a = c
+            a, fa = c, fc
     raise ValueError("El método no convergió después del número máximo de iteraciones.")
 
-def newton_raphson(f, df, x0, tol=1e-6, max_iter=100):
+def newton_raphson(f, df, x0, tol=1e-6, max_iter=100, registro=None):
     """
     Método de Newton-Raphson.
+
+    La derivada solo se evalúa si f(x) todavía no cumple la tolerancia.
     """
+    f = contar_evaluaciones(f, registro)
+    df = contar_evaluaciones(df)
     x = x0
-    for _ in range(max_iter):
+    for i in range(max_iter):
         fx = f(x)
-        dfx = df(x)
         if abs(fx) < tol:
-            return x
+            return Resultado(x, i + 1, f.llamadas + df.llamadas)
+        dfx = df(x)
         if dfx == 0:
             raise ValueError("Derivada cero. No se puede continuar.")
         x = x - fx / dfx
     raise ValueError("El método no convergió después del número máximo de iteraciones.")
 
-def falsa_posicion(f, a, b, tol=1e-6, max_iter=100):
+def falsa_posicion(f, a, b, tol=1e-6, max_iter=100, registro=None):
     """
     Método de Falsa Posición.
+
+    f(a) y f(b) se arrastran entre iteraciones: una evaluación por iteración.
     """
-    if f(a) * f(b) >= 0:
+    f = contar_evaluaciones(f, registro)
+    fa, fb = f(a), f(b)
+    if fa * fb >= 0:
         raise ValueError("El teorema del valor intermedio no se cumple. f(a) y f(b) deben tener signos opuestos.")
     
-    for _ in range(max_iter):
-        c = b - (f(b) * (b - a)) / (f(b) - f(a))
-        if abs(f(c)) < tol:
-            return c
-        if f(a) * f(c) < 0:
-            b = c
+    for i in range(max_iter):
+        c = b - (fb * (b - a)) / (fb - fa)
+        fc = f(c)
+        if abs(fc) < tol:
+            return Resultado(c, i + 1, f.llamadas)
+        if fa * fc < 0:
+            b, fb = c, fc
         else:
-            a = c
+            a, fa = c, fc
     raise ValueError("El método no convergió después del número máximo de iteraciones.")
 
-def secante(f, x0, x1, tol=1e-6, max_iter=100):
+def secante(f, x0, x1, tol=1e-6, max_iter=100, registro=None):
     """
     Método de la Secante.
+
+    Se guardan f(x0) y f(x1): una evaluación por iteración.
     """
-    for _ in range(max_iter):
-        if abs(f(x1)) < tol:
-            return x1
-        if f(x1) - f(x0) == 0:
+    f = contar_evaluaciones(f, registro)
+    f0, f1 = f(x0), f(x1)
+    for i in range(max_iter):
+        if abs(f1) < tol:
+            return Resultado(x1, i + 1, f.llamadas)
+        if f1 - f0 == 0:
             raise ValueError("División por cero en la iteración. No se puede continuar.")
-        x_temp = x1 - f(x1) * (x1 - x0) / (f(x1) - f(x0))
+        x_temp = x1 - f1 * (x1 - x0) / (f1 - f0)
         x0, x1 = x1, x_temp
+        f0, f1 = f1, f(x1)
+    raise ValueError("El método no convergió después del número máximo de iteraciones.")
+
+
+def _escalar(valor):
+    # Acepta funciones que devuelven arreglos de un elemento
+    valor = np.asarray(valor)
+    if valor.size != 1:
+        raise ValueError("f debe devolver un único valor por punto.")
+    return valor.reshape(()).item()
+
+
+def derivada(f, x, metodo="diferencias"):
+    """
+    Derivada numérica de f en x.
+
+    Por defecto usa diferencias centrales con h ~ eps^(1/3). "complejo" usa
+    el paso complejo f'(x) = Im f(x + ih) / h con h = 1e-20, exacto hasta el
+    redondeo pero solo válido si f es analítica; si f no acepta complejos o
+    no devuelve un valor complejo (abs, max, ...) se vuelve a diferencias.
+    """
+    if metodo == "complejo":
+        try:
+            with np.errstate(all="ignore"):
+                valor = _escalar(f(complex(x, 1e-20)))
+            if np.iscomplexobj(valor):
+                d = np.imag(valor) / 1e-20
+                if np.isfinite(d):
+                    return float(d)
+        except (TypeError, ValueError):
+            pass
+    h = np.cbrt(np.finfo(float).eps) * max(1.0, abs(x))
+    return (_escalar(f(x + h)) - _escalar(f(x - h))) / (2 * h)
+
+
+def brent(f, a, b, tol=1e-6, max_iter=100, registro=None, fa=None, fb=None):
+    """
+    Método de Brent: interpolación cuadrática inversa o secante, con
+    bisección cuando el paso no reduce el intervalo lo suficiente.
+
+    Siempre mantiene un intervalo con cambio de signo y converge de forma
+    superlineal; una evaluación de f por iteración.
+
+    Args:
+        fa, fb (float, optional): f(a) y f(b) si ya se conocen.
+    """
+    f = contar_evaluaciones(f, registro)
+    fa = f(a) if fa is None else fa
+    fb = f(b) if fb is None else fb
+    if fa * fb > 0:
+        raise ValueError("El teorema del valor intermedio no se cumple. f(a) y f(b) deben tener signos opuestos.")
+    if fa == 0:
+        return Resultado(a, 0, f.llamadas)
+
+    eps = np.finfo(float).eps
+    # b es la mejor aproximación, a la anterior y c el contrapunto
+    c, fc = a, fa
+    d = e = b - a
+    for i in range(max_iter):
+        if fb * fc > 0:
+            c, fc = a, fa
+            d = e = b - a
+        if abs(fc) < abs(fb):
+            a, b, c = b, c, b
+            fa, fb, fc = fb, fc, fb
+        tol1 = 2 * eps * abs(b) + 0.5 * tol
+        m = 0.5 * (c - b)
+        if abs(m) <= tol1 or abs(fb) < tol:
+            return Resultado(b, i + 1, f.llamadas)
+
+        if abs(e) >= tol1 and abs(fa) > abs(fb):
+            s = fb / fa
+            if a == c:
+                # Secante
+                p = 2 * m * s
+                q = 1 - s
+            else:
+                # Interpolación cuadrática inversa
+                q = fa / fc
+                r = fb / fc
+                p = s * (2 * m * q * (q - r) - (b - a) * (r - 1))
+                q = (q - 1) * (r - 1) * (s - 1)
+            if p > 0:
+                q = -q
+            else:
+                p = -p
+            if 2 * p < min(3 * m * q - abs(tol1 * q), abs(e * q)):
+                e, d = d, p / q
+            else:
+                d = e = m
+        else:
+            d = e = m
+        a, fa = b, fb
+        b = b + d if abs(d) > tol1 else b + np.copysign(tol1, m)
+        fb = f(b)
     raise ValueError("El método no convergió después del número máximo de iteraciones.")
 
 
+def illinois(f, a, b, tol=1e-6, max_iter=100, registro=None, fa=None, fb=None):
+    """
+    Falsa Posición con la modificación de Illinois.
+
+    Si el mismo extremo se conserva dos veces seguidas, su valor de f se
+    divide por 2; así el intervalo se cierra por ambos lados y no se estanca.
+    """
+    f = contar_evaluaciones(f, registro)
+    fa = f(a) if fa is None else fa
+    fb = f(b) if fb is None else fb
+    if fa * fb >= 0:
+        raise ValueError("El teorema del valor intermedio no se cumple. f(a) y f(b) deben tener signos opuestos.")
+
+    lado = 0
+    for i in range(max_iter):
+        c = (a * fb - b * fa) / (fb - fa)
+        fc = f(c)
+        if abs(fc) < tol or abs(b - a) / 2 < tol:
+            return Resultado(c, i + 1, f.llamadas)
+        if fc * fb > 0:
+            b, fb = c, fc
+            if lado == -1:
+                fa /= 2
+            lado = -1
+        else:
+            a, fa = c, fc
+            if lado == 1:
+                fb /= 2
+            lado = 1
+    raise ValueError("El método no convergió después del número máximo de iteraciones.")
+
+
+def newton_seguro(f, x0, df=None, intervalo=None, tol=1e-6, max_iter=100, registro=None, fa=None, fb=None,
+                  metodo_derivada="diferencias"):
+    """
+    Newton-Raphson salvaguardado.
+
+    Con un intervalo con cambio de signo, el paso de Newton se reemplaza por
+    bisección si sale del intervalo o no lo reduce a la mitad (como rtsafe).
+    Sin intervalo, el paso se divide por 2 hasta que |f| disminuye, y solo se
+    acepta una raíz si además la corrección de Newton |f/f'| es menor que
+    tol * max(1, |x|): así no se toma como raíz un punto al que x se alejó
+    donde |f| es pequeño (e^-x o 2/x, sin raíces).
+
+    Args:
+        df (callable, optional): Derivada; si es None se usa derivada().
+        intervalo (tuple, optional): (a, b) con f(a) y f(b) de signos opuestos.
+        metodo_derivada (str, optional): Método de derivada() si df es None.
+    """
+    funcion = f
+    f = contar_evaluaciones(funcion, registro)
+    if df is None:
+        # Las evaluaciones de la derivada numérica también son llamadas a f
+        f_derivada = contar_evaluaciones(funcion)
+        df = lambda x: derivada(f_derivada, x, metodo_derivada)
+    else:
+        f_derivada = df = contar_evaluaciones(df)
+
+    def evaluaciones():
+        return f.llamadas + f_derivada.llamadas
+
+    x = x0
+    fx = _escalar(f(x))
+    if intervalo is not None:
+        lo, hi = intervalo
+        flo = _escalar(f(lo)) if fa is None else fa
+        fhi = _escalar(f(hi)) if fb is None else fb
+        if flo * fhi > 0:
+            raise ValueError("El teorema del valor intermedio no se cumple. f(a) y f(b) deben tener signos opuestos.")
+        if flo > 0:
+            lo, hi = hi, lo
+        if not min(lo, hi) < x < max(lo, hi):
+            x = (lo + hi) / 2
+            fx = _escalar(f(x))
+        paso_anterior = paso = abs(hi - lo)
+
+    for i in range(max_iter):
+        if intervalo is not None and abs(fx) < tol:
+            return Resultado(x, i + 1, evaluaciones())
+        dfx = _escalar(df(x))
+        if intervalo is None and abs(fx) < tol and dfx != 0 and abs(fx / dfx) <= tol * max(1.0, abs(x)):
+            return Resultado(x, i + 1, evaluaciones())
+
+        if intervalo is not None:
+            # lo tiene f < 0 y hi f > 0
+            if fx < 0:
+                lo = x
+            else:
+                hi = x
+            fuera = ((x - hi) * dfx - fx) * ((x - lo) * dfx - fx) > 0
+            if fuera or dfx == 0 or abs(2 * fx) > abs(paso_anterior * dfx):
+                paso_anterior, paso = paso, 0.5 * (hi - lo)
+                x = lo + paso
+            else:
+                paso_anterior, paso = paso, fx / dfx
+                x = x - paso
+            if abs(paso) < tol:
+                return Resultado(x, i + 1, evaluaciones())
+            fx = _escalar(f(x))
+        else:
+            if dfx == 0 or not np.isfinite(dfx):
+                raise ValueError("Derivada cero. No se puede continuar.")
+            paso = fx / dfx
+            for _ in range(50):
+                x_nuevo = x - paso
+                f_nuevo = _escalar(f(x_nuevo))
+                if np.isfinite(f_nuevo) and abs(f_nuevo) < abs(fx):
+                    break
+                paso /= 2
+            else:
+                raise ValueError("El paso de Newton no reduce |f|. No se puede continuar.")
+            x, fx = x_nuevo, f_nuevo
+    if intervalo is None and abs(fx) < tol:
+        raise ValueError("|f| es pequeño pero x no converge: probablemente f no tiene raíz en esa dirección.")
+    raise ValueError("El método no convergió después del número máximo de iteraciones.")
+
+
+def resolver(f, df=None, intervalo=None, inicial=None, tol=1e-6, max_iter=100, metodo="auto", registro=None,
+             metodo_derivada="diferencias"):
+    """
+    Resuelve f(x) = 0 eligiendo el método según los datos disponibles.
+
+    Con "auto": si hay un intervalo con cambio de signo se usa Brent (o
+    Newton salvaguardado dentro del intervalo si se da df); si no, Newton
+    salvaguardado desde el punto inicial (o el centro del intervalo), con
+    derivada por diferencias centrales (o paso complejo, ver
+    metodo_derivada) si df es None.
+
+    Args:
+        f (callable): Función; puede devolver arreglos de un elemento.
+        df (callable, optional): Derivada de f.
+        intervalo (tuple, optional): (a, b).
+        inicial (float o tuple, optional): Punto inicial; de una tupla se usa
+            el primer elemento.
+        metodo (str, optional): "auto", "brent", "illinois" o "newton".
+        metodo_derivada (str, optional): "diferencias" o "complejo" (solo
+            para f analítica).
+    Returns:
+        Resultado: Raíz, iteraciones, evaluaciones (incluidas las de la
+        elección) y método usado.
+    """
+    funcion = f
+    f = lambda x: _escalar(funcion(x))
+    x0 = inicial[0] if isinstance(inicial, (tuple, list, np.ndarray)) else inicial
+
+    fa = fb = None
+    previas = 0
+    hay_cambio = False
+    if intervalo is not None:
+        a, b = intervalo
+        fa, fb = f(a), f(b)
+        previas = 2
+        if registro is not None:
+            registro(a, fa)
+            registro(b, fb)
+        hay_cambio = fa * fb <= 0
+
+    if metodo == "auto":
+        if hay_cambio:
+            metodo = "newton" if df is not None else "brent"
+        else:
+            metodo = "newton"
+    if metodo in ("brent", "illinois") and intervalo is None:
+        raise ValueError(f"El método {metodo} necesita un intervalo.")
+
+    if metodo == "brent":
+        resultado = brent(f, a, b, tol, max_iter, registro, fa, fb)
+    elif metodo == "illinois":
+        resultado = illinois(f, a, b, tol, max_iter, registro, fa, fb)
+    elif metodo == "newton":
+        if x0 is None:
+            if intervalo is None:
+                raise ValueError("Newton-Raphson necesita un punto inicial o un intervalo.")
+            x0 = (a + b) / 2
+        if hay_cambio:
+            resultado = newton_seguro(f, x0, df, intervalo, tol, max_iter, registro, fa, fb, metodo_derivada)
+        else:
+            resultado = newton_seguro(f, x0, df, None, tol, max_iter, registro, metodo_derivada=metodo_derivada)
+    else:
+        raise ValueError(f"Método desconocido: {metodo}")
+    return resultado._replace(evaluaciones=previas + resultado.evaluaciones, metodo=metodo)
+
+
 def probar_metodos(f, df=None, intervalo=None, inicial=None, tol=1e-6, max_iter=100):
     """
     Prueba los métodos de resolución de ecuaciones no lineales.
@@ -79,13 +404,15 @@ def probar_metodos(f, df=None, intervalo=None, inicial=None, tol=1e-6, max_iter=
         "Bisección": lambda: biseccion(f, intervalo[0], intervalo[1], tol, max_iter),
         "Newton-Raphson": lambda: newton_raphson(f, df, inicial, tol, max_iter),
         "Falsa Posición": lambda: falsa_posicion(f, intervalo[0], intervalo[1], tol, max_iter),
-        "Secante": lambda: secante(f, inicial[0], inicial[1], tol, max_iter)
+        "Secante": lambda: secante(f, inicial[0], inicial[1], tol, max_iter),
+        "Híbrido": lambda: resolver(f, df, intervalo, inicial, tol, max_iter),
     }
     
     for nombre, metodo in metodos.items():
         try:
             resultado = metodo()
-            print(f"{nombre}: Solución encontrada -> {resultado}")
+            detalle = f", {resultado.metodo}" if resultado.metodo else ""
+            print(f"{nombre}: Solución encontrada -> {resultado.raiz} ({resultado.evaluaciones} evaluaciones{detalle})")
         except Exception as e:
             print(f"{nombre}: No se puede con este método. Razón -> {e}")
 
@@ -104,17 +431,18 @@ def df5(x): return 2 * x
 def df7(x): return np.cos(x) - x * np.sin(x) + np.sin(x)
 def df8(x): return -2 / (x**2)
 
-# Pruebas
-print("Ecuación 1: y = ln(x − 2)")
-probar_metodos(f1, intervalo=(2.1, 4), inicial=(3, 4))
+if __name__ == "__main__":
+    # Pruebas
+    print("Ecuación 1: y = ln(x − 2)")
+    probar_metodos(f1, intervalo=(2.1, 4), inicial=(3, 4))
 
-print("\nEcuación 2: y = e^−x")
-probar_metodos(f2, intervalo=(0, 2), inicial=(0.5, 1))
+    print("\nEcuación 2: y = e^−x")
+    probar_metodos(f2, intervalo=(0, 2), inicial=(0.5, 1))
 
-# print("\nEcuación 3: y = e^x − x")
-# probar_metodos(f3, df=df3, intervalo=(0, 1), inicial=(0.5, 1))
+    # print("\nEcuación 3: y = e^x − x")
+    # probar_metodos(f3, df=df3, intervalo=(0, 1), inicial=(0.5, 1))
 
-print("""
+    print("""
 Ecuación 3: y = e^x − x
 Bisección: No se puede con este método. Razón -> El teorema del valor intermedio no se cumple. f(a) y f(b) deben tener signos opuestos.
 Newton-Raphson: No se puede con este método. Razón -> The truth value of an array with more than one element is ambiguous. Use a.any() or a.all()
@@ -122,23 +450,23 @@ Falsa Posición: No se puede con este método. Razón -> El teorema del valor in
 Secante: Solución encontrada -> -0.8333048903658308
 """)
 
-print("\nEcuación 4: y = 10e^(x/2)cos(2x)")
-probar_metodos(f4, intervalo=(-2, 2), inicial=(-1, 0))
+    print("\nEcuación 4: y = 10e^(x/2)cos(2x)")
+    probar_metodos(f4, intervalo=(-2, 2), inicial=(-1, 0))
 
-print("\nEcuación 5: y = x^2 − 2")
-probar_metodos(f5, df=df5, intervalo=(0, 2), inicial=(1, 1.5))
+    print("\nEcuación 5: y = x^2 − 2")
+    probar_metodos(f5, df=df5, intervalo=(0, 2), inicial=(1, 1.5))
 
-print("\nEcuación 6: y = (x − 2)^(1/2)")
-# probar_metodos(f6, intervalo=(3, 5), inicial=(3, 4))
-print("""
+    print("\nEcuación 6: y = (x − 2)^(1/2)")
+    # probar_metodos(f6, intervalo=(3, 5), inicial=(3, 4))
+    print("""
 Bisección: No se puede con este método. Razón -> El teorema del valor intermedio no se cumple. f(a) y f(b) deben tener signos opuestos.
 Newton-Raphson: No se puede con este método. Razón -> The truth value of an array with more than one element is ambiguous. Use a.any() or a.all()
 Falsa Posición: No se puede con este método. Razón -> El teorema del valor intermedio no se cumple. f(a) y f(b) deben tener signos opuestos.
 Secante: Solución encontrada -> 2.0000833304890365
 """)
 
-print("\nEcuación 7: y = xcos(x) + xsen(x)")
-probar_metodos(f7, df=df7, intervalo=(-1, 1), inicial=(0, 1))
+    print("\nEcuación 7: y = xcos(x) + xsen(x)")
+    probar_metodos(f7, df=df7, intervalo=(-1, 1), inicial=(0, 1))
 
-print("\nEcuación 8: y = 2 / x")
-probar_metodos(f8, df=df8, intervalo=(0.5, 2), inicial=(1, 1.5))
+    print("\nEcuación 8: y = 2 / x")
+    probar_metodos(f8, df=df8, intervalo=(0.5, 2), inicial=(1, 1.5))
@@ -0,0 +1,342 @@
+import os
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from ecuaciones import biseccion, falsa_posicion, newton_raphson, secante
+
+# Códigos de estado por carril
+CONVERGIO = 0
+SIN_CONVERGER = 1  # Se alcanzó max_iter
+SIN_CAMBIO_SIGNO = 2  # f(a) y f(b) no tienen signos opuestos
+DIVISION_CERO = 3  # Derivada o diferencia de f nula
+NO_FINITO = 4  # f devolvió nan o inf
+
+ESTADOS = {
+    CONVERGIO: "convergió",
+    SIN_CONVERGER: "no convergió en max_iter iteraciones",
+    SIN_CAMBIO_SIGNO: "f(a) y f(b) deben tener signos opuestos",
+    DIVISION_CERO: "división por cero",
+    NO_FINITO: "f no es finita",
+}
+
+# Raíz, iteraciones y estado de cada carril
+ResultadoLote = namedtuple("ResultadoLote", ["raiz", "iteraciones", "estado"])
+
+
+def _evaluar(f, x, args, indices):
+    # f solo se evalúa en los carriles activos, con sus parámetros
+    return np.broadcast_to(f(x, *[p[indices] for p in args]), x.shape).astype(float)
+
+
+def _escala(x):
+    # Las tolerancias sobre x son relativas a |x| cuando |x| > 1: lejos del
+    # origen el ulp ya supera cualquier tolerancia absoluta pequeña
+    return np.maximum(1.0, np.abs(x))
+
+
+def _iniciar(valores, args):
+    # Los valores iniciales y los parámetros (escalares o uno por carril) se
+    # llevan a arreglos planos de la misma longitud
+    todos = np.broadcast_arrays(*[np.asarray(v, dtype=float) for v in (*valores, *args)])
+    n = todos[0].size
+    raiz = np.full(n, np.nan)
+    iteraciones = np.zeros(n, dtype=np.int64)
+    estado = np.full(n, SIN_CONVERGER, dtype=np.int8)
+    todos = [v.ravel().copy() for v in todos]
+    return todos[:len(valores)], todos[len(valores):], n, raiz, iteraciones, estado
+
+
+def biseccion_lote(f, a, b, args=(), tol=1e-6, max_iter=100):
+    """
+    Método de Bisección para muchos intervalos a la vez.
+
+    Todos los carriles iteran juntos con máscaras; cada carril se congela al
+    converger y f solo se evalúa en los carriles activos. Los carriles que
+    agotan max_iter devuelven el punto medio de su último intervalo.
+
+    Args:
+        f (callable): f(x, *args) vectorizada.
+        a, b (array_like): Extremos de los intervalos, uno por carril.
+        args (tuple, optional): Parámetros de f, escalares o uno por carril.
+        tol (float, optional): Tolerancia en |f(c)| y en el semiancho
+            (relativa a |c| si |c| > 1).
+        max_iter (int, optional): Máximo de iteraciones por carril.
+    Returns:
+        ResultadoLote: Raíces, iteraciones y estados (ver ESTADOS).
+    """
+    (a, b), args, n, raiz, iteraciones, estado = _iniciar((a, b), args)
+    todos = np.arange(n)
+    fa = _evaluar(f, a, args, todos)
+    fb = _evaluar(f, b, args, todos)
+    estado[fa * fb >= 0] = SIN_CAMBIO_SIGNO
+    estado[~(np.isfinite(fa) & np.isfinite(fb))] = NO_FINITO
+
+    activos = np.flatnonzero(estado == SIN_CONVERGER)
+    fa = fa[activos]
+    for _ in range(max_iter):
+        if activos.size == 0:
+            break
+        c = (a[activos] + b[activos]) / 2
+        fc = _evaluar(f, c, args, activos)
+        iteraciones[activos] += 1
+        aa, ba = a[activos], b[activos]
+        # Si c coincide con un extremo el intervalo ya no se puede partir
+        listo = (np.abs(fc) < tol) | ((ba - aa) / 2 <= tol * _escala(c)) | (c == aa) | (c == ba)
+        raiz[activos[listo]] = c[listo]
+        estado[activos[listo]] = CONVERGIO
+        estado[activos[~np.isfinite(fc) & ~listo]] = NO_FINITO
+
+        izquierda = fa * fc < 0
+        b[activos[izquierda]] = c[izquierda]
+        a[activos[~izquierda]] = c[~izquierda]
+        fa = np.where(izquierda, fa, fc)
+
+        sigue = estado[activos] == SIN_CONVERGER
+        activos = activos[sigue]
+        fa = fa[sigue]
+    raiz[activos] = (a[activos] + b[activos]) / 2
+    return ResultadoLote(raiz, iteraciones, estado)
+
+
+def newton_raphson_lote(f, df, x0, args=(), tol=1e-6, max_iter=100):
+    """
+    Método de Newton-Raphson para muchos puntos iniciales a la vez.
+
+    Un carril converge si |f(x)| < tol o si el paso de Newton es menor que
+    tol * max(1, |x|).
+
+    Args:
+        f, df (callable): f(x, *args) y su derivada, vectorizadas.
+        x0 (array_like): Puntos iniciales, uno por carril.
+        args (tuple, optional): Parámetros de f y df, escalares o uno por carril.
+    Returns:
+        ResultadoLote: Raíces, iteraciones y estados (ver ESTADOS).
+    """
+    (x,), args, n, raiz, iteraciones, estado = _iniciar((x0,), args)
+    activos = np.arange(n)
+    for _ in range(max_iter):
+        if activos.size == 0:
+            break
+        xa = x[activos]
+        fx = _evaluar(f, xa, args, activos)
+        iteraciones[activos] += 1
+        listo = np.abs(fx) < tol
+        raiz[activos[listo]] = xa[listo]
+        estado[activos[listo]] = CONVERGIO
+
+        dfx = _evaluar(df, xa, args, activos)
+        estado[activos[~listo & (dfx == 0)]] = DIVISION_CERO
+        estado[activos[~listo & ~(np.isfinite(fx) & np.isfinite(dfx))]] = NO_FINITO
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            x_nuevo = xa - fx / dfx
+        corto = (estado[activos] == SIN_CONVERGER) & (np.abs(x_nuevo - xa) <= tol * _escala(x_nuevo))
+        raiz[activos[corto]] = x_nuevo[corto]
+        estado[activos[corto]] = CONVERGIO
+
+        sigue = estado[activos] == SIN_CONVERGER
+        activos = activos[sigue]
+        x[activos] = x_nuevo[sigue]
+    return ResultadoLote(raiz, iteraciones, estado)
+
+
+def falsa_posicion_lote(f, a, b, args=(), tol=1e-6, max_iter=100):
+    """
+    Método de Falsa Posición para muchos intervalos a la vez.
+
+    Un carril converge si |f(c)| < tol, si c se movió menos que
+    tol * max(1, |c|) o si c coincide con un extremo. Los carriles que agotan
+    max_iter devuelven su último c, que sigue dentro de un intervalo con
+    cambio de signo.
+
+    Returns:
+        ResultadoLote: Raíces, iteraciones y estados (ver ESTADOS).
+    """
+    (a, b), args, n, raiz, iteraciones, estado = _iniciar((a, b), args)
+    todos = np.arange(n)
+    fa = _evaluar(f, a, args, todos)
+    fb = _evaluar(f, b, args, todos)
+    estado[fa * fb >= 0] = SIN_CAMBIO_SIGNO
+    estado[~(np.isfinite(fa) & np.isfinite(fb))] = NO_FINITO
+
+    activos = np.flatnonzero(estado == SIN_CONVERGER)
+    fa, fb = fa[activos], fb[activos]
+    c_previo = np.full(n, np.nan)
+    for _ in range(max_iter):
+        if activos.size == 0:
+            break
+        aa, ba = a[activos], b[activos]
+        c = ba - fb * (ba - aa) / (fb - fa)
+        fc = _evaluar(f, c, args, activos)
+        iteraciones[activos] += 1
+        listo = (np.abs(fc) < tol) | (np.abs(c - c_previo[activos]) <= tol * _escala(c)) | (c == aa) | (c == ba)
+        c_previo[activos] = c
+        raiz[activos[listo]] = c[listo]
+        estado[activos[listo]] = CONVERGIO
+        estado[activos[~np.isfinite(fc) & ~listo]] = NO_FINITO
+
+        izquierda = fa * fc < 0
+        b[activos[izquierda]] = c[izquierda]
+        a[activos[~izquierda]] = c[~izquierda]
+        fb = np.where(izquierda, fc, fb)
+        fa = np.where(izquierda, fa, fc)
+
+        sigue = estado[activos] == SIN_CONVERGER
+        activos = activos[sigue]
+        fa, fb = fa[sigue], fb[sigue]
+    raiz[activos] = c_previo[activos]
+    return ResultadoLote(raiz, iteraciones, estado)
+
+
+def secante_lote(f, x0, x1, args=(), tol=1e-6, max_iter=100):
+    """
+    Método de la Secante para muchos pares iniciales a la vez.
+
+    Un carril converge si |f(x)| < tol o si el último paso fue menor que
+    tol * max(1, |x|) (este criterio no se aplica al par inicial).
+
+    Returns:
+        ResultadoLote: Raíces, iteraciones y estados (ver ESTADOS).
+    """
+    (x0, x1), args, n, raiz, iteraciones, estado = _iniciar((x0, x1), args)
+    activos = np.arange(n)
+    f0 = _evaluar(f, x0, args, activos)
+    f1 = _evaluar(f, x1, args, activos)
+    primera = True
+    for _ in range(max_iter):
+        if activos.size == 0:
+            break
+        iteraciones[activos] += 1
+        xa0, xa1 = x0[activos], x1[activos]
+        listo = np.abs(f1) < tol
+        if not primera:
+            listo |= np.abs(xa1 - xa0) <= tol * _escala(xa1)
+        primera = False
+        raiz[activos[listo]] = x1[activos[listo]]
+        estado[activos[listo]] = CONVERGIO
+        estado[activos[~listo & (f1 == f0)]] = DIVISION_CERO
+        estado[activos[~listo & ~(np.isfinite(f0) & np.isfinite(f1))]] = NO_FINITO
+
+        sigue = estado[activos] == SIN_CONVERGER
+        activos = activos[sigue]
+        f0, f1 = f0[sigue], f1[sigue]
+        xa0, xa1 = x0[activos], x1[activos]
+        x_nuevo = xa1 - f1 * (xa1 - xa0) / (f1 - f0)
+        x0[activos], x1[activos] = xa1, x_nuevo
+        f0, f1 = f1, _evaluar(f, x_nuevo, args, activos)
+    return ResultadoLote(raiz, iteraciones, estado)
+
+
+def _refinar(tarea):
+    # Tarea de un proceso: refinar un grupo de intervalos por lotes
+    metodo, f, a, b, args, tol, max_iter = tarea
+    return metodo(f, a, b, args, tol, max_iter)
+
+
+def todas_las_raices(f, a, b, n=10_000, args=(), tol=1e-12, max_iter=200, metodo=None, procesos=1):
+    """
+    Todas las raíces de f en [a, b] con cambio de signo.
+
+    f se evalúa una sola vez sobre una malla de n + 1 puntos; cada par de
+    puntos vecinos con signos opuestos es un intervalo, y todos se refinan
+    juntos con un método por lotes. Los ceros exactos de la malla se toman
+    como raíces. Los intervalos que agotan max_iter conservan su mejor
+    estimación (el cambio de signo sigue encerrando una raíz); se descartan
+    los cambios de signo por polos (|f| en el punto final mayor que en los
+    extremos del intervalo).
+
+    Las raíces separadas por menos de (b - a) / n o de multiplicidad par
+    (sin cambio de signo) pueden perderse: n debe ser mayor que el número
+    de raíces esperado.
+
+    Args:
+        f (callable): f(x, *args) vectorizada (y a nivel de módulo si procesos > 1).
+        a, b (float): Extremos del intervalo de búsqueda.
+        n (int, optional): Subintervalos de la malla.
+        args (tuple, optional): Parámetros escalares de f.
+        tol (float, optional): Tolerancia del refinamiento.
+        metodo (callable, optional): biseccion_lote (por defecto) o falsa_posicion_lote.
+        procesos (int, optional): Procesos para refinar; None usa todos los núcleos.
+    Returns:
+        numpy.ndarray: Raíces ordenadas.
+    """
+    metodo = metodo or biseccion_lote
+    x = np.linspace(a, b, n + 1)
+    fx = np.broadcast_to(f(x, *args), x.shape).astype(float)
+    ceros = x[fx == 0]
+    cambio = np.flatnonzero(np.sign(fx[:-1]) * np.sign(fx[1:]) < 0)
+    izquierda, derecha = x[cambio], x[cambio + 1]
+    cota = np.maximum(np.abs(fx[cambio]), np.abs(fx[cambio + 1]))
+
+    procesos = procesos or os.cpu_count() or 1
+    if procesos > 1 and len(cambio) > procesos:
+        grupos = np.array_split(np.arange(len(cambio)), procesos)
+        tareas = [(metodo, f, izquierda[g], derecha[g], args, tol, max_iter) for g in grupos]
+        with ProcessPoolExecutor(max_workers=procesos) as pool:
+            partes = list(pool.map(_refinar, tareas))
+        raiz = np.concatenate([r.raiz for r in partes])
+        estado = np.concatenate([r.estado for r in partes])
+    else:
+        raiz, _, estado = metodo(f, izquierda, derecha, args, tol, max_iter)
+
+    valida = np.isin(estado, (CONVERGIO, SIN_CONVERGER)) & (np.abs(f(raiz, *args)) <= cota)
+    return np.sort(np.concatenate([ceros, raiz[valida]]))
+
+
+def benchmark_lote(n=100_000, n_escalar=2_000, tol=1e-10, semilla=0):
+    """
+    Compara los métodos por lotes con un bucle sobre las funciones escalares.
+
+    Resuelve x^2 - p = 0 para n valores de p en [1, 100]; el bucle escalar se
+    mide sobre n_escalar carriles y se extrapola a carriles por segundo.
+
+    Returns:
+        dict: Método -> (carriles/s escalar, carriles/s por lotes).
+    """
+    p = np.random.default_rng(semilla).uniform(1, 100, n)
+    f = lambda x, p: x**2 - p
+    df = lambda x, p: 2 * x
+    casos = {
+        "Bisección": (
+            lambda: biseccion_lote(f, 0.0, 10.0, (p,), tol),
+            lambda q: biseccion(lambda x: x**2 - q, 0.0, 10.0, tol),
+        ),
+        "Newton-Raphson": (
+            lambda: newton_raphson_lote(f, df, 10.0, (p,), tol),
+            lambda q: newton_raphson(lambda x: x**2 - q, lambda x: 2 * x, 10.0, tol),
+        ),
+        "Falsa Posición": (
+            lambda: falsa_posicion_lote(f, 0.0, 10.0, (p,), tol),
+            lambda q: falsa_posicion(lambda x: x**2 - q, 0.0, 10.0, tol),
+        ),
+        "Secante": (
+            lambda: secante_lote(f, 9.0, 10.0, (p,), tol),
+            lambda q: secante(lambda x: x**2 - q, 9.0, 10.0, tol),
+        ),
+    }
+    resultados = {}
+    for nombre, (lote, escalar) in casos.items():
+        inicio = time.perf_counter()
+        for q in p[:n_escalar]:
+            try:
+                escalar(float(q))
+            except ValueError:
+                pass
+        velocidad_escalar = n_escalar / (time.perf_counter() - inicio)
+
+        inicio = time.perf_counter()
+        resultado = lote()
+        velocidad_lote = n / (time.perf_counter() - inicio)
+        error = np.nanmax(np.abs(resultado.raiz - np.sqrt(p)))
+        convergidos = np.mean(resultado.estado == CONVERGIO)
+        print(f"{nombre}: escalar {velocidad_escalar:,.0f} carriles/s, lotes {velocidad_lote:,.0f} carriles/s "
+              f"(x{velocidad_lote / velocidad_escalar:.0f}), {convergidos:.1%} convergidos, error máx {error:.1e}")
+        resultados[nombre] = (velocidad_escalar, velocidad_lote)
+    return resultados
+
+
+if __name__ == "__main__":
+    benchmark_lote()
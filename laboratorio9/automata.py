@@ -1,55 +1,208 @@
+import time
+
 import numpy as np
 import matplotlib.pyplot as plt
 
+# Regla de Wolfram de la tabla original (000->0, 001->1, ..., 111->0)
+REGLA = 30
+
+_UNO = np.uint64(1)
+_SESENTA_Y_TRES = np.uint64(63)
+_TODOS = np.uint64(0xFFFFFFFFFFFFFFFF)
+
+
+def tabla_regla(regla=REGLA):
+    """
+    Tabla de búsqueda de una regla de Wolfram (0-255).
+
+    El bit k de la regla es el nuevo estado de la vecindad con índice
+    k = 4 * izquierda + 2 * centro + derecha.
+
+    Returns:
+        numpy.ndarray: 8 estados (uint8).
+    """
+    if not 0 <= regla <= 255:
+        raise ValueError("La regla debe estar entre 0 y 255.")
+    return ((regla >> np.arange(8)) & 1).astype(np.uint8)
+
+
 # Definir la regla de transición
-def regla_transicion(izquierda, centro, derecha):
-    if (izquierda == 0 and centro == 0 and derecha == 0):
-        return 0
-    elif (izquierda == 0 and centro == 0 and derecha == 1):
-        return 1
-    elif (izquierda == 0 and centro == 1 and derecha == 0):
-        return 1
-    elif (izquierda == 0 and centro == 1 and derecha == 1):
-        return 1
-    elif (izquierda == 1 and centro == 0 and derecha == 0):
-        return 1
-    elif (izquierda == 1 and centro == 0 and derecha == 1):
-        return 0
-    elif (izquierda == 1 and centro == 1 and derecha == 0):
-        return 0
-    elif (izquierda == 1 and centro == 1 and derecha == 1):
-        return 0
+def regla_transicion(izquierda, centro, derecha, regla=REGLA):
+    """
+    Nuevo estado de una celda (o de arreglos de celdas) según la regla.
+    """
+    indice = 4 * np.asarray(izquierda) + 2 * np.asarray(centro) + np.asarray(derecha)
+    return tabla_regla(regla)[indice]
+
+
+def paso_automata(fila, tabla, frontera="fija"):
+    """
+    Una generación completa con un solo índice de vecindad y una búsqueda.
+
+    Args:
+        fila (numpy.ndarray): Estados actuales (0/1).
+        tabla (numpy.ndarray): Resultado de tabla_regla.
+        frontera (str, optional): "fija" (las celdas de los extremos no se
+            actualizan y quedan en 0) o "periodica".
+    """
+    if frontera == "periodica":
+        indice = (np.roll(fila, 1) << 2) | (fila << 1) | np.roll(fila, -1)
+        return tabla[indice]
+    nueva = np.zeros_like(fila)
+    nueva[1:-1] = tabla[(fila[:-2] << 2) | (fila[1:-1] << 1) | fila[2:]]
+    return nueva
+
 
 # Función para evolucionar el autómata celular
-def evolucion_autómata(celdas_iniciales, pasos):
+def evolucion_autómata(celdas_iniciales, pasos, regla=REGLA, frontera="fija"):
+    """
+    Historia completa (pasos x celdas) del autómata.
+    """
     # Crear una matriz para guardar los estados de cada paso
-    historia = np.zeros((pasos, len(celdas_iniciales)), dtype=int)
+    historia = np.zeros((pasos, len(celdas_iniciales)), dtype=np.uint8)
     historia[0] = celdas_iniciales
-    
+    tabla = tabla_regla(regla)
+
     # Evolucionar en el tiempo
     for t in range(1, pasos):
-        for i in range(1, len(celdas_iniciales) - 1):
-            izquierda = historia[t-1, i-1]
-            centro = historia[t-1, i]
-            derecha = historia[t-1, i+1]
-            historia[t, i] = regla_transicion(izquierda, centro, derecha)
-    
+        historia[t] = paso_automata(historia[t - 1], tabla, frontera)
+
     return historia
 
-# Configuración inicial
-tamano = 101  # Tamaño de la fila de celdas
-pasos = 50    # Número de generaciones a simular
-celdas_iniciales = np.zeros(tamano, dtype=int)
-celdas_iniciales[tamano // 2] = 1  # Inicializar la celda central activa
 
-# Evolucionar el autómata
-historia = evolucion_autómata(celdas_iniciales, pasos)
+def empaquetar(celdas):
+    """
+    Guarda 64 celdas por palabra uint64: la celda i es el bit i % 64 de la
+    palabra i // 64.
+    """
+    celdas = np.asarray(celdas, dtype=np.uint8)
+    relleno = -len(celdas) % 64
+    bytes_ = np.packbits(np.concatenate([celdas, np.zeros(relleno, dtype=np.uint8)]), bitorder="little")
+    return bytes_.view("<u8").astype(np.uint64)
+
+
+def desempaquetar(palabras, n):
+    """
+    Inversa de empaquetar: arreglo de n celdas (uint8).
+    """
+    bytes_ = np.ascontiguousarray(palabras, dtype="<u8").view(np.uint8)
+    return np.unpackbits(bytes_, bitorder="little")[:n]
+
+
+def _minterminos(regla):
+    # Vecindades (izquierda, centro, derecha) que dan 1, o las que dan 0 si
+    # son menos (y entonces el resultado se invierte)
+    unos = [k for k in range(8) if (regla >> k) & 1]
+    ceros = [k for k in range(8) if not (regla >> k) & 1]
+    invertir = len(unos) > len(ceros)
+    elegidos = ceros if invertir else unos
+    return [((k >> 2) & 1, (k >> 1) & 1, k & 1) for k in elegidos], invertir
+
+
+def paso_empaquetado(palabras, n, regla=REGLA, frontera="fija"):
+    """
+    Una generación sobre celdas empaquetadas con desplazamientos de bits.
+
+    Los vecinos izquierdo y derecho de las 64 celdas de cada palabra se
+    obtienen desplazando la palabra un bit y trayendo el bit de la palabra
+    vecina; la regla se evalúa como una suma de minitérminos con & | ~.
+    """
+    ultimo = np.uint64((n - 1) % 64)
+    # Vecinos fuera de la fila: 0 (fija) o la celda del otro extremo (periódica)
+    if frontera == "periodica":
+        entra_izquierda = (palabras[-1] >> ultimo) & _UNO
+        entra_derecha = palabras[0] & _UNO
+    else:
+        entra_izquierda = entra_derecha = np.uint64(0)
+
+    izquierda = palabras << _UNO
+    izquierda[1:] |= palabras[:-1] >> _SESENTA_Y_TRES
+    izquierda[0] |= entra_izquierda
+    derecha = palabras >> _UNO
+    derecha[:-1] |= palabras[1:] << _SESENTA_Y_TRES
+    derecha[-1] |= entra_derecha << ultimo
+
+    minterminos, invertir = _minterminos(regla)
+    nueva = np.zeros_like(palabras)
+    for l, c, r in minterminos:
+        nueva |= (izquierda if l else ~izquierda) & (palabras if c else ~palabras) & (derecha if r else ~derecha)
+    if invertir:
+        nueva = ~nueva
+
+    # Los bits de relleno de la última palabra quedan en 0
+    nueva[-1] &= _TODOS >> np.uint64(64 * len(palabras) - n)
+    if frontera != "periodica":
+        nueva[0] &= ~_UNO
+        nueva[-1] &= ~(_UNO << ultimo)
+    return nueva
+
+
+def evolucion_stream(celdas_iniciales, pasos, regla=REGLA, frontera="fija", cada=1, empaquetado=False):
+    """
+    Evoluciona el autómata sin guardar la historia.
+
+    Solo se mantiene la fila actual, así que filas de 10^6 celdas se pueden
+    llevar por 10^5 generaciones; con empaquetado=True cada generación
+    opera sobre palabras de 64 celdas.
+
+    Yields:
+        tuple: Generación t y fila (uint8) cada `cada` generaciones, más la última.
+    """
+    n = len(celdas_iniciales)
+    if empaquetado:
+        fila = empaquetar(celdas_iniciales)
+        avanzar = lambda f: paso_empaquetado(f, n, regla, frontera)
+        leer = lambda f: desempaquetar(f, n)
+    else:
+        fila = np.asarray(celdas_iniciales, dtype=np.uint8)
+        tabla = tabla_regla(regla)
+        avanzar = lambda f: paso_automata(f, tabla, frontera)
+        leer = lambda f: f
+
+    yield 0, leer(fila)
+    for t in range(1, pasos):
+        fila = avanzar(fila)
+        if t % cada == 0 or t == pasos - 1:
+            yield t, leer(fila)
+
+
+def benchmark_automata(tamano=10**6, pasos=200, regla=REGLA, semilla=0):
+    """
+    Compara la tabla de búsqueda con el modo empaquetado (y comprueba que
+    ambos dan la misma fila final).
+
+    Returns:
+        dict: Modo -> celdas actualizadas por segundo.
+    """
+    celdas = np.random.default_rng(semilla).integers(0, 2, tamano, dtype=np.uint8)
+    resultados = {}
+    finales = {}
+    for nombre, empaquetado in (("tabla", False), ("empaquetado", True)):
+        inicio = time.perf_counter()
+        for _, fila in evolucion_stream(celdas, pasos, regla, cada=pasos, empaquetado=empaquetado):
+            finales[nombre] = fila
+        tiempo = time.perf_counter() - inicio
+        resultados[nombre] = tamano * pasos / tiempo
+        print(f"{nombre}: {resultados[nombre]:,.0f} celdas/s ({tiempo:.2f} s)")
+    print("Filas finales iguales:", np.array_equal(finales["tabla"], finales["empaquetado"]))
+    return resultados
+
+
+if __name__ == "__main__":
+    # Configuración inicial
+    tamano = 101  # Tamaño de la fila de celdas
+    pasos = 50    # Número de generaciones a simular
+    celdas_iniciales = np.zeros(tamano, dtype=int)
+    celdas_iniciales[tamano // 2] = 1  # Inicializar la celda central activa
+
+    # Evolucionar el autómata
+    historia = evolucion_autómata(celdas_iniciales, pasos)
 
-# Graficar el autómata celular
-plt.imshow(historia, cmap='binary', interpolation='nearest')
-plt.title("Autómata Celular - Regla de Selección")
-plt.xlabel("Posición de la Celda")
-plt.ylabel("Generación")
+    # Graficar el autómata celular
+    plt.imshow(historia, cmap='binary', interpolation='nearest')
+    plt.title("Autómata Celular - Regla de Selección")
+    plt.xlabel("Posición de la Celda")
+    plt.ylabel("Generación")
 
-# save the plot
-plt.savefig("automata_celular.png")
\ No newline at end of file
+    # save the plot
+    plt.savefig("automata_celular.png")